@@ -1,6 +1,24 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        import accounts.signals  # noqa
+        from accounts.rbac import cache_is_shared
+
+        # Claims are trusted while their version matches the one in the
+        # cache; a per-process cache would keep an old version current
+        # in every worker but the one that bumped it.
+        if getattr(settings, "ACCOUNTS_STATELESS_JWT", False) and (
+            not cache_is_shared()
+        ):
+            raise ImproperlyConfigured(
+                "ACCOUNTS_STATELESS_JWT requires a cache shared by all "
+                "workers; set CACHE_BACKEND to Redis, Memcached or the "
+                "database cache."
+            )
@@ -0,0 +1,175 @@
+"""
+Async login and register views.
+
+The DRF views hash passwords inline, so under a login burst every sync
+worker sits in PBKDF2 and the meeting endpoints queue behind it.
+These views do the same work with the hashing on the bounded pool in
+``accounts.hashing`` and the database calls through ``sync_to_async``,
+so an ASGI worker keeps serving other requests meanwhile.  Attempts
+over the ``accounts.throttling`` limits are turned away before any
+hashing.
+
+They replace the DRF views in ``urls.py`` when ``ACCOUNTS_ASYNC_AUTH``
+is on; request and response bodies are the same.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import (
+    check_password,
+    identify_hasher,
+    make_password,
+)
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import status
+
+from .hashing import HashingBusy, run_hashing
+from .serializers import (
+    CustomTokenObtainPairSerializer,
+    RegisterSerializer,
+    UserSerializer,
+)
+from .throttling import check_login, check_register, client_ident
+
+User = get_user_model()
+
+
+def verify_password(raw_password, encoded):
+    """``(matches, needs_rehash)``; runs on the hashing pool."""
+    if not check_password(raw_password, encoded):
+        return False, False
+    return True, identify_hasher(encoded).must_update(encoded)
+
+
+class AsyncAuthView(View):
+    """Base for the async auth views: JSON bodies, DRF-style errors."""
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Set directly because Django 4.2's csrf_exempt() wraps async
+        # views in a sync function.
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except HashingBusy:
+            response = self.error(
+                "Too many sign-ins in progress. Try again shortly.",
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+            response["Retry-After"] = "1"
+            return response
+
+    def error(self, detail, status_code):
+        return JsonResponse({"detail": detail}, status=status_code)
+
+    def throttled(self, wait):
+        response = self.error(
+            "Request was throttled. "
+            f"Expected available in {wait} seconds.",
+            status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+        response["Retry-After"] = str(wait)
+        return response
+
+    def json_body(self, request):
+        try:
+            body = json.loads(request.body or b"{}")
+        except ValueError as exc:
+            return None, self.error(
+                f"JSON parse error - {exc}", status.HTTP_400_BAD_REQUEST
+            )
+        if not isinstance(body, dict):
+            return None, self.error(
+                "Expected a JSON object.", status.HTTP_400_BAD_REQUEST
+            )
+        return body, None
+
+
+class AsyncLoginView(AsyncAuthView):
+    """POST /api/auth/login/ -- Obtain JWT access + refresh tokens."""
+
+    async def post(self, request):
+        body, error = self.json_body(request)
+        if error:
+            return error
+        missing = {
+            field: ["This field is required."]
+            for field in (User.USERNAME_FIELD, "password")
+            if not isinstance(body.get(field), str) or not body[field]
+        }
+        if missing:
+            return JsonResponse(missing, status=status.HTTP_400_BAD_REQUEST)
+        email, password = body[User.USERNAME_FIELD], body["password"]
+
+        wait = await sync_to_async(check_login)(
+            client_ident(request), email
+        )
+        if wait is not None:
+            return self.throttled(wait)
+
+        user = await User.objects.filter(
+            **{User.USERNAME_FIELD: email}
+        ).afirst()
+        if user is None:
+            # Hash anyway, so a missing account takes as long as a
+            # wrong password (as ModelBackend does).
+            await run_hashing(make_password, password)
+            matches = needs_rehash = False
+        else:
+            matches, needs_rehash = await run_hashing(
+                verify_password, password, user.password
+            )
+        if not matches or not user.is_active:
+            return self.error(
+                "No active account found with the given credentials",
+                status.HTTP_401_UNAUTHORIZED,
+            )
+        if needs_rehash:
+            user.password = await run_hashing(make_password, password)
+            await User.objects.filter(pk=user.pk).aupdate(
+                password=user.password
+            )
+        return JsonResponse(await sync_to_async(self.issue_tokens)(user))
+
+    @staticmethod
+    def issue_tokens(user):
+        refresh = CustomTokenObtainPairSerializer.get_token(user)
+        return {
+            "refresh": str(refresh),
+            "access": str(refresh.access_token),
+            "user": UserSerializer(user).data,
+        }
+
+
+class AsyncRegisterView(AsyncAuthView):
+    """POST /api/auth/register/ -- Create a new user account."""
+
+    async def post(self, request):
+        wait = await sync_to_async(check_register)(client_ident(request))
+        if wait is not None:
+            return self.throttled(wait)
+        body, error = self.json_body(request)
+        if error:
+            return error
+
+        serializer = RegisterSerializer(data=body)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(
+                serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+        password_hash = await run_hashing(
+            make_password, serializer.validated_data["password"]
+        )
+        user = await sync_to_async(serializer.save)(
+            password=None, password_hash=password_hash
+        )
+        return JsonResponse(
+            UserSerializer(user).data, status=status.HTTP_201_CREATED
+        )
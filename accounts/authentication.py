@@ -0,0 +1,117 @@
+"""
+JWT authentication that resolves the user from token claims.
+
+simplejwt's ``JWTAuthentication`` loads the user row on every request.
+Tokens issued by ``CustomTokenObtainPairSerializer`` also carry the
+user's email, username, staff/superuser flags and their version from
+``accounts.rbac``.  That version is bumped whenever the user is saved
+or their roles or permissions change, so while the claim still matches
+the claims are current and the user is rebuilt from them without a
+query.  Every other field is deferred: it is loaded on first access,
+and ``save()`` only writes the fields that were loaded.
+
+A token whose version is stale (issued before a change) falls back to
+a user loaded from the database and cached for a short while under the
+current version.
+
+Enable it by listing ``ClaimsJWTAuthentication`` in
+``DEFAULT_AUTHENTICATION_CLASSES`` (``ACCOUNTS_STATELESS_JWT`` does
+this in settings).  Versions live in the default cache, so it must be
+shared by every worker; ``AccountsConfig.ready`` refuses to start with
+``ACCOUNTS_STATELESS_JWT`` on and a per-process cache.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from .rbac import KEY_PREFIX, permissions_version
+
+User = get_user_model()
+
+CLAIM_FIELDS = ("email", "username", "is_staff", "is_superuser")
+VERSION_CLAIM = "ver"
+
+
+def add_user_claims(token, user):
+    """Stamp the user's claims and current version onto ``token``."""
+    for field in CLAIM_FIELDS:
+        token[field] = getattr(user, field)
+    token[VERSION_CLAIM] = permissions_version(user.pk)
+    return token
+
+
+def user_from_claims(user_id, token):
+    """
+    A ``User`` built from the token's claims, with the remaining
+    fields deferred.
+    """
+    values = {
+        # simplejwt stores the id claim as a string.
+        "id": User._meta.pk.to_python(user_id),
+        "is_active": True,
+        **{field: token[field] for field in CLAIM_FIELDS},
+    }
+    fields = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in values
+    ]
+    return User.from_db(
+        router.db_for_read(User),
+        fields,
+        [values[field] for field in fields],
+    )
+
+
+def get_cached_user(user_id, version):
+    """The user row, cached briefly under the current version."""
+    key = f"{KEY_PREFIX}:user:{user_id}:{version}"
+    user = cache.get(key)
+    if user is None:
+        user = User.objects.filter(pk=user_id).first()
+        if user is None:
+            return None
+        cache.set(
+            key,
+            user,
+            timeout=getattr(settings, "ACCOUNTS_USER_CACHE_TIMEOUT", 60),
+        )
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` that trusts current claims."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                "Token contained no recognizable user identification"
+            ) from e
+
+        version = permissions_version(user_id)
+        if validated_token.get(VERSION_CLAIM) == version and all(
+            field in validated_token for field in CLAIM_FIELDS
+        ):
+            # Deactivating a user saves them, which bumps the version.
+            return user_from_claims(user_id, validated_token)
+
+        user = get_cached_user(user_id, version)
+        if user is None:
+            raise AuthenticationFailed(
+                "User not found", code="user_not_found"
+            )
+        if not user.is_active:
+            raise AuthenticationFailed(
+                "User is inactive", code="user_inactive"
+            )
+        return user
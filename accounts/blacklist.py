@@ -0,0 +1,231 @@
+"""
+Bloom filter in front of simplejwt's token blacklist.
+
+Every token refresh checks the blacklist, and with rotation every
+refresh also blacklists the old token, so the table only grows.  Each
+process keeps a Bloom filter of the blacklisted ``jti`` values; a token
+the filter has never seen is certainly not blacklisted and is let
+through without a query.  Only filter hits (blacklisted tokens and the
+occasional false positive) are confirmed against the database.
+
+The filter is kept current in two ways:
+
+- a generation number in the shared cache is bumped whenever a token
+  is blacklisted (receiver in ``accounts.signals``).  A process that
+  sees a new generation loads the rows added since its last load
+  before answering;
+- the whole filter is rebuilt every
+  ``ACCOUNTS_BLACKLIST_FILTER_REBUILD`` seconds from the tokens that
+  have not expired yet, which drops pruned entries and resizes it.
+
+Counters of how often the filter answered on its own are flushed to
+the shared cache on each rebuild; ``prune_tokens`` reports them.
+
+The generation only reaches other processes through a cache they all
+share.  With a per-process cache (``LocMemCache``, ``DummyCache``) a
+token blacklisted by one worker would stay in the others' blind spot
+until their next rebuild, so the filter is bypassed and every check
+queries the table.
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .rbac import cache_is_shared
+
+KEY_PREFIX = "accounts:blacklist"
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+STATS = ("checks", "filtered", "lookups", "blacklisted", "false_positives")
+
+# A filter is sized for at least this many tokens, and for twice the
+# count at build time so the catch-up loads have room.
+MIN_CAPACITY = 1024
+
+# Concurrent transactions can commit rows out of id order; catch-up
+# loads re-read this many ids below the last one seen.
+ID_SLACK = 1000
+
+
+def rebuild_interval():
+    return getattr(settings, "ACCOUNTS_BLACKLIST_FILTER_REBUILD", 300)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = max(capacity, 1)
+        self.size = max(
+            8,
+            math.ceil(
+                -self.capacity * math.log(error_rate) / math.log(2) ** 2
+            ),
+        )
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(value)
+        )
+
+
+def _get_generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Seeded from the clock so an evicted key never comes back
+        # with a value a filter was built under.
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def bump_generation():
+    """Tell every process to load newly blacklisted tokens."""
+
+    def bump():
+        try:
+            cache.incr(GENERATION_KEY)
+        except ValueError:
+            # Evicted: the next check reseeds it, which also differs.
+            pass
+
+    transaction.on_commit(bump)
+
+
+class BlacklistFilter:
+    """The per-process filter and its hit counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._built_at = 0.0
+        self._generation = None
+        self._watermark = 0
+        self.stats = dict.fromkeys(STATS, 0)
+
+    def _stale(self):
+        return (
+            self._bloom is None
+            or time.monotonic() - self._built_at > rebuild_interval()
+            or self._bloom.count > self._bloom.capacity
+        )
+
+    def _rebuild(self, generation):
+        watermark = (
+            BlacklistedToken.objects.aggregate(last=Max("pk"))["last"] or 0
+        )
+        jtis = list(
+            BlacklistedToken.objects.filter(
+                pk__lte=watermark, token__expires_at__gt=timezone.now()
+            ).values_list("token__jti", flat=True)
+        )
+        bloom = BloomFilter(
+            max(2 * len(jtis), MIN_CAPACITY),
+            getattr(settings, "ACCOUNTS_BLACKLIST_FILTER_ERROR_RATE", 0.01),
+        )
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._watermark = watermark
+        self._generation = generation
+        self._built_at = time.monotonic()
+        self.flush_stats()
+        # Rows added while loading are picked up by the catch-up.
+        self._catch_up(generation)
+
+    def _catch_up(self, generation):
+        rows = BlacklistedToken.objects.filter(
+            pk__gt=self._watermark - ID_SLACK
+        ).values_list("pk", "token__jti")
+        for pk, jti in rows:
+            if jti not in self._bloom:
+                self._bloom.add(jti)
+            self._watermark = max(self._watermark, pk)
+        self._generation = generation
+
+    def refresh(self):
+        """Rebuild or catch up if another process blacklisted tokens."""
+        generation = _get_generation()
+        if not self._stale() and generation == self._generation:
+            return
+        with self._lock:
+            if self._stale():
+                self._rebuild(generation)
+            elif generation != self._generation:
+                self._catch_up(generation)
+
+    def is_blacklisted(self, jti):
+        self.refresh()
+        self.stats["checks"] += 1
+        if jti not in self._bloom:
+            self.stats["filtered"] += 1
+            return False
+        self.stats["lookups"] += 1
+        found = BlacklistedToken.objects.filter(token__jti=jti).exists()
+        self.stats["blacklisted" if found else "false_positives"] += 1
+        return found
+
+    def flush_stats(self):
+        """Add this process's counters to the shared totals."""
+        counts, self.stats = self.stats, dict.fromkeys(STATS, 0)
+        for name, value in counts.items():
+            if not value:
+                continue
+            key = f"{KEY_PREFIX}:stats:{name}"
+            cache.add(key, 0, timeout=None)
+            try:
+                cache.incr(key, value)
+            except ValueError:
+                cache.set(key, value, timeout=None)
+
+
+blacklist_filter = BlacklistFilter()
+
+
+def is_blacklisted(jti):
+    """Whether the token with this ``jti`` is blacklisted."""
+    if not rebuild_interval() or not cache_is_shared():
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+    return blacklist_filter.is_blacklisted(jti)
+
+
+def filter_stats():
+    """
+    Filter counters summed over all processes (as of their last
+    rebuild), with the share of checks answered without a query and
+    the false-positive rate.
+    """
+    values = cache.get_many([f"{KEY_PREFIX}:stats:{name}" for name in STATS])
+    stats = {
+        name: values.get(f"{KEY_PREFIX}:stats:{name}", 0) for name in STATS
+    }
+    checks = stats["checks"]
+    negatives = checks - stats["blacklisted"]
+    stats["hit_rate"] = stats["filtered"] / checks if checks else None
+    stats["false_positive_rate"] = (
+        stats["false_positives"] / negatives if negatives else None
+    )
+    return stats
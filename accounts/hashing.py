@@ -0,0 +1,61 @@
+"""
+Password hashing off the request thread for the async auth views.
+
+PBKDF2 costs tens of milliseconds of CPU per call by design.  The async
+login and register views run it on a dedicated pool of
+``ACCOUNTS_HASH_THREADS`` threads; hashlib releases the GIL while it
+hashes, so the threads use separate cores and the event loop keeps
+serving other requests meanwhile.
+
+At most ``ACCOUNTS_HASH_MAX_PENDING`` hashes may be running or queued
+at once.  Beyond that ``run_hashing`` raises ``HashingBusy`` and the
+views answer ``503`` straight away rather than queueing a burst the
+pool cannot clear.
+
+Functions run here must not touch the database.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+_pool = None
+_slots = None
+_lock = threading.Lock()
+
+
+class HashingBusy(Exception):
+    """The hashing pool's queue is full."""
+
+
+def _get_pool():
+    global _pool, _slots
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                threads = getattr(settings, "ACCOUNTS_HASH_THREADS", 0)
+                threads = threads or os.cpu_count() or 1
+                _slots = threading.BoundedSemaphore(
+                    getattr(settings, "ACCOUNTS_HASH_MAX_PENDING", 64)
+                )
+                _pool = ThreadPoolExecutor(
+                    max_workers=threads,
+                    thread_name_prefix="accounts-hash",
+                )
+    return _pool, _slots
+
+
+async def run_hashing(func, *args):
+    """Await ``func(*args)`` on the hashing pool."""
+    pool, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        raise HashingBusy
+    try:
+        return await sync_to_async(
+            func, thread_sensitive=False, executor=pool
+        )(*args)
+    finally:
+        slots.release()
@@ -0,0 +1,326 @@
+"""
+Bulk user import from CSV or JSON files.
+
+Registering users one by one validates and hashes each password, which
+takes minutes for a whole company.  The importer streams the file
+instead and inserts it in chunks, each its own transaction:
+
+- passwords are never hashed here.  A row carries an already hashed
+  ``password_hash`` (in any format ``PASSWORD_HASHERS`` understands),
+  or the account gets an unusable password and the user sets one
+  through a password reset;
+- emails are normalised like ``UserManager.create_user`` does.  Rows
+  whose email already exists, compared case-insensitively, are skipped;
+- ``roles`` are looked up by name once for the whole file.  Users go in
+  with one ``bulk_create`` per chunk and their roles with one more on
+  the through table.
+
+Accepted formats, one user per record with the fields ``email``
+(required), ``username``, ``password_hash``, ``roles`` and
+``is_active``:
+
+- ``csv``: a header row; roles separated by ``;``;
+- ``json``: an array of objects, parsed incrementally;
+- ``jsonl``: one object per line.
+
+Bulk inserts send no signals; new users have no cached permissions or
+tokens to invalidate.
+"""
+
+import csv
+import json
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import (
+    UNUSABLE_PASSWORD_PREFIX,
+    identify_hasher,
+    make_password,
+)
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from .models import Role
+
+User = get_user_model()
+
+FORMATS = ("csv", "json", "jsonl")
+TRUE = {"1", "true", "yes", "y", "t"}
+FALSE = {"0", "false", "no", "n", "f"}
+
+# Keeps the reported errors bounded for a badly broken file.
+MAX_ERRORS = 1000
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+class ImportFormatError(ValueError):
+    """The file is not valid CSV/JSON of the expected shape."""
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, row, message):
+        self.failed += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row, "error": message})
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+def guess_format(filename):
+    """The format for ``filename``'s extension, or None."""
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "ndjson":
+        return "jsonl"
+    return extension if extension in FORMATS else None
+
+
+def iter_json_array(fp, chunk_size=1 << 16):
+    """Yield the items of a JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    buffer, pos = "", 0
+    state = "start"
+
+    def fill():
+        nonlocal buffer, pos
+        chunk = fp.read(chunk_size)
+        buffer, pos = buffer[pos:] + chunk, 0
+        return bool(chunk)
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if fill():
+                continue
+            raise ImportFormatError("Unexpected end of JSON input.")
+        char = buffer[pos]
+        if state == "start":
+            if char != "[":
+                raise ImportFormatError("Expected a JSON array of users.")
+            pos += 1
+            state = "first"
+        elif char == "]" and state in ("first", "next"):
+            return
+        elif state == "next":
+            if char != ",":
+                raise ImportFormatError(
+                    f"Expected ',' or ']', got {char!r}."
+                )
+            pos += 1
+            state = "value"
+        else:
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                # Most likely an item cut off at the end of the buffer.
+                if fill():
+                    continue
+                raise ImportFormatError(f"Invalid JSON: {exc}") from exc
+            yield item
+            state = "next"
+
+
+def read_records(fp, fmt):
+    """Yield ``(row number, record dict)`` from a text file."""
+    if fmt == "csv":
+        reader = csv.DictReader(fp)
+        if "email" not in (reader.fieldnames or ()):
+            raise ImportFormatError("The CSV header has no email column.")
+        for number, record in enumerate(reader, start=1):
+            record["roles"] = [
+                name.strip()
+                for name in (record.get("roles") or "").split(";")
+                if name.strip()
+            ]
+            yield number, record
+    elif fmt == "jsonl":
+        for number, line in enumerate(fp, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except ValueError as exc:
+                raise ImportFormatError(
+                    f"Invalid JSON on line {number}: {exc}"
+                ) from exc
+    elif fmt == "json":
+        yield from enumerate(iter_json_array(fp), start=1)
+    else:
+        raise ImportFormatError(f"Unknown format {fmt!r}.")
+
+
+# ---------------------------------------------------------------------------
+# Row cleaning
+# ---------------------------------------------------------------------------
+
+def _as_bool(value, default=True):
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE:
+        return True
+    if text in FALSE:
+        return False
+    raise ValueError(f"is_active must be true or false, not {value!r}.")
+
+
+def clean_record(record, role_ids):
+    """
+    ``(User, role ids)`` for one record.  Raises ``ValueError`` with a
+    message for the import report when the record is unusable.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Expected an object.")
+    email = User.objects.normalize_email(
+        str(record.get("email") or "").strip()
+    )
+    try:
+        validate_email(email)
+    except ValidationError:
+        raise ValueError(f"Invalid email {email!r}.")
+    if len(email) > User._meta.get_field("email").max_length:
+        raise ValueError("email is too long.")
+
+    username = str(record.get("username") or "").strip() or None
+    if username is not None and len(username) > 150:
+        raise ValueError("username is longer than 150 characters.")
+
+    password = str(record.get("password_hash") or "").strip()
+    if not password:
+        password = make_password(None)
+    elif not password.startswith(UNUSABLE_PASSWORD_PREFIX):
+        try:
+            identify_hasher(password)
+        except ValueError:
+            raise ValueError("password_hash is not a known hash format.")
+
+    roles = record.get("roles") or []
+    if isinstance(roles, str):
+        roles = [roles]
+    if not isinstance(roles, list) or not all(
+        isinstance(name, str) for name in roles
+    ):
+        raise ValueError("roles must be a list of role names.")
+    unknown = [name for name in roles if name not in role_ids]
+    if unknown:
+        raise ValueError(f"Unknown roles: {', '.join(unknown)}.")
+
+    user = User(
+        email=email,
+        username=username,
+        password=password,
+        is_active=_as_bool(record.get("is_active")),
+    )
+    return user, {role_ids[name] for name in roles}
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+def import_users(records, chunk_size=5000, dry_run=False):
+    """
+    Import ``(row number, record)`` pairs from ``read_records``.
+
+    With ``dry_run`` every row is checked, including against existing
+    users, but nothing is written; ``created`` counts the users that
+    would have been.
+    """
+    result = ImportResult()
+    role_ids = dict(Role.objects.values_list("name", "pk"))
+    seen_emails, seen_usernames = set(), set()
+    records = iter(records)
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        users, user_roles, rows = [], [], []
+        for number, record in chunk:
+            try:
+                user, roles = clean_record(record, role_ids)
+            except ValueError as exc:
+                result.add_error(number, str(exc))
+                continue
+            key = user.email.lower()
+            if key in seen_emails:
+                result.skipped += 1
+                continue
+            if user.username is not None:
+                if user.username in seen_usernames:
+                    result.add_error(
+                        number, f"Duplicate username {user.username!r}."
+                    )
+                    continue
+                seen_usernames.add(user.username)
+            seen_emails.add(key)
+            users.append(user)
+            user_roles.append(roles)
+            rows.append(number)
+        _insert_chunk(users, user_roles, rows, result, dry_run)
+
+    return result
+
+
+def _insert_chunk(users, user_roles, rows, result, dry_run):
+    existing_emails = set(
+        User.objects.annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=[user.email.lower() for user in users])
+        .values_list("email_lower", flat=True)
+    )
+    existing_usernames = set(
+        User.objects.filter(
+            username__in=[user.username for user in users if user.username]
+        ).values_list("username", flat=True)
+    )
+
+    new_users, new_roles, new_rows = [], [], []
+    for user, roles, number in zip(users, user_roles, rows):
+        if user.email.lower() in existing_emails:
+            result.skipped += 1
+        elif user.username in existing_usernames:
+            result.add_error(
+                number, f"Username {user.username!r} is already taken."
+            )
+        else:
+            new_users.append(user)
+            new_roles.append(roles)
+            new_rows.append(number)
+    if dry_run:
+        result.created += len(new_users)
+        return
+    if not new_users:
+        return
+
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create(new_users)
+            Through = User.roles.through
+            Through.objects.bulk_create(
+                [
+                    Through(user_id=user.pk, role_id=role_id)
+                    for user, roles in zip(new_users, new_roles)
+                    for role_id in roles
+                ]
+            )
+    except IntegrityError as exc:
+        # Someone created one of these users meanwhile; the chunk's
+        # rows are reported and the rest of the file still imports.
+        for number in new_rows:
+            result.add_error(number, f"Chunk not imported: {exc}")
+        return
+    result.created += len(new_users)
@@ -0,0 +1,175 @@
+"""
+Measure logins/second of a running server under concurrent load.
+
+    python manage.py bench_login --url http://localhost:8001 \
+        --accounts 200 --concurrency 50 --seconds 20 \
+        [--probe-path /api/meetings/ --token <access token>]
+
+Creates ``--accounts`` throwaway users (in the database this command's
+settings point at, which must be the server's), logs in as them round
+robin from ``--concurrency`` client threads, then deletes them.  With
+``--probe-path`` one more client requests that endpoint throughout and
+its latency is reported too, which shows whether the login burst
+starves the other endpoints: compare the WSGI views against
+``ACCOUNTS_ASYNC_AUTH=True`` over ASGI.
+
+All logins come from one address, so clear or raise
+``ACCOUNTS_LOGIN_RATE_IP`` and ``ACCOUNTS_LOGIN_RATE_ACCOUNT`` on the
+server first; throttled attempts are counted separately.
+"""
+
+import http.client
+import itertools
+import json
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+User = get_user_model()
+
+EMAIL_PATTERN = "bench-login-{}@example.invalid"
+
+
+class Command(BaseCommand):
+    help = "Logins/second and latency percentiles against a server."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:8000")
+        parser.add_argument("--path", default="/api/auth/login/")
+        parser.add_argument("--accounts", type=int, default=100)
+        parser.add_argument("--password", default="bench-Login-pw-1")
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--seconds", type=float, default=20.0)
+        parser.add_argument("--probe-path", default=None)
+        parser.add_argument("--token", default=None, help="JWT access.")
+
+    def handle(self, *args, **options):
+        target = urlsplit(options["url"])
+        emails = [
+            EMAIL_PATTERN.format(i) for i in range(options["accounts"])
+        ]
+        password_hash = make_password(options["password"])
+        User.objects.bulk_create(
+            [User(email=email, password=password_hash) for email in emails],
+            ignore_conflicts=True,
+        )
+
+        bodies = itertools.cycle(
+            json.dumps(
+                {"email": email, "password": options["password"]}
+            ).encode()
+            for email in emails
+        )
+        body_lock = threading.Lock()
+
+        def next_body():
+            with body_lock:
+                return next(bodies)
+
+        results = {"login": [], "probe": []}
+        counts = {
+            name: {"throttled": 0, "busy": 0, "failed": 0}
+            for name in results
+        }
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options["seconds"]
+
+        def client(name, method, path, headers, body_for):
+            connection = None
+            mine = []
+            tally = dict.fromkeys(counts[name], 0)
+            while time.perf_counter() < deadline:
+                if connection is None:
+                    connection = http.client.HTTPConnection(
+                        target.hostname, target.port or 80, timeout=60
+                    )
+                started = time.perf_counter()
+                try:
+                    connection.request(
+                        method, path, body=body_for(), headers=headers
+                    )
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    connection = None
+                    tally["failed"] += 1
+                    continue
+                if response.status == 429:
+                    tally["throttled"] += 1
+                elif response.status == 503:
+                    tally["busy"] += 1
+                elif response.status >= 400:
+                    tally["failed"] += 1
+                else:
+                    mine.append(time.perf_counter() - started)
+            if connection is not None:
+                connection.close()
+            with lock:
+                results[name].extend(mine)
+                for key, value in tally.items():
+                    counts[name][key] += value
+
+        json_headers = {"Content-Type": "application/json"}
+        threads = [
+            threading.Thread(
+                target=client,
+                args=("login", "POST", options["path"], json_headers,
+                      next_body),
+            )
+            for _ in range(options["concurrency"])
+        ]
+        if options["probe_path"]:
+            headers = {}
+            if options["token"]:
+                headers["Authorization"] = f"Bearer {options['token']}"
+            threads.append(
+                threading.Thread(
+                    target=client,
+                    args=("probe", "GET", options["probe_path"], headers,
+                          lambda: None),
+                )
+            )
+
+        try:
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            User.objects.filter(email__in=emails).delete()
+
+        logins, failures = results["login"], counts["login"]
+        self.stdout.write(
+            f"POST {options['path']} x{options['concurrency']} clients, "
+            f"{options['accounts']} accounts, {elapsed:.1f}s\n"
+            f"  logins    {len(logins)} ok, {failures['throttled']} "
+            f"throttled, {failures['busy']} busy, "
+            f"{failures['failed']} failed\n"
+            f"  rate      {len(logins) / elapsed:.1f} logins/s"
+        )
+        self.write_percentiles(logins)
+        if options["probe_path"]:
+            self.stdout.write(
+                f"GET {options['probe_path']} during the burst: "
+                f"{len(results['probe'])} ok, "
+                f"{sum(counts['probe'].values())} failed"
+            )
+            self.write_percentiles(results["probe"])
+
+    def write_percentiles(self, latencies):
+        if len(latencies) < 2:
+            return
+        cuts = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"  p50       {cuts[49] * 1000:.1f} ms\n"
+            f"  p95       {cuts[94] * 1000:.1f} ms\n"
+            f"  p99       {cuts[98] * 1000:.1f} ms"
+        )
@@ -0,0 +1,67 @@
+"""
+Create users in bulk from a CSV, JSON or JSON Lines file.
+
+    python manage.py import_users users.csv [--format csv|json|jsonl]
+        [--chunk-size 5000] [--dry-run]
+
+See ``accounts.importing`` for the accepted fields.  Passwords must be
+given already hashed; users without one get an unusable password and
+set theirs through a password reset.  Existing emails are skipped, so
+an interrupted import can simply be run again.  Bulk inserts skip the
+signal that links new users to their meeting invitations; run
+``link_participants`` afterwards.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.importing import (
+    ImportFormatError,
+    guess_format,
+    import_users,
+    read_records,
+)
+
+
+class Command(BaseCommand):
+    help = "Import users from a CSV/JSON file without hashing passwords."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "json", "jsonl"])
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        fmt = options["format"] or guess_format(options["path"])
+        if fmt is None:
+            raise CommandError(
+                "Cannot tell the format from the file name; pass --format."
+            )
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        try:
+            with open(
+                options["path"], encoding="utf-8-sig", newline=""
+            ) as fp:
+                result = import_users(
+                    read_records(fp, fmt),
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                )
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except ImportFormatError as exc:
+            if options["dry_run"]:
+                raise CommandError(str(exc))
+            raise CommandError(f"{exc} Earlier chunks were imported.")
+
+        for error in result.errors:
+            self.stderr.write(f"row {error['row']}: {error['error']}")
+        verb = "Would create" if options["dry_run"] else "Created"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.created} users; skipped "
+                f"{result.skipped} existing, {result.failed} failed."
+            )
+        )
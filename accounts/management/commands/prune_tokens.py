@@ -0,0 +1,80 @@
+"""
+Delete expired outstanding and blacklisted refresh tokens.
+
+    python manage.py prune_tokens [--chunk-size 5000]
+
+Run it daily.  An expired token is rejected whether or not it is
+blacklisted, so its rows only cost space and index depth.  Rows are
+deleted in primary-key chunks, each its own short transaction, so the
+job never holds long locks.  Afterwards it reports the table sizes and
+the blacklist filter's counters (see ``accounts.blacklist``).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from accounts.blacklist import filter_stats
+from accounts.rbac import cache_is_shared
+
+
+class Command(BaseCommand):
+    help = "Delete expired refresh tokens and report blacklist stats."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        now = timezone.now()
+
+        outstanding = blacklisted = 0
+        while True:
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            blacklisted += BlacklistedToken.objects.filter(
+                token_id__in=ids
+            ).delete()[0]
+            outstanding += OutstandingToken.objects.filter(
+                pk__in=ids
+            ).delete()[0]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {outstanding} outstanding and {blacklisted} "
+                "blacklisted tokens."
+            )
+        )
+        self.stdout.write(
+            f"Outstanding tokens: {OutstandingToken.objects.count()}\n"
+            f"Blacklisted tokens: {BlacklistedToken.objects.count()}"
+        )
+
+        if not cache_is_shared():
+            self.stdout.write(
+                "Blacklist filter: off (the cache is not shared between "
+                "processes)."
+            )
+            return
+        stats = filter_stats()
+        if stats["hit_rate"] is None:
+            self.stdout.write("Blacklist filter: no checks recorded yet.")
+            return
+        false_positive_rate = stats["false_positive_rate"] or 0
+        self.stdout.write(
+            f"Blacklist filter: {stats['checks']} checks, "
+            f"{stats['hit_rate']:.1%} answered without a query, "
+            f"{stats['blacklisted']} blacklisted, "
+            f"{stats['false_positives']} false positives "
+            f"({false_positive_rate:.2%})."
+        )
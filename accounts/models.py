@@ -5,6 +5,7 @@ from django.contrib.auth.models import (
     Permission
 )
 from django.utils import timezone
+from . import rbac
 from .managers import UserManager
 
 
@@ -66,16 +67,21 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     # -------- RBAC CORE --------
     def get_role_permissions(self):
-        perms = set()
-        for role in self.roles.filter(is_active=True):
-            perms.update(
-                role.permissions.values_list(
-                    "content_type__app_label",
-                    "codename"
-                )
-            )
+        """
+        ``(app_label, codename)`` pairs granted by the user's active
+        roles.  Memoised on the instance -- ``request.user`` lives for
+        one request -- on top of the shared cache in ``accounts.rbac``.
+        """
+        perms = self.__dict__.get("_role_permissions")
+        if perms is None:
+            perms = rbac.get_role_permissions(self.pk)
+            self._role_permissions = perms
         return perms
 
+    def clear_role_permissions(self):
+        """Forget the memoised permissions after a role change."""
+        self.__dict__.pop("_role_permissions", None)
+
     def has_perm(self, perm, obj=None):
         if self.is_superuser:
             return True
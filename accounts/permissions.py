@@ -0,0 +1,19 @@
+"""
+Permission classes for the accounts API.
+"""
+
+from rest_framework.permissions import BasePermission
+
+
+class IsSuperUser(BasePermission):
+    """
+    Superusers only.  For endpoints that create accounts with chosen
+    password hashes and roles, which would let a plain staff user grant
+    themselves or others any role.
+    """
+
+    message = "Only superusers may do this."
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and user.is_superuser)
@@ -0,0 +1,132 @@
+"""
+Cached role permissions for ``User.has_perm``.
+
+Each user's permissions, flattened across their active roles, are
+loaded with one joined query and kept in the shared cache under a key
+that embeds two versions:
+
+- the user's own version, bumped when roles are added to or removed
+  from that user;
+- a global version, bumped when any role's permissions change or a
+  role is activated, deactivated or deleted.  Role edits are rare, so
+  invalidating every user's set at once is cheaper than working out
+  which users hold the role.
+
+Bumping a version makes the old entries unreachable; they simply
+expire.  Versions are seeded from the clock, as in
+``meetings.utils.cache``, so an evicted version never comes back with
+a value an old entry was built under.  The receivers that bump them
+live in ``accounts.signals``.
+
+Versions are bumped in the cache of the process that made the change,
+so this only works with a cache every worker shares.  With a
+per-process backend (``LocMemCache``, ``DummyCache``) other workers
+would keep granting a revoked permission until their entry expired;
+the sets are then loaded from the database instead, once per request
+thanks to the memo on ``User``.
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+KEY_PREFIX = "accounts"
+GLOBAL_VERSION_KEY = f"{KEY_PREFIX}:v:rbac"
+
+
+def cache_is_shared():
+    """Whether the default cache is seen by every worker process."""
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def _user_version_key(user_id):
+    return f"{KEY_PREFIX}:v:rbac:user:{user_id}"
+
+
+def _get_versions(keys):
+    """Return the current version for each key, seeding missing ones."""
+    versions = cache.get_many(keys)
+    missing = {
+        key: time.time_ns() for key in keys if key not in versions
+    }
+    if missing:
+        for key, value in missing.items():
+            # add() keeps a value another worker seeded first.
+            cache.add(key, value, timeout=None)
+        versions.update(cache.get_many(list(missing)))
+    return [versions.get(key, missing.get(key)) for key in keys]
+
+
+def _bump(keys):
+    def bump():
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Never seeded (or evicted): nothing is cached under it.
+                pass
+
+    # After commit, so a concurrent request cannot cache the old set
+    # under the new version.
+    transaction.on_commit(bump)
+
+
+def permissions_version(user_id):
+    """
+    Opaque string that changes whenever the user's role permissions
+    may have changed.
+    """
+    global_version, user_version = _get_versions(
+        [GLOBAL_VERSION_KEY, _user_version_key(user_id)]
+    )
+    return f"{global_version}.{user_version}"
+
+
+def bump_user_permissions(user_ids):
+    """Invalidate the cached permission sets of these users."""
+    _bump([_user_version_key(user_id) for user_id in set(user_ids)])
+
+
+def bump_all_permissions():
+    """Invalidate every user's cached permission set."""
+    _bump([GLOBAL_VERSION_KEY])
+
+
+def load_role_permissions(user_id):
+    """
+    The user's ``(app_label, codename)`` pairs from all active roles,
+    in a single query.
+    """
+    return frozenset(
+        Permission.objects.filter(
+            roles__users__pk=user_id, roles__is_active=True
+        )
+        .order_by()
+        .values_list("content_type__app_label", "codename")
+        .distinct()
+    )
+
+
+def get_role_permissions(user_id):
+    """``load_role_permissions`` through the shared cache, if any."""
+    if not cache_is_shared():
+        return load_role_permissions(user_id)
+    key = (
+        f"{KEY_PREFIX}:perms:{user_id}:{permissions_version(user_id)}"
+    )
+    perms = cache.get(key)
+    if perms is None:
+        perms = load_role_permissions(user_id)
+        cache.set(
+            key,
+            perms,
+            timeout=getattr(
+                settings, "ACCOUNTS_PERMISSION_CACHE_TIMEOUT", 3600
+            ),
+        )
+    return perms
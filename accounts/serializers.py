@@ -1,7 +1,17 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer,
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import VERSION_CLAIM, add_user_claims
+from .importing import guess_format
+from .rbac import permissions_version
+from .tokens import RefreshToken
 
 User = get_user_model()
 
@@ -84,9 +94,82 @@ class ChangePasswordSerializer(serializers.Serializer):
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
-    """Extends the default JWT login response to include user data."""
+    """
+    Extends the default JWT login response to include user data.
+
+    The tokens carry the claims ``ClaimsJWTAuthentication`` resolves
+    the user from.
+    """
+
+    token_class = RefreshToken
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
 
     def validate(self, attrs):
         data = super().validate(attrs)
         data["user"] = UserSerializer(self.user).data
         return data
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Re-stamps the user claims when they went stale since login, so the
+    new access token is resolved without a query again.
+    """
+
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id and (
+            refresh.payload.get(VERSION_CLAIM)
+            != permissions_version(user_id)
+        ):
+            user = User.objects.filter(pk=user_id).first()
+            if user is not None:
+                add_user_claims(refresh, user)
+                attrs = {**attrs, "refresh": str(refresh)}
+        return super().validate(attrs)
+
+
+class CustomTokenBlacklistSerializer(TokenBlacklistSerializer):
+    """Logout, with the blacklist check behind the Bloom filter."""
+
+    token_class = RefreshToken
+
+
+class UserImportSerializer(serializers.Serializer):
+    """Upload for the bulk user import."""
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(
+        choices=["csv", "json", "jsonl"],
+        required=False,
+        help_text="Defaults to the file name's extension.",
+    )
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if "format" not in attrs:
+            fmt = guess_format(attrs["file"].name)
+            if fmt is None:
+                raise serializers.ValidationError(
+                    {"format": "Cannot tell the format from the file name."}
+                )
+            attrs["format"] = fmt
+        return attrs
+
+
+class UserImportErrorSerializer(serializers.Serializer):
+    row = serializers.IntegerField()
+    error = serializers.CharField()
+
+
+class UserImportResultSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    errors = UserImportErrorSerializer(many=True)
@@ -0,0 +1,98 @@
+"""
+Django signals for the accounts app.
+
+Keep the cached role permissions in ``accounts.rbac`` current: a
+user's set is invalidated when their roles change, and everyone's when
+a role's permissions change or a role is activated, deactivated or
+deleted.
+
+The same per-user version is embedded in access tokens (see
+``accounts.authentication``), so saving or deleting a user bumps it
+too: tokens issued before the change stop being trusted as-is.
+
+Blacklisting a refresh token bumps the generation the Bloom filters in
+``accounts.blacklist`` watch.
+"""
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .blacklist import bump_generation
+from .models import Role, User
+from .rbac import bump_all_permissions, bump_user_permissions
+
+CHANGE_ACTIONS = ("post_add", "post_remove", "post_clear")
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_on_user_roles_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in CHANGE_ACTIONS:
+        return
+    if not reverse:
+        # user.roles.add/remove/clear()
+        instance.clear_role_permissions()
+        bump_user_permissions([instance.pk])
+    elif pk_set:
+        # role.users.add/remove()
+        bump_user_permissions(pk_set)
+    else:
+        # role.users.clear() does not say which users it removed.
+        bump_all_permissions()
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def invalidate_on_role_permissions_change(sender, action, **kwargs):
+    if action in CHANGE_ACTIONS:
+        bump_all_permissions()
+
+
+@receiver(pre_save, sender=Role)
+def remember_role_activity(sender, instance, **kwargs):
+    instance._was_active = (
+        Role.objects.filter(pk=instance.pk)
+        .values_list("is_active", flat=True)
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Role)
+def invalidate_on_role_activity_change(
+    sender, instance, created, **kwargs
+):
+    previous = getattr(instance, "_was_active", None)
+    if not created and previous is not None and (
+        previous != instance.is_active
+    ):
+        bump_all_permissions()
+
+
+@receiver(post_delete, sender=Role)
+def invalidate_on_role_delete(sender, instance, **kwargs):
+    bump_all_permissions()
+
+
+@receiver(post_save, sender=User)
+def invalidate_on_user_save(sender, instance, created, **kwargs):
+    if not created:
+        bump_user_permissions([instance.pk])
+
+
+@receiver(post_delete, sender=User)
+def invalidate_on_user_delete(sender, instance, **kwargs):
+    bump_user_permissions([instance.pk])
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def refresh_blacklist_filters(sender, created, **kwargs):
+    if created:
+        bump_generation()
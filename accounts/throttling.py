@@ -0,0 +1,148 @@
+"""
+Sliding-window throttles for login and registration.
+
+Credential stuffing sends bursts of guesses, each of which would cost a
+deliberately slow password hash.  Attempts are counted per client IP
+and per account email, and a burst over the limit is answered with
+``429`` before any hashing happens.
+
+Each window is estimated from two fixed buckets in the shared cache:
+the current bucket's count plus the previous one's, weighted by how
+much of it still overlaps the window.  A check is one ``get_many`` and
+an allowed attempt one ``incr``, however busy the key.  Rejected
+attempts are not counted, so a client that keeps hammering still gets
+its allowance back as the window slides.
+
+Rates use DRF's ``"<count>/<period>"`` notation, set by
+``ACCOUNTS_LOGIN_RATE_IP``, ``ACCOUNTS_LOGIN_RATE_ACCOUNT`` and
+``ACCOUNTS_REGISTER_RATE_IP``; an empty rate disables that limit.
+"""
+
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+KEY_PREFIX = "accounts:throttle"
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """``"10/min"`` -> ``(10, 60)``; ``None`` for an empty rate."""
+    if not rate:
+        return None
+    count, period = rate.split("/")
+    return int(count), PERIODS[period[0]]
+
+
+class SlidingWindow:
+    """At most ``rate`` hits per key within any window of its period."""
+
+    def __init__(self, scope, rate):
+        self.scope = scope
+        self.limit, self.period = parse_rate(rate)
+
+    def hit(self, ident, now=None):
+        """
+        Record a hit for ``ident`` and return ``None``, or return the
+        seconds to wait if it is over the limit.
+        """
+        now = time.time() if now is None else now
+        bucket = int(now // self.period)
+        current_key = f"{KEY_PREFIX}:{self.scope}:{ident}:{bucket}"
+        previous_key = f"{KEY_PREFIX}:{self.scope}:{ident}:{bucket - 1}"
+        counts = cache.get_many([current_key, previous_key])
+        current = counts.get(current_key, 0)
+        previous = counts.get(previous_key, 0)
+
+        elapsed = now - bucket * self.period
+        overlap = 1 - elapsed / self.period
+        if current + previous * overlap >= self.limit:
+            return self.wait(current, previous, elapsed)
+
+        # Buckets are read for two periods: as current, then previous.
+        cache.add(current_key, 0, timeout=2 * self.period)
+        try:
+            cache.incr(current_key)
+        except ValueError:
+            cache.set(current_key, 1, timeout=2 * self.period)
+        return None
+
+    def wait(self, current, previous, elapsed):
+        remaining = self.period - elapsed
+        if current < self.limit and previous:
+            # When the previous bucket's weight has dropped enough.
+            remaining = (
+                self.period * (1 - (self.limit - current) / previous)
+                - elapsed
+            )
+        return max(1, math.ceil(remaining))
+
+
+def _window(scope, setting, default):
+    rate = getattr(settings, setting, default)
+    return SlidingWindow(scope, rate) if rate else None
+
+
+def _account_ident(email):
+    # Hashed so any address makes a valid cache key.
+    normalized = (email or "").strip().lower()
+    return hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
+
+def client_ident(request):
+    """The client address, honouring DRF's ``NUM_PROXIES``."""
+    return BaseThrottle().get_ident(request)
+
+
+def check_login(ip, email):
+    """Seconds to wait before this login attempt, or ``None``."""
+    window = _window("login-ip", "ACCOUNTS_LOGIN_RATE_IP", "30/min")
+    if window is not None:
+        wait = window.hit(ip)
+        if wait is not None:
+            return wait
+    window = _window(
+        "login-account", "ACCOUNTS_LOGIN_RATE_ACCOUNT", "10/min"
+    )
+    if window is not None and email:
+        return window.hit(_account_ident(email))
+    return None
+
+
+def check_register(ip):
+    """Seconds to wait before this registration, or ``None``."""
+    window = _window("register-ip", "ACCOUNTS_REGISTER_RATE_IP", "10/hour")
+    return window.hit(ip) if window is not None else None
+
+
+class LoginRateThrottle(BaseThrottle):
+    """``check_login`` for the DRF login view."""
+
+    def allow_request(self, request, view):
+        # The body may be any JSON value, e.g. an array.
+        data = request.data
+        email = data.get("email") if isinstance(data, dict) else None
+        self._wait = check_login(
+            self.get_ident(request),
+            email if isinstance(email, str) else None,
+        )
+        return self._wait is None
+
+    def wait(self):
+        return self._wait
+
+
+class RegisterRateThrottle(BaseThrottle):
+    """``check_register`` for the DRF register view."""
+
+    def allow_request(self, request, view):
+        self._wait = check_register(self.get_ident(request))
+        return self._wait is None
+
+    def wait(self):
+        return self._wait
@@ -0,0 +1,18 @@
+"""
+Token classes whose blacklist check goes through ``accounts.blacklist``.
+"""
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from .blacklist import is_blacklisted
+
+
+class RefreshToken(tokens.RefreshToken):
+    """``RefreshToken`` checked against the Bloom-filtered blacklist."""
+
+    def check_blacklist(self):
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
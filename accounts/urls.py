@@ -1,16 +1,24 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import (
     TokenBlacklistView,
     TokenRefreshView,
 )
 
+from . import async_views
 from .views import (
     ChangePasswordView,
     CustomTokenObtainPairView,
     MeView,
     RegisterView,
+    UserImportView,
 )
 
+if settings.ACCOUNTS_ASYNC_AUTH:
+    # Password hashing off the worker thread, for ASGI deployments.
+    CustomTokenObtainPairView = async_views.AsyncLoginView
+    RegisterView = async_views.AsyncRegisterView
+
 urlpatterns = [
     path("register/", RegisterView.as_view(), name="auth-register"),
     path(
@@ -34,4 +42,9 @@ urlpatterns = [
         ChangePasswordView.as_view(),
         name="auth-change-password",
     ),
+    path(
+        "users/import/",
+        UserImportView.as_view(),
+        name="auth-users-import",
+    ),
 ]
@@ -1,18 +1,26 @@
+import io
+
 from django.contrib.auth import get_user_model
 from rest_framework import generics, status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from drf_spectacular.utils import extend_schema
 
+from .importing import ImportFormatError, import_users, read_records
+from .permissions import IsSuperUser
 from .serializers import (
     ChangePasswordSerializer,
     CustomTokenObtainPairSerializer,
     RegisterSerializer,
+    UserImportResultSerializer,
+    UserImportSerializer,
     UserSerializer,
     UserUpdateSerializer,
 )
+from .throttling import LoginRateThrottle, RegisterRateThrottle
 
 User = get_user_model()
 
@@ -23,6 +31,7 @@ class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterRateThrottle]
 
     @extend_schema(
         summary="Register a new user",
@@ -42,6 +51,7 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     """POST /api/auth/login/ -- Obtain JWT access + refresh tokens."""
 
     serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [LoginRateThrottle]
 
 
 class MeView(generics.RetrieveUpdateAPIView):
@@ -80,3 +90,41 @@ class ChangePasswordView(APIView):
         )
         request.user.save()
         return Response({"detail": "Password changed successfully."})
+
+
+class UserImportView(APIView):
+    """
+    POST /api/auth/users/import/ -- Create users in bulk from a file.
+
+    Superusers only, since rows set password hashes and roles.  The
+    upload is read as a stream and imported in chunks like
+    ``manage.py import_users``; see ``accounts.importing``.
+    """
+
+    permission_classes = [IsSuperUser]
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(
+        request=UserImportSerializer,
+        responses={200: UserImportResultSerializer},
+        summary="Import users from CSV/JSON",
+    )
+    def post(self, request):
+        serializer = UserImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        fp = io.TextIOWrapper(
+            data["file"], encoding="utf-8-sig", newline=""
+        )
+        try:
+            result = import_users(
+                read_records(fp, data["format"]), dry_run=data["dry_run"]
+            )
+        except (ImportFormatError, UnicodeDecodeError) as exc:
+            detail = str(exc)
+            if not data["dry_run"]:
+                detail += " Earlier chunks were imported."
+            return Response(
+                {"detail": detail}, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(UserImportResultSerializer(result).data)
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 from pathlib import Path
+from corsheaders.defaults import default_headers
 from decouple import config
 from datetime import timedelta
 from .spectecular_swagger_setting import (
@@ -52,6 +53,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third-party
     "rest_framework",
     "corsheaders",
@@ -104,6 +106,11 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Conditional requests: let browser clients send ETag preconditions and
+# read the ETag returned by meeting and participant endpoints.
+CORS_ALLOW_HEADERS = (*default_headers, 'if-match', 'if-none-match')
+CORS_EXPOSE_HEADERS = ['ETag']
+
 # ── Email (console in dev, SMTP in prod) ─────────────────────────────────────
 EMAIL_BACKEND = config(
     'EMAIL_BACKEND',
@@ -120,9 +127,111 @@ DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@meetingschedu
 WSGI_APPLICATION = 'config.wsgi.application'
 
 
+# ── Cache (local memory in dev; point at Redis/Memcached in prod) ────────────
+CACHES = {
+    'default': {
+        'BACKEND': config(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': config('CACHE_LOCATION', default=''),
+    }
+}
+
+# Seconds a user's cached role-permission set may live.  Role changes
+# invalidate it immediately through version bumps (accounts/rbac.py).
+ACCOUNTS_PERMISSION_CACHE_TIMEOUT = config(
+    'ACCOUNTS_PERMISSION_CACHE_TIMEOUT', default=3600, cast=int
+)
+
+# Resolve the user of a request from access-token claims instead of a
+# query (accounts/authentication.py).  Tokens older than the user's
+# last change fall back to a user row cached for this many seconds.
+ACCOUNTS_STATELESS_JWT = config(
+    'ACCOUNTS_STATELESS_JWT', default=False, cast=bool
+)
+ACCOUNTS_USER_CACHE_TIMEOUT = config(
+    'ACCOUNTS_USER_CACHE_TIMEOUT', default=60, cast=int
+)
+
+# Seconds between full rebuilds of each process's Bloom filter over the
+# refresh-token blacklist (accounts/blacklist.py); 0 checks the table
+# on every refresh instead.  The filter is sized for this error rate.
+ACCOUNTS_BLACKLIST_FILTER_REBUILD = config(
+    'ACCOUNTS_BLACKLIST_FILTER_REBUILD', default=300, cast=int
+)
+ACCOUNTS_BLACKLIST_FILTER_ERROR_RATE = config(
+    'ACCOUNTS_BLACKLIST_FILTER_ERROR_RATE', default=0.01, cast=float
+)
+
+# Login and registration attempts allowed per client IP and per account
+# email, as DRF-style rates ("30/min"); empty disables a limit
+# (accounts/throttling.py).
+ACCOUNTS_LOGIN_RATE_IP = config('ACCOUNTS_LOGIN_RATE_IP', default='30/min')
+ACCOUNTS_LOGIN_RATE_ACCOUNT = config(
+    'ACCOUNTS_LOGIN_RATE_ACCOUNT', default='10/min'
+)
+ACCOUNTS_REGISTER_RATE_IP = config(
+    'ACCOUNTS_REGISTER_RATE_IP', default='10/hour'
+)
+
+# Route login and register to the async views in accounts/async_views.py,
+# which hash passwords on a pool of ACCOUNTS_HASH_THREADS threads (0 =
+# one per CPU) with at most ACCOUNTS_HASH_MAX_PENDING waiting.  Only
+# worth it when served over ASGI.
+ACCOUNTS_ASYNC_AUTH = config('ACCOUNTS_ASYNC_AUTH', default=False, cast=bool)
+ACCOUNTS_HASH_THREADS = config('ACCOUNTS_HASH_THREADS', default=0, cast=int)
+ACCOUNTS_HASH_MAX_PENDING = config(
+    'ACCOUNTS_HASH_MAX_PENDING', default=64, cast=int
+)
+
+# Serve meeting and participant reads from values() rows and
+# precompiled dict builders instead of DRF serializers.
+MEETINGS_FAST_READ = config('MEETINGS_FAST_READ', default=False, cast=bool)
+
+# Seconds a cached meeting list/detail response may live.  Entries are
+# invalidated by version bumps long before this in normal operation.
+MEETINGS_CACHE_TIMEOUT = config('MEETINGS_CACHE_TIMEOUT', default=300, cast=int)
+
+# Days deletion tombstones are kept for /api/meetings/changes/.  Sync
+# cursors older than this get 410 Gone and must reload in full.
+MEETINGS_TOMBSTONE_RETENTION_DAYS = config(
+    'MEETINGS_TOMBSTONE_RETENTION_DAYS', default=30, cast=int
+)
+
+# Serve the server-sent events stream at /api/meetings/events/.  The
+# stream holds its connection open for minutes, so it needs an ASGI
+# server (see gunicorn.asgi.conf.py); it answers 501 under WSGI.
+MEETINGS_EVENT_STREAM = config(
+    'MEETINGS_EVENT_STREAM', default=False, cast=bool
+)
+
+# Pub/sub behind /api/meetings/events/.  The in-process default only
+# reaches streams served by the same process; with several workers use
+# meetings.utils.events.RedisBroker and point the URL at Redis.
+MEETINGS_EVENT_BROKER = config(
+    'MEETINGS_EVENT_BROKER',
+    default='meetings.utils.events.InProcessBroker',
+)
+MEETINGS_EVENT_BROKER_URL = config('MEETINGS_EVENT_BROKER_URL', default='')
+
+# Route the notify, conflict-check, my-calendar and ICS export
+# endpoints to the async views in meetings/async_views.py.  Only worth
+# it when served over ASGI (see gunicorn.asgi.conf.py).
+MEETINGS_ASYNC_VIEWS = config('MEETINGS_ASYNC_VIEWS', default=False, cast=bool)
+
+# Threads for blocking work kept off the request path: email sends
+# (async views, bulk invitations) and ICS rendering each get their own
+# bounded pool.
+MEETINGS_EMAIL_THREADS = config('MEETINGS_EMAIL_THREADS', default=4, cast=int)
+MEETINGS_RENDER_THREADS = config('MEETINGS_RENDER_THREADS', default=4, cast=int)
+
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.ClaimsJWTAuthentication'
+        if ACCOUNTS_STATELESS_JWT
+        else 'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -145,6 +254,12 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_REFRESH_SERIALIZER': (
+        'accounts.serializers.CustomTokenRefreshSerializer'
+    ),
+    'TOKEN_BLACKLIST_SERIALIZER': (
+        'accounts.serializers.CustomTokenBlacklistSerializer'
+    ),
 }
 
 # Database
@@ -0,0 +1,51 @@
+"""
+Gunicorn settings for serving the project over ASGI.
+
+    gunicorn config.asgi:application -c gunicorn.asgi.conf.py
+
+Each worker runs one uvicorn event loop, so a handful of workers hold
+thousands of idle event streams and overlap the I/O of the async views
+(set MEETINGS_ASYNC_VIEWS=True).  Sync DRF views keep working; Django
+runs them in a thread per request.
+
+Events reach the streams held by other workers only through a shared
+broker, so with MEETINGS_EVENT_STREAM on and the in-process broker the
+server refuses to start with more than one worker.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(
+    os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() + 1)
+)
+
+# Event streams stay open for minutes; the worker heartbeat is
+# independent of request length, so the usual timeout is fine.
+timeout = 30
+graceful_timeout = 30
+keepalive = 75
+
+
+def on_starting(server):
+    """Refuse event streams that most workers' events could not reach."""
+    from decouple import config
+    from django.core.exceptions import ImproperlyConfigured
+
+    stream = config("MEETINGS_EVENT_STREAM", default=False, cast=bool)
+    broker = config(
+        "MEETINGS_EVENT_BROKER",
+        default="meetings.utils.events.InProcessBroker",
+    )
+    if (
+        stream
+        and broker.rsplit(".", 1)[-1] == "InProcessBroker"
+        and server.cfg.workers > 1
+    ):
+        raise ImproperlyConfigured(
+            "MEETINGS_EVENT_STREAM with the in-process broker needs "
+            "GUNICORN_WORKERS=1; use meetings.utils.events.RedisBroker "
+            "to run several workers."
+        )
@@ -2,7 +2,7 @@
 
 import { useEffect, useState, useCallback } from "react";
 import Link from "next/link";
-import { meetingsApi } from "@/lib/api";
+import { meetingsApi, subscribeMeetingEvents } from "@/lib/api";
 import {
   formatDateTime,
   getMeetingStatusColor,
@@ -61,6 +61,19 @@ export default function MeetingsPage() {
     return () => clearTimeout(delay);
   }, [fetchMeetings]);
 
+  // Reload when a meeting changes elsewhere (another tab, an RSVP…).
+  useEffect(() => {
+    let delay;
+    const unsubscribe = subscribeMeetingEvents(() => {
+      clearTimeout(delay);
+      delay = setTimeout(fetchMeetings, 400);
+    });
+    return () => {
+      clearTimeout(delay);
+      unsubscribe();
+    };
+  }, [fetchMeetings]);
+
   const handleExportIcs = async (meeting) => {
     setExportingId(meeting.id);
     try {
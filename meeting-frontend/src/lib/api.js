@@ -94,6 +94,9 @@ export const meetingsApi = {
     api.get(`/api/meetings/${id}/export-ics/`, { responseType: "blob" }),
   myCalendar: () =>
     api.get("/api/meetings/my-calendar/", { responseType: "blob" }),
+  calendarSummary: (params) => api.get("/api/meetings/calendar/", { params }),
+  changes: (since) =>
+    api.get("/api/meetings/changes/", { params: since ? { since } : {} }),
   checkConflicts: (data) => api.post("/api/meetings/check-conflicts/", data),
   notify: (id, type) => api.post(`/api/meetings/${id}/notify/`, { type }),
 };
@@ -112,5 +115,38 @@ export const participantsApi = {
     ),
 };
 
+// ── Live updates (server-sent events) ─────────────────────────────────────
+const MEETING_EVENTS = [
+  "meeting.created",
+  "meeting.updated",
+  "meeting.cancelled",
+  "meeting.deleted",
+  "rsvp.changed",
+  "resync",
+];
+
+// The backend only serves the stream over ASGI with
+// MEETINGS_EVENT_STREAM on, so it stays off unless enabled here too.
+const EVENTS_ENABLED = process.env.NEXT_PUBLIC_MEETING_EVENTS === "true";
+
+// Calls onEvent({ type, meeting_id, ... }) for each event; returns an
+// unsubscribe function. EventSource cannot send headers, so the access
+// token travels as a query parameter.
+export const subscribeMeetingEvents = (onEvent) => {
+  const token = localStorage.getItem("access_token");
+  if (!EVENTS_ENABLED || !token || typeof EventSource === "undefined") {
+    return () => {};
+  }
+  const source = new EventSource(
+    `${BASE_URL}/api/meetings/events/?access_token=${encodeURIComponent(token)}`
+  );
+  MEETING_EVENTS.forEach((type) =>
+    source.addEventListener(type, (e) => onEvent(JSON.parse(e.data)))
+  );
+  // A 404/501 answer closes the source for good; network errors leave
+  // it reconnecting by itself.
+  return () => source.close();
+};
+
 export default api;
 
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Meeting, MeetingNotification, Participant
+from .models import Meeting, MeetingNotification, Participant, Resource
 
 
 class ParticipantInline(admin.TabularInline):
@@ -49,6 +49,13 @@ class MeetingAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(Resource)
+class ResourceAdmin(admin.ModelAdmin):
+    list_display = ("name", "kind", "capacity", "is_active")
+    list_filter = ("kind", "is_active")
+    search_fields = ("name", "description")
+
+
 @admin.register(Participant)
 class ParticipantAdmin(admin.ModelAdmin):
     list_display = (
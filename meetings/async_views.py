@@ -0,0 +1,297 @@
+"""
+Async views for the meetings app.
+
+DRF views are synchronous, so these are plain Django class-based views
+with ``async`` handlers.  Under an ASGI server a request waiting on the
+database, an SMTP server or a long-lived event stream costs a
+coroutine instead of a worker thread.
+
+Database access goes through Django's async ORM; blocking work that
+does not touch the database (email sends, ICS rendering) runs on the
+bounded pools in ``utils.executors``.
+
+The event stream is served from here when ``MEETINGS_EVENT_STREAM`` is
+on.  The notify, conflict check, my-calendar and ICS export variants
+replace their DRF counterparts in ``urls.py`` when
+``MEETINGS_ASYNC_VIEWS`` is on; their request and response bodies are
+the same.
+"""
+
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils import timezone
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from accounts.authentication import ClaimsJWTAuthentication
+
+from .models import Meeting, MeetingNotification
+from .serializers import ConflictCheckSerializer
+from .utils.conflict_detector import acheck_participants_conflicts
+from .utils.events import get_broker
+from .utils.executors import run_in_pool
+from .utils.ics_generator import (
+    generate_ics_for_meeting,
+    generate_ics_for_multiple_meetings,
+)
+from .utils.notifications import asend_bulk_notifications
+from .views import get_user_meetings
+
+
+def authenticate_request(request):
+    """
+    Return the user behind the request's access token, or None.
+
+    Browsers' EventSource cannot set headers, so besides the usual
+    ``Authorization: Bearer`` header the token may be passed as the
+    ``access_token`` query parameter.
+    """
+    auth = (
+        ClaimsJWTAuthentication()
+        if getattr(settings, "ACCOUNTS_STATELESS_JWT", False)
+        else JWTAuthentication()
+    )
+    raw = request.GET.get("access_token")
+    try:
+        if raw:
+            return auth.get_user(auth.get_validated_token(raw.encode()))
+        result = auth.authenticate(request)
+    except (AuthenticationFailed, InvalidToken):
+        return None
+    return result[0] if result else None
+
+
+def ics_attachment(content, filename):
+    response = HttpResponse(content, content_type="text/calendar")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+class AsyncAPIView(View):
+    """
+    Base for the async views: JWT authentication, JSON request bodies
+    and DRF-style JSON errors.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Token-authenticated, like the DRF views.  Set directly because
+        # Django 4.2's csrf_exempt() wraps async views in a sync function.
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        user = await sync_to_async(authenticate_request)(request)
+        if user is None or not user.is_active:
+            return self.error(
+                "Authentication credentials were not provided.",
+                status.HTTP_401_UNAUTHORIZED,
+            )
+        request.user = user
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except ValidationError as exc:
+            return JsonResponse(
+                exc.detail, status=exc.status_code, safe=False
+            )
+        except Http404:
+            return self.error("Not found.", status.HTTP_404_NOT_FOUND)
+
+    def error(self, detail, status_code):
+        return JsonResponse({"detail": detail}, status=status_code)
+
+    def json_body(self, request):
+        try:
+            return json.loads(request.body or b"{}")
+        except ValueError as exc:
+            raise ValidationError({"detail": f"JSON parse error - {exc}"})
+
+    async def get_user_meeting(self, request, pk):
+        """The user's meeting ``pk`` (organiser joined), or 404."""
+        queryset = (
+            get_user_meetings(request.user)
+            .prefetch_related(None)
+            .select_related("created_by")
+        )
+        try:
+            return await queryset.aget(pk=pk)
+        except Meeting.DoesNotExist:
+            raise Http404
+
+
+# ---------------------------------------------------------------------------
+
+class MeetingEventStreamView(AsyncAPIView):
+    """
+    GET /api/meetings/events/
+
+    A server-sent events stream of the current user's meeting events.
+    Each open stream costs one coroutine and a small queue, so a
+    single ASGI worker holds thousands of them.
+
+    Routed only with ``MEETINGS_EVENT_STREAM`` on, and answers ``501``
+    to requests not served over ASGI: a WSGI handler would drain the
+    whole stream before sending anything, holding a worker for
+    ``max_age`` seconds while the client receives nothing.
+
+    Comment lines are sent as heartbeats so idle connections are not
+    dropped by proxies.  Streams are closed after ``max_age`` seconds
+    and the browser reconnects by itself; that also bounds streams
+    whose client vanished without the server noticing.  After a
+    reconnect, clients catch up through the changes feed.
+    """
+
+    heartbeat = 15
+    max_age = 300
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return self.error(
+                "The event stream is only available over ASGI.",
+                status.HTTP_501_NOT_IMPLEMENTED,
+            )
+        response = StreamingHttpResponse(
+            self.stream(request.user.pk), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, user_id):
+        broker = get_broker()
+        subscription = broker.subscribe(user_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_age
+        try:
+            yield "retry: 3000\n\n"
+            while loop.time() < deadline:
+                event = await subscription.get(self.heartbeat)
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield (
+                    f"event: {event['type']}\n"
+                    f"data: {json.dumps(event)}\n\n"
+                )
+        finally:
+            broker.unsubscribe(subscription)
+
+
+# ---------------------------------------------------------------------------
+
+class AsyncMeetingExportICSView(AsyncAPIView):
+    """
+    GET /api/meetings/{id}/export-ics/
+
+    Loads the meeting and its participants with the async ORM and
+    renders the calendar on the "render" pool.
+    """
+
+    async def get(self, request, pk):
+        meeting = await self.get_user_meeting(request, pk)
+        participants = [p async for p in meeting.participants.all()]
+        ics_content = await run_in_pool(
+            "render", generate_ics_for_meeting, meeting, participants
+        )
+        safe_title = "".join(
+            c if c.isalnum() else "_" for c in meeting.title
+        )
+        return ics_attachment(ics_content, f"{safe_title}.ics")
+
+
+# ---------------------------------------------------------------------------
+
+class AsyncMyCalendarView(AsyncAPIView):
+    """
+    GET /api/meetings/my-calendar/
+
+    Async variant of the upcoming-meetings ICS download.
+    """
+
+    async def get(self, request):
+        meetings = get_user_meetings(
+            request.user,
+            status=Meeting.STATUS_SCHEDULED,
+            start_time__gte=timezone.now(),
+        ).prefetch_related(None)
+        meetings = [meeting async for meeting in meetings]
+        ics_content = await run_in_pool(
+            "render", generate_ics_for_multiple_meetings, meetings
+        )
+        return ics_attachment(ics_content, "my_meetings.ics")
+
+
+# ---------------------------------------------------------------------------
+
+class AsyncConflictCheckView(AsyncAPIView):
+    """
+    POST /api/meetings/check-conflicts/
+
+    Async variant of the conflict check; all emails are checked with
+    one async query.
+    """
+
+    async def post(self, request):
+        serializer = ConflictCheckSerializer(data=self.json_body(request))
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        conflicts = await acheck_participants_conflicts(
+            participants_emails=data["participant_emails"],
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            exclude_meeting_id=data.get("exclude_meeting_id"),
+        )
+        return JsonResponse(
+            {"has_conflicts": bool(conflicts), "conflicts": conflicts}
+        )
+
+
+# ---------------------------------------------------------------------------
+
+class AsyncMeetingNotifyView(AsyncAPIView):
+    """
+    POST /api/meetings/{id}/notify/
+
+    Async variant of the manual notification trigger.  Log rows are
+    written with the async ORM and the emails go out over one
+    connection on the "email" pool.
+    """
+
+    async def post(self, request, pk):
+        meeting = await self.get_user_meeting(request, pk)
+
+        if meeting.created_by_id != request.user.pk:
+            return self.error(
+                "Only the organiser can send notifications.",
+                status.HTTP_403_FORBIDDEN,
+            )
+
+        notification_type = self.json_body(request).get("type", "reminder")
+        allowed = [t[0] for t in MeetingNotification.TYPE_CHOICES]
+        if notification_type not in allowed:
+            return self.error(
+                f"Type must be one of: {allowed}",
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        participants = [p async for p in meeting.participants.all()]
+        results = await asend_bulk_notifications(
+            participants, notification_type
+        )
+        return JsonResponse({"results": results})
@@ -0,0 +1,65 @@
+"""
+Search backend for the meetings list.
+
+On PostgreSQL, ``?search=`` is answered from the ``search_vector``
+column (kept up to date by a database trigger and covered by a GIN
+index) with prefix matching for autocomplete, plus trigram word
+similarity on the title for typos.  Results carry a ``search_rank``
+annotation that the cursor paginator orders by.
+
+Other databases (SQLite in development) fall back to DRF's
+``SearchFilter`` over ``search_fields``.
+"""
+
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+from rest_framework import filters
+
+SEARCH_RANK = "search_rank"
+SEARCH_CONFIG = "english"
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_prefix_query(text):
+    """
+    Return a SearchQuery matching every word in ``text`` as a prefix,
+    or None if ``text`` has no searchable words.
+
+    Words are reduced to ``\\w+`` runs so user input can never break
+    the raw tsquery syntax.
+    """
+    words = _WORD_RE.findall(text)
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw, search_type="raw", config=SEARCH_CONFIG)
+
+
+class MeetingSearchFilter(filters.SearchFilter):
+    """SearchFilter that uses full-text search on PostgreSQL."""
+
+    def filter_queryset(self, request, queryset, view):
+        if connection.vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        text = " ".join(self.get_search_terms(request))
+        query = build_prefix_query(text)
+        if query is None:
+            return queryset
+
+        rank = SearchRank(F("search_vector"), query) + (
+            TrigramWordSimilarity(text, "title")
+        )
+        return queryset.filter(
+            Q(search_vector=query)
+            | Q(title__trigram_word_similar=text)
+        ).annotate(**{SEARCH_RANK: Cast(rank, FloatField())})
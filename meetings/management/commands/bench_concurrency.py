@@ -0,0 +1,107 @@
+"""
+Load-test one endpoint of a running server and report latency.
+
+    python manage.py bench_concurrency --url http://localhost:8000 \
+        --path /api/meetings/check-conflicts/ --method POST \
+        --body '{"start_time": "...", ...}' --token <access token> \
+        --concurrency 50 --seconds 20
+
+Meant for comparing deployments of the same code, e.g. the WSGI
+gunicorn setup from the Dockerfile against gunicorn with uvicorn
+workers (gunicorn.asgi.conf.py) and MEETINGS_ASYNC_VIEWS=True.  Each
+client is a thread with its own keep-alive connection, so the client
+side does not become the bottleneck before a few hundred clients.
+"""
+
+import http.client
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Requests/second and latency percentiles for one endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:8000")
+        parser.add_argument("--path", required=True)
+        parser.add_argument("--method", default="GET")
+        parser.add_argument("--body", default=None, help="JSON body.")
+        parser.add_argument("--token", default=None, help="JWT access.")
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--seconds", type=float, default=20.0)
+
+    def handle(self, *args, **options):
+        target = urlsplit(options["url"])
+        headers = {"Content-Type": "application/json"}
+        if options["token"]:
+            headers["Authorization"] = f"Bearer {options['token']}"
+        body = options["body"].encode() if options["body"] else None
+
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options["seconds"]
+
+        def client():
+            connection = None
+            mine, failed = [], 0
+            while time.perf_counter() < deadline:
+                if connection is None:
+                    connection = http.client.HTTPConnection(
+                        target.hostname, target.port or 80, timeout=60
+                    )
+                started = time.perf_counter()
+                try:
+                    connection.request(
+                        options["method"],
+                        options["path"],
+                        body=body,
+                        headers=headers,
+                    )
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    connection = None
+                    failed += 1
+                    continue
+                if response.status >= 400:
+                    failed += 1
+                else:
+                    mine.append(time.perf_counter() - started)
+            if connection is not None:
+                connection.close()
+            with lock:
+                latencies.extend(mine)
+                errors.append(failed)
+
+        threads = [
+            threading.Thread(target=client)
+            for _ in range(options["concurrency"])
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if not latencies:
+            self.stderr.write(
+                f"No successful requests ({sum(errors)} failed)."
+            )
+            return
+        cuts = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{options['method']} {options['path']} "
+            f"x{options['concurrency']} clients, {elapsed:.1f}s\n"
+            f"  requests  {len(latencies)} ok, {sum(errors)} failed\n"
+            f"  rate      {len(latencies) / elapsed:.1f} req/s\n"
+            f"  p50       {cuts[49] * 1000:.1f} ms\n"
+            f"  p95       {cuts[94] * 1000:.1f} ms\n"
+            f"  p99       {cuts[98] * 1000:.1f} ms"
+        )
@@ -0,0 +1,112 @@
+"""
+Benchmark the meeting list endpoint with and without the fast read path.
+
+    python manage.py bench_read_path --rows 1 100 1000 --seconds 3
+
+Seeds the requested number of meetings for a throwaway user inside a
+transaction that is rolled back afterwards, so it is safe to run
+against a development database.  Response caching is disabled for the
+run so every request does the full database + serialization work.
+"""
+
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from meetings.models import Meeting, Participant
+from meetings.views import MeetingListCreateView
+
+User = get_user_model()
+
+NO_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+    }
+}
+
+
+class Command(BaseCommand):
+    help = "Requests/second of GET /api/meetings/ for both read paths."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, nargs="+", default=[1, 100, 1000]
+        )
+        parser.add_argument("--seconds", type=float, default=3.0)
+        parser.add_argument(
+            "--participants",
+            type=int,
+            default=3,
+            help="Participants per seeded meeting.",
+        )
+
+    def handle(self, *args, **options):
+        # Unpaginated, so each request serializes every seeded row.
+        view = MeetingListCreateView.as_view(pagination_class=None)
+        factory = APIRequestFactory()
+
+        self.stdout.write(
+            f"{'rows':>6}  {'serializers':>12}  {'fast read':>12}"
+            f"  {'speed-up':>8}"
+        )
+        for rows in options["rows"]:
+            with transaction.atomic():
+                user = self._seed(rows, options["participants"])
+                results = []
+                for fast in (False, True):
+                    with override_settings(
+                        MEETINGS_FAST_READ=fast, CACHES=NO_CACHE
+                    ):
+                        results.append(
+                            self._measure(
+                                view, factory, user, options["seconds"]
+                            )
+                        )
+                transaction.set_rollback(True)
+
+            slow, fast = results
+            self.stdout.write(
+                f"{rows:>6}  {slow:>8.1f} rps  {fast:>8.1f} rps"
+                f"  {fast / slow:>7.2f}x"
+            )
+
+    def _seed(self, rows, participants_per_meeting):
+        user = User.objects.create_user(
+            email=f"bench-{time.time_ns()}@example.com"
+        )
+        start = timezone.now() + timedelta(days=1)
+        meetings = Meeting.objects.bulk_create(
+            Meeting(
+                title=f"Benchmark meeting {i}",
+                location="Room 1",
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=30),
+                created_by=user,
+                invited_count=participants_per_meeting,
+            )
+            for i in range(rows)
+        )
+        Participant.objects.bulk_create(
+            Participant(meeting=meeting, email=f"p{j}@example.com")
+            for meeting in meetings
+            for j in range(participants_per_meeting)
+        )
+        return user
+
+    def _measure(self, view, factory, user, seconds):
+        count = 0
+        deadline = time.perf_counter() + seconds
+        started = time.perf_counter()
+        while time.perf_counter() < deadline:
+            request = factory.get("/api/meetings/")
+            force_authenticate(request, user=user)
+            response = view(request)
+            response.render()
+            count += 1
+        return count / (time.perf_counter() - started)
@@ -0,0 +1,81 @@
+"""
+Mark scheduled meetings that have ended as completed.
+
+    python manage.py complete_past_meetings [--chunk-size 1000] [--dry-run]
+
+Run it periodically (e.g. every 15 minutes from cron).  Meetings are
+picked oldest-first from the partial index on scheduled meetings and
+updated in chunks of plain UPDATEs, one short transaction per chunk,
+so no per-row signals fire.  The side effects those signals would have
+are applied per chunk instead: agenda entries get the new status,
+``updated_at`` moves so the changes feed reports the meetings, and the
+response cache is invalidated for everyone who can see them.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from meetings.models import Meeting, UserAgendaEntry
+from meetings.utils.cache import bump_meeting_versions, bump_user_versions
+
+
+class Command(BaseCommand):
+    help = "Move scheduled meetings whose end time has passed to completed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many meetings would be completed.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        now = timezone.now()
+        ended = Meeting.objects.filter(
+            status=Meeting.STATUS_SCHEDULED, end_time__lte=now
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                f"{ended.count()} meetings would be completed."
+            )
+            return
+
+        completed = 0
+        while True:
+            with transaction.atomic():
+                # Rows an organiser is editing right now are skipped
+                # and picked up by the next run.
+                ids = list(
+                    ended.select_for_update(skip_locked=True)
+                    .order_by("end_time")
+                    .values_list("pk", flat=True)[:chunk_size]
+                )
+                if not ids:
+                    break
+                completed += Meeting.objects.filter(
+                    pk__in=ids, status=Meeting.STATUS_SCHEDULED
+                ).update(status=Meeting.STATUS_COMPLETED, updated_at=now)
+
+                entries = UserAgendaEntry.objects.filter(meeting_id__in=ids)
+                user_ids = set(entries.values_list("user_id", flat=True))
+                entries.update(status=Meeting.STATUS_COMPLETED)
+
+                transaction.on_commit(self.invalidator(ids, user_ids))
+            if len(ids) < chunk_size:
+                break
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Completed {completed} meetings.")
+        )
+
+    @staticmethod
+    def invalidator(meeting_ids, user_ids):
+        def invalidate():
+            bump_meeting_versions(meeting_ids)
+            bump_user_versions(user_ids)
+
+        return invalidate
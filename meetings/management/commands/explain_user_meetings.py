@@ -0,0 +1,185 @@
+"""
+Check the query plans and latency of ``get_user_meetings``.
+
+    python manage.py explain_user_meetings --users 200 --meetings 50 \
+        --runs 200 [-v 2]
+
+Seeds ``--users`` organisers with ``--meetings`` meetings each, plus one
+user who organises and is invited to a share of them, inside a
+transaction that is rolled back afterwards, so it is safe to run
+against a development database.  On PostgreSQL the tables are analysed
+first so the planner sees the seeded sizes.
+
+For the list, date-range and detail lookups the command EXPLAINs the
+query, reports which agenda index the plan reads and the p50/p95
+latency over ``--runs`` executions, and fails unless the date-range
+lookup uses the (user, start_time) index.  Without a range either
+per-user index serves the join, so the planner is free to pick.
+``-v 2`` prints the plans.
+"""
+
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from meetings.models import Meeting, Participant, UserAgendaEntry
+from meetings.utils.agenda import build_agenda_entries
+from meetings.views import for_list, get_user_meetings
+
+User = get_user_model()
+
+CHUNK = 1000
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN plan checks and latency of get_user_meetings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--meetings", type=int, default=50)
+        parser.add_argument(
+            "--invited-every",
+            type=int,
+            default=20,
+            help="Invite the measured user to every Nth other meeting.",
+        )
+        parser.add_argument("--runs", type=int, default=200)
+
+    def handle(self, *args, **options):
+        (range_index,) = [
+            index.name
+            for index in UserAgendaEntry._meta.indexes
+            if index.fields == ["user", "start_time"]
+        ]
+
+        failures = []
+        with transaction.atomic():
+            user, meeting_id, start = self._seed(options)
+            cases = [
+                (
+                    "list",
+                    for_list(get_user_meetings(user)).order_by(
+                        "start_time", "id"
+                    )[:20],
+                    None,
+                ),
+                (
+                    "date range",
+                    for_list(
+                        get_user_meetings(
+                            user,
+                            start_time__gte=start + timedelta(days=7),
+                            end_time__lt=start + timedelta(days=14),
+                        )
+                    ).order_by("start_time", "id"),
+                    range_index,
+                ),
+                (
+                    "detail",
+                    get_user_meetings(user)
+                    .prefetch_related(None)
+                    .filter(pk=meeting_id),
+                    None,
+                ),
+            ]
+
+            self.stdout.write(
+                f"{'query':<12}  {'rows':>5}  {'p50':>9}  {'p95':>9}  "
+                f"agenda index"
+            )
+            for name, queryset, required in cases:
+                plan = queryset.explain()
+                latencies = self._measure(queryset, options["runs"])
+                cuts = statistics.quantiles(latencies, n=20)
+                self.stdout.write(
+                    f"{name:<12}  {len(list(queryset)):>5}  "
+                    f"{statistics.median(latencies) * 1000:>6.2f} ms  "
+                    f"{cuts[18] * 1000:>6.2f} ms  "
+                    f"{self._agenda_index(plan)}"
+                )
+                if options["verbosity"] > 1:
+                    self.stdout.write(plan)
+                if required and required not in plan:
+                    failures.append(
+                        f"{name}: plan does not use {required}:\n{plan}"
+                    )
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError("\n\n".join(failures))
+
+    def _seed(self, options):
+        stamp = time.time_ns()
+        password = make_password(None)
+        user = User.objects.create_user(
+            email=f"explain-{stamp}@example.com"
+        )
+        organisers = User.objects.bulk_create(
+            User(email=f"explain-{stamp}-{i}@example.com", password=password)
+            for i in range(options["users"])
+        )
+
+        start = timezone.now()
+        meetings = Meeting.objects.bulk_create(
+            Meeting(
+                title=f"Explain meeting {i}",
+                start_time=start + timedelta(hours=i * 7),
+                end_time=start + timedelta(hours=i * 7, minutes=30),
+                created_by=organiser,
+            )
+            for organiser in [user, *organisers]
+            for i in range(options["meetings"])
+        )
+        invited = meetings[options["meetings"]::options["invited_every"]]
+        Participant.objects.bulk_create(
+            Participant(meeting=meeting, email=user.email, user=user)
+            for meeting in invited
+        )
+        meeting_ids = [meeting.pk for meeting in meetings]
+        for offset in range(0, len(meeting_ids), CHUNK):
+            UserAgendaEntry.objects.bulk_create(
+                build_agenda_entries(meeting_ids[offset:offset + CHUNK])
+            )
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                for model in (Meeting, Participant, UserAgendaEntry):
+                    cursor.execute(f'ANALYZE "{model._meta.db_table}"')
+
+        self.stdout.write(
+            f"Seeded {len(meetings)} meetings; the measured user "
+            f"organises {options['meetings']} and is invited to "
+            f"{len(invited)}."
+        )
+        return user, invited[0].pk if invited else meetings[0].pk, start
+
+    @staticmethod
+    def _agenda_index(plan):
+        """The index the plan reads the agenda table through, if any."""
+        opts = UserAgendaEntry._meta
+        for index in [*opts.indexes, *opts.constraints]:
+            if index.name in plan:
+                return index.name
+        # Indexes the database named itself, e.g. SQLite's for unique
+        # constraints.
+        table = opts.db_table
+        for line in plan.splitlines():
+            words = line.replace('"', "").split()
+            if table in words and ("INDEX" in words or "using" in words):
+                after = "INDEX" if "INDEX" in words else "using"
+                return words[words.index(after) + 1]
+        return "none"
+
+    def _measure(self, queryset, runs):
+        latencies = []
+        for _ in range(max(runs, 2)):
+            started = time.perf_counter()
+            list(queryset.all())
+            latencies.append(time.perf_counter() - started)
+        return latencies
@@ -0,0 +1,52 @@
+"""
+Link participants to the user accounts registered under their email.
+
+    python manage.py link_participants [--chunk-size 1000]
+
+New users are linked to their invitations when they register, but
+participants invited before that hook existed, users created in bulk
+(``import_users``) and invitations sent to already registered users
+without a ``user`` stay unlinked.  Run this once after migrating and
+then nightly.  Users are walked in primary-key chunks, each linked
+with one UPDATE in its own transaction; emails are compared
+case-insensitively and the earliest registered account wins.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from meetings.utils.linking import link_participants
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Set Participant.user for invitations matching a user's email."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        linked = 0
+        last_pk = 0
+        while True:
+            users = list(
+                User.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", "email")[:chunk_size]
+            )
+            if not users:
+                break
+            last_pk = users[-1][0]
+            users_by_email = {}
+            for pk, email in users:
+                users_by_email.setdefault(email.lower(), pk)
+            linked += link_participants(users_by_email)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Linked {linked} participants.")
+        )
@@ -0,0 +1,40 @@
+"""
+Delete changes-feed tombstones older than the retention window.
+
+    python manage.py prune_tombstones [--chunk-size 5000]
+
+Run it daily.  Rows are deleted in primary-key chunks, each its own
+short transaction, so the job never holds long locks.
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from meetings.models import Tombstone
+from meetings.utils.sync import tombstone_retention
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones older than MEETINGS_TOMBSTONE_RETENTION_DAYS."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        cutoff = timezone.now() - tombstone_retention()
+
+        deleted = 0
+        while True:
+            ids = list(
+                Tombstone.objects.filter(deleted_at__lt=cutoff)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            deleted += Tombstone.objects.filter(pk__in=ids).delete()[0]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} tombstones.")
+        )
@@ -0,0 +1,45 @@
+"""
+Rebuild the per-user agenda table from meetings and participants.
+
+    python manage.py rebuild_agenda [--chunk-size 1000]
+
+Signals and the bulk helpers keep ``UserAgendaEntry`` in step, but raw
+queryset updates or manual SQL bypass them.  This walks meetings in
+primary-key order and replaces each chunk's entries in its own
+transaction, so it can run against a live database.
+"""
+
+from django.core.management.base import BaseCommand
+
+from meetings.models import Meeting
+from meetings.utils.agenda import rebuild_agenda
+
+
+class Command(BaseCommand):
+    help = "Repopulate UserAgendaEntry from Meeting and Participant rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+
+        meetings = entries = 0
+        last_pk = None
+        while True:
+            ids = Meeting.objects.order_by("pk")
+            if last_pk is not None:
+                ids = ids.filter(pk__gt=last_pk)
+            ids = list(ids.values_list("pk", flat=True)[:chunk_size])
+            if not ids:
+                break
+            last_pk = ids[-1]
+            meetings += len(ids)
+            entries += rebuild_agenda(ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {entries} agenda entries for {meetings} "
+                "meetings."
+            )
+        )
@@ -0,0 +1,91 @@
+"""
+Repair drift in the denormalised Meeting RSVP counters.
+
+    python manage.py reconcile_rsvp_counts [--chunk-size 1000] [--dry-run]
+
+The counters are kept in step by Participant.save()/delete() and the
+bulk helpers, but raw queryset deletes or manual SQL bypass those.
+This walks meetings in primary-key order, recounts each chunk's
+participants in one aggregate query and rewrites only the meetings
+whose counters are wrong.  Each chunk's meetings are row-locked while
+they are recounted, so concurrent RSVP changes are not lost.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+
+from meetings.models import Meeting, Participant
+
+COUNTER_FIELDS = list(Participant.COUNTER_FIELDS.values())
+
+
+class Command(BaseCommand):
+    help = "Recompute Meeting RSVP counters from Participant rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        dry_run = options["dry_run"]
+        actual = {
+            f"actual_{field}": Count(
+                "participants", filter=Q(participants__status=status)
+            )
+            for status, field in Participant.COUNTER_FIELDS.items()
+        }
+
+        checked = repaired = 0
+        last_pk = None
+        while True:
+            ids = Meeting.objects.order_by("pk")
+            if last_pk is not None:
+                ids = ids.filter(pk__gt=last_pk)
+            ids = list(ids.values_list("pk", flat=True)[:chunk_size])
+            if not ids:
+                break
+            last_pk = ids[-1]
+            checked += len(ids)
+
+            with transaction.atomic():
+                list(
+                    Meeting.objects.select_for_update()
+                    .filter(pk__in=ids)
+                    .values_list("pk", flat=True)
+                )
+                rows = (
+                    Meeting.objects.filter(pk__in=ids)
+                    .order_by()
+                    .annotate(**actual)
+                    .values("pk", *COUNTER_FIELDS, *actual)
+                )
+                drifted = [
+                    Meeting(
+                        pk=row["pk"],
+                        **{
+                            field: row[f"actual_{field}"]
+                            for field in COUNTER_FIELDS
+                        },
+                    )
+                    for row in rows
+                    if any(
+                        row[field] != row[f"actual_{field}"]
+                        for field in COUNTER_FIELDS
+                    )
+                ]
+                if drifted and not dry_run:
+                    Meeting.objects.bulk_update(drifted, COUNTER_FIELDS)
+            repaired += len(drifted)
+
+        verb = "would repair" if dry_run else "repaired"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} meetings, {verb} {repaired}."
+            )
+        )
@@ -0,0 +1,92 @@
+"""
+Rebuild the daily analytics rollups from meetings and participants.
+
+    python manage.py rollup_meeting_stats [--from-date YYYY-MM-DD]
+        [--to-date YYYY-MM-DD] [--chunk-days 31]
+
+Signals and the bulk helpers roll up each day a write touches, but raw
+queryset updates or manual SQL bypass them.  Run this nightly from
+cron, and once after migrating to fill the tables.  Without dates it
+covers every day from the first meeting to the last; each chunk of
+days is recomputed in its own transaction, so it can run against a
+live database.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django.utils.dateparse import parse_date
+
+from meetings.models import DailyMeetingStats, DailyParticipantLoad, Meeting
+from meetings.utils.analytics import meeting_day, rollup_range
+
+
+class Command(BaseCommand):
+    help = "Recompute DailyMeetingStats and DailyParticipantLoad rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from-date")
+        parser.add_argument("--to-date")
+        parser.add_argument("--chunk-days", type=int, default=31)
+
+    def handle(self, *args, **options):
+        if options["chunk_days"] < 1:
+            raise CommandError("--chunk-days must be at least 1.")
+        first_day = self.parse_day(options["from_date"], "--from-date")
+        last_day = self.parse_day(options["to_date"], "--to-date")
+
+        if first_day is None or last_day is None:
+            span = Meeting.objects.aggregate(
+                first=Min("start_time"), last=Max("start_time")
+            )
+            if span["first"] is None:
+                self.clear(None, None)
+                self.stdout.write("No meetings to roll up.")
+                return
+            if first_day is None:
+                first_day = meeting_day(span["first"])
+                # Nothing starts before the first meeting any more.
+                self.clear(None, first_day)
+            if last_day is None:
+                last_day = meeting_day(span["last"])
+                self.clear(last_day, None)
+        if last_day < first_day:
+            raise CommandError("--to-date must not be before --from-date.")
+
+        days = 0
+        chunk = timedelta(days=options["chunk_days"] - 1)
+        start = first_day
+        while start <= last_day:
+            end = min(start + chunk, last_day)
+            days += rollup_range(start, end)
+            start = end + timedelta(days=1)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rolled up {days} days from {first_day} to {last_day}."
+            )
+        )
+
+    @staticmethod
+    def parse_day(raw, option):
+        if raw is None:
+            return None
+        try:
+            day = parse_date(raw)
+        except ValueError:
+            day = None
+        if day is None:
+            raise CommandError(f"{option} must be a YYYY-MM-DD date.")
+        return day
+
+    @staticmethod
+    def clear(after, before):
+        """Drop rollups strictly after ``after`` / before ``before``."""
+        for model in (DailyMeetingStats, DailyParticipantLoad):
+            rows = model.objects.all()
+            if after is not None:
+                rows = rows.filter(day__gt=after)
+            if before is not None:
+                rows = rows.filter(day__lt=before)
+            rows.delete()
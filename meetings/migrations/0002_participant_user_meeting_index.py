@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['user', 'meeting'], name='meetings_pa_user_id_0f02a9_idx'),
+        ),
+    ]
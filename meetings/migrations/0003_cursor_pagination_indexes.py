@@ -0,0 +1,25 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0002_participant_user_meeting_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['start_time', 'id'], name='meetings_me_start_t_af171c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meetingnotification',
+            index=models.Index(fields=['meeting', 'sent_at', 'id'], name='meetings_me_meeting_3b7d79_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['meeting', 'invited_at', 'id'], name='meetings_pa_meeting_e956c4_idx'),
+        ),
+    ]
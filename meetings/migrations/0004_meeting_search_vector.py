@@ -0,0 +1,79 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:07
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Title outranks location, which outranks description.
+SEARCH_DOCUMENT = """
+    setweight(to_tsvector('english', coalesce({row}title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce({row}location, '')), 'B')
+    || setweight(to_tsvector('english', coalesce({row}description, '')), 'C')
+"""
+
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+    """
+    CREATE OR REPLACE FUNCTION meetings_meeting_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {document};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """.format(document=SEARCH_DOCUMENT.format(row="NEW.")),
+    """
+    CREATE TRIGGER meetings_meeting_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, location, description, search_vector
+    ON meetings_meeting
+    FOR EACH ROW EXECUTE FUNCTION meetings_meeting_search_vector_update();
+    """,
+    "UPDATE meetings_meeting SET search_vector = {document};".format(
+        document=SEARCH_DOCUMENT.format(row="")
+    ),
+    """
+    CREATE INDEX meetings_meeting_search_vector_gin
+    ON meetings_meeting USING gin (search_vector);
+    """,
+    """
+    CREATE INDEX meetings_meeting_title_trgm
+    ON meetings_meeting USING gin (title gin_trgm_ops);
+    """,
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS meetings_meeting_title_trgm;",
+    "DROP INDEX IF EXISTS meetings_meeting_search_vector_gin;",
+    """
+    DROP TRIGGER IF EXISTS meetings_meeting_search_vector_trigger
+    ON meetings_meeting;
+    """,
+    "DROP FUNCTION IF EXISTS meetings_meeting_search_vector_update();",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0003_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            _run_on_postgres(FORWARD_SQL),
+            _run_on_postgres(BACKWARD_SQL),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:16
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+COUNTER_FIELDS = {
+    'invited': 'invited_count',
+    'accepted': 'accepted_count',
+    'declined': 'declined_count',
+    'tentative': 'tentative_count',
+}
+
+
+def backfill_counts(apps, schema_editor):
+    Meeting = apps.get_model('meetings', 'Meeting')
+    Participant = apps.get_model('meetings', 'Participant')
+    changes = {}
+    for status, field in COUNTER_FIELDS.items():
+        counts = (
+            Participant.objects.filter(meeting=OuterRef('pk'), status=status)
+            .order_by()
+            .values('meeting')
+            .annotate(n=Count('id'))
+            .values('n')
+        )
+        changes[field] = Coalesce(
+            Subquery(counts, output_field=IntegerField()), 0
+        )
+    Meeting.objects.update(**changes)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0005_participant_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='accepted_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='declined_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='invited_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='tentative_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
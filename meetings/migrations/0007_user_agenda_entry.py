@@ -0,0 +1,96 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:19
+
+from itertools import islice
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import F
+
+BATCH_SIZE = 1000
+
+
+def _insert(model, entries, **kwargs):
+    # bulk_create() materialises its input, so feed it one batch at a
+    # time to keep memory flat on large tables.
+    while True:
+        batch = list(islice(entries, BATCH_SIZE))
+        if not batch:
+            return
+        model.objects.bulk_create(batch, **kwargs)
+
+
+def backfill_agenda(apps, schema_editor):
+    Meeting = apps.get_model('meetings', 'Meeting')
+    Participant = apps.get_model('meetings', 'Participant')
+    UserAgendaEntry = apps.get_model('meetings', 'UserAgendaEntry')
+
+    organisers = (
+        UserAgendaEntry(
+            user_id=row['created_by_id'],
+            meeting_id=row['pk'],
+            start_time=row['start_time'],
+            end_time=row['end_time'],
+            status=row['status'],
+            role='organizer',
+        )
+        for row in Meeting.objects.values(
+            'pk', 'created_by_id', 'start_time', 'end_time', 'status'
+        ).iterator()
+    )
+    _insert(UserAgendaEntry, organisers)
+
+    participants = (
+        UserAgendaEntry(
+            user_id=row['user_id'],
+            meeting_id=row['meeting_id'],
+            start_time=row['meeting__start_time'],
+            end_time=row['meeting__end_time'],
+            status=row['meeting__status'],
+            role='participant',
+        )
+        for row in Participant.objects.filter(user__isnull=False)
+        .exclude(user=F('meeting__created_by'))
+        .values(
+            'user_id',
+            'meeting_id',
+            'meeting__start_time',
+            'meeting__end_time',
+            'meeting__status',
+        )
+        .iterator()
+    )
+    # A user linked through two participant rows gets one entry.
+    _insert(UserAgendaEntry, participants, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('meetings', '0006_meeting_rsvp_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserAgendaEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField()),
+                ('role', models.CharField(choices=[('organizer', 'Organizer'), ('participant', 'Participant')], max_length=20)),
+                ('status', models.CharField(choices=[('scheduled', 'Scheduled'), ('cancelled', 'Cancelled'), ('completed', 'Completed')], max_length=20)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='agenda_entries', to='meetings.meeting')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='agenda_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['start_time'],
+                'indexes': [models.Index(fields=['user', 'start_time'], name='meetings_us_user_id_86d342_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='useragendaentry',
+            constraint=models.UniqueConstraint(fields=('user', 'meeting'), name='unique_agenda_entry'),
+        ),
+        migrations.RunPython(backfill_agenda, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0008_changes_feed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(condition=models.Q(('status', 'scheduled')), fields=['end_time', 'start_time'], name='meeting_scheduled_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0009_scheduled_meeting_partial_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMeetingStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True)),
+                ('meetings', models.IntegerField(default=0)),
+                ('cancelled', models.IntegerField(default=0)),
+                ('busy_minutes', models.IntegerField(default=0)),
+                ('attendee_minutes', models.IntegerField(default=0)),
+                ('invited', models.IntegerField(default=0)),
+                ('accepted', models.IntegerField(default=0)),
+                ('declined', models.IntegerField(default=0)),
+                ('tentative', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'daily meeting stats',
+                'ordering': ['day'],
+                'permissions': [('view_meeting_analytics', 'Can view meeting analytics')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyParticipantLoad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('email', models.EmailField(max_length=254)),
+                ('invitations', models.IntegerField(default=0)),
+                ('accepted', models.IntegerField(default=0)),
+                ('declined', models.IntegerField(default=0)),
+                ('busy_minutes', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['day', 'email'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyparticipantload',
+            constraint=models.UniqueConstraint(fields=('day', 'email'), name='unique_participant_load'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0010_meeting_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Resource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150, unique=True)),
+                ('kind', models.CharField(choices=[('room', 'Room'), ('equipment', 'Equipment')], default='room', max_length=20)),
+                ('capacity', models.PositiveIntegerField(default=1)),
+                ('description', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['kind', 'capacity'], name='meetings_re_kind_0c6ea7_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='resources',
+            field=models.ManyToManyField(blank=True, related_name='meetings', to='meetings.resource'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-19 06:53
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0011_resources'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(django.db.models.functions.text.Lower('email'), condition=models.Q(('user__isnull', True)), name='participant_unlinked_email'),
+        ),
+    ]
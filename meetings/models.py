@@ -1,11 +1,45 @@
 import uuid
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
+class Resource(models.Model):
+    """A bookable room or piece of equipment."""
+
+    KIND_ROOM = "room"
+    KIND_EQUIPMENT = "equipment"
+
+    KIND_CHOICES = [
+        (KIND_ROOM, "Room"),
+        (KIND_EQUIPMENT, "Equipment"),
+    ]
+
+    name = models.CharField(max_length=150, unique=True)
+    kind = models.CharField(
+        max_length=20, choices=KIND_CHOICES, default=KIND_ROOM
+    )
+    # Seats for a room, units for equipment.
+    capacity = models.PositiveIntegerField(default=1)
+    description = models.TextField(blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["name"]
+        indexes = [
+            models.Index(fields=["kind", "capacity"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_kind_display()}, {self.capacity})"
+
+
 class Meeting(models.Model):
     """Represents a scheduled meeting created by a user."""
 
@@ -37,19 +71,73 @@ class Meeting(models.Model):
         on_delete=models.CASCADE,
         related_name="created_meetings",
     )
+    # Booked rooms and equipment.  Assign through
+    # ``MeetingCreateSerializer`` or the bulk helpers, which reject
+    # double bookings; see ``utils.conflict_detector``.
+    resources = models.ManyToManyField(
+        Resource, blank=True, related_name="meetings"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Denormalised RSVP counters, adjusted with F() expressions in the
+    # same transaction as every participant insert, delete and status
+    # change.  ``manage.py reconcile_rsvp_counts`` repairs any drift.
+    invited_count = models.IntegerField(default=0, editable=False)
+    accepted_count = models.IntegerField(default=0, editable=False)
+    declined_count = models.IntegerField(default=0, editable=False)
+    tentative_count = models.IntegerField(default=0, editable=False)
+
+    # Weighted title/location/description document, maintained by a
+    # PostgreSQL trigger (see migration 0004).  Always NULL elsewhere.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["start_time"]
         indexes = [
             models.Index(fields=["start_time", "end_time"]),
+            models.Index(fields=["start_time", "id"]),
             models.Index(fields=["created_by"]),
+            models.Index(fields=["updated_at"]),
+            # Only live meetings: conflict checks and the
+            # complete_past_meetings job never scan finished ones.
+            models.Index(
+                fields=["end_time", "start_time"],
+                condition=models.Q(status="scheduled"),
+                name="meeting_scheduled_idx",
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} ({self.start_time:%Y-%m-%d %H:%M})"
 
+    RSVP_COUNTER_FIELDS = (
+        "invited_count",
+        "accepted_count",
+        "declined_count",
+        "tentative_count",
+    )
+
+    def save(self, *args, **kwargs):
+        """
+        Save without writing back the RSVP counters.
+
+        The in-memory counters of an instance loaded before a
+        participant change are stale, so an UPDATE of every field
+        would undo the F() adjustments made since.  Unless the caller
+        names them in ``update_fields``, they are set to themselves
+        in the UPDATE and reloaded afterwards.
+        """
+        update_fields = kwargs.get("update_fields")
+        if self._state.adding or update_fields is not None:
+            return super().save(*args, **kwargs)
+        for name in self.RSVP_COUNTER_FIELDS:
+            setattr(self, name, F(name))
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self.refresh_from_db(fields=self.RSVP_COUNTER_FIELDS)
+
     def clean(self):
         if self.start_time and self.end_time:
             if self.start_time >= self.end_time:
@@ -76,6 +164,22 @@ class Meeting(models.Model):
         self.status = self.STATUS_CANCELLED
         self.save(update_fields=["status", "updated_at"])
 
+    @staticmethod
+    def adjust_rsvp_counts(meeting_id, deltas):
+        """
+        Atomically add ``deltas`` (participant status -> change) to the
+        meeting's RSVP counters with a single UPDATE.
+        """
+        changes = {
+            Participant.COUNTER_FIELDS[status]: (
+                F(Participant.COUNTER_FIELDS[status]) + delta
+            )
+            for status, delta in deltas.items()
+            if delta
+        }
+        if changes:
+            Meeting.objects.filter(pk=meeting_id).update(**changes)
+
 
 class Participant(models.Model):
     """A person invited to a meeting, identified by email."""
@@ -92,6 +196,14 @@ class Participant(models.Model):
         (STATUS_TENTATIVE, "Tentative"),
     ]
 
+    # Meeting counter column for each status.
+    COUNTER_FIELDS = {
+        STATUS_INVITED: "invited_count",
+        STATUS_ACCEPTED: "accepted_count",
+        STATUS_DECLINED: "declined_count",
+        STATUS_TENTATIVE: "tentative_count",
+    }
+
     meeting = models.ForeignKey(
         Meeting,
         on_delete=models.CASCADE,
@@ -113,27 +225,242 @@ class Participant(models.Model):
     )
     invited_at = models.DateTimeField(auto_now_add=True)
     responded_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("meeting", "email")
         ordering = ["invited_at"]
+        indexes = [
+            models.Index(fields=["user", "meeting"]),
+            models.Index(fields=["meeting", "invited_at", "id"]),
+            models.Index(fields=["meeting", "updated_at"]),
+            # Finds the invitations to link when a user registers.
+            models.Index(
+                Lower("email"),
+                condition=models.Q(user__isnull=True),
+                name="participant_unlinked_email",
+            ),
+        ]
 
     def __str__(self):
         return (
             f"{self.email} -> {self.meeting.title} [{self.status}]"
         )
 
+    def save(self, *args, **kwargs):
+        """Save and keep the meeting's RSVP counters in step."""
+        update_fields = kwargs.get("update_fields")
+        creating = self._state.adding
+        with transaction.atomic():
+            previous = None
+            if not creating and (
+                update_fields is None or "status" in update_fields
+            ):
+                previous = (
+                    Participant.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("status", flat=True)
+                    .first()
+                )
+            super().save(*args, **kwargs)
+
+            if creating:
+                Meeting.adjust_rsvp_counts(
+                    self.meeting_id, {self.status: 1}
+                )
+            elif previous and previous != self.status:
+                Meeting.adjust_rsvp_counts(
+                    self.meeting_id, {previous: -1, self.status: 1}
+                )
+
     def accept(self):
         """Record an accepted RSVP."""
         self.status = self.STATUS_ACCEPTED
         self.responded_at = timezone.now()
-        self.save(update_fields=["status", "responded_at"])
+        self.save(
+            update_fields=["status", "responded_at", "updated_at"]
+        )
 
     def decline(self):
         """Record a declined RSVP."""
         self.status = self.STATUS_DECLINED
         self.responded_at = timezone.now()
-        self.save(update_fields=["status", "responded_at"])
+        self.save(
+            update_fields=["status", "responded_at", "updated_at"]
+        )
+
+
+class UserAgendaEntry(models.Model):
+    """
+    One row per (user, meeting) the user can see, denormalised from
+    ``Meeting.created_by`` and ``Participant.user``.
+
+    User-scoped reads become a range scan on (user, start_time)
+    instead of a union of ownership and participation.  Rows are
+    maintained by the signals in ``meetings.signals`` and the bulk
+    helpers; ``manage.py rebuild_agenda`` repopulates the table.
+    """
+
+    ROLE_ORGANIZER = "organizer"
+    ROLE_PARTICIPANT = "participant"
+
+    ROLE_CHOICES = [
+        (ROLE_ORGANIZER, "Organizer"),
+        (ROLE_PARTICIPANT, "Participant"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="agenda_entries",
+    )
+    meeting = models.ForeignKey(
+        Meeting,
+        on_delete=models.CASCADE,
+        related_name="agenda_entries",
+    )
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES)
+    status = models.CharField(
+        max_length=20, choices=Meeting.STATUS_CHOICES
+    )
+
+    class Meta:
+        ordering = ["start_time"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "meeting"],
+                name="unique_agenda_entry",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "start_time"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.meeting_id} [{self.role}]"
+
+
+class Tombstone(models.Model):
+    """
+    Record of a deleted meeting or participant, kept per user who could
+    see it so the changes feed can tell clients what to drop.
+
+    Tombstones older than ``MEETINGS_TOMBSTONE_RETENTION_DAYS`` are
+    removed by ``manage.py prune_tombstones``; clients whose cursor is
+    older than that must do a full refresh.
+    """
+
+    TYPE_MEETING = "meeting"
+    TYPE_PARTICIPANT = "participant"
+
+    TYPE_CHOICES = [
+        (TYPE_MEETING, "Meeting"),
+        (TYPE_PARTICIPANT, "Participant"),
+    ]
+
+    # No database constraint: deleting a user cascades to their
+    # meetings, whose tombstones are written while the user row is
+    # still being removed.  Orphans age out with the rest.
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="tombstones",
+    )
+    object_type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    object_id = models.CharField(max_length=64)
+    # Plain column rather than a FK: the meeting may be gone.
+    meeting_id = models.UUIDField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["deleted_at"]
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),
+            models.Index(fields=["deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.object_type} {self.object_id} (user {self.user_id})"
+
+    @classmethod
+    def record(cls, user_ids, object_type, object_id, meeting_id):
+        """Write one tombstone for each of ``user_ids``."""
+        now = timezone.now()
+        cls.objects.bulk_create(
+            cls(
+                user_id=user_id,
+                object_type=object_type,
+                object_id=str(object_id),
+                meeting_id=meeting_id,
+                deleted_at=now,
+            )
+            for user_id in set(user_ids)
+        )
+
+
+class DailyMeetingStats(models.Model):
+    """
+    Org-wide meeting load for one day, rolled up from the meetings
+    that start on it.  Cancelled meetings only count towards
+    ``cancelled``.
+
+    Maintained by ``meetings.utils.analytics``; days are recomputed
+    whole after every write that touches them, and
+    ``manage.py rollup_meeting_stats`` rebuilds any range.
+    """
+
+    day = models.DateField(unique=True)
+    meetings = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+    # Sum of meeting durations.
+    busy_minutes = models.IntegerField(default=0)
+    # Sum over participants who have not declined: person-minutes.
+    attendee_minutes = models.IntegerField(default=0)
+    invited = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    declined = models.IntegerField(default=0)
+    tentative = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["day"]
+        verbose_name_plural = "daily meeting stats"
+        permissions = [
+            ("view_meeting_analytics", "Can view meeting analytics"),
+        ]
+
+    def __str__(self):
+        return f"{self.day}: {self.meetings} meetings"
+
+
+class DailyParticipantLoad(models.Model):
+    """
+    One participant's invitations on one day, keyed by email like
+    ``Participant`` itself.  Rows are replaced whenever their day is
+    rolled up; see ``DailyMeetingStats``.
+    """
+
+    day = models.DateField()
+    email = models.EmailField()
+    invitations = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    declined = models.IntegerField(default=0)
+    # Time in the meetings they have not declined.
+    busy_minutes = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["day", "email"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "email"],
+                name="unique_participant_load",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day}: {self.email}"
 
 
 class MeetingNotification(models.Model):
@@ -174,6 +501,9 @@ class MeetingNotification(models.Model):
 
     class Meta:
         ordering = ["-sent_at"]
+        indexes = [
+            models.Index(fields=["meeting", "sent_at", "id"]),
+        ]
 
     def __str__(self):
         return (
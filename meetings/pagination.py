@@ -0,0 +1,54 @@
+"""
+Cursor (keyset) pagination classes for the meetings API.
+
+Cursor pagination seeks straight to the last row of the previous page
+via ``WHERE (ordering) > cursor`` instead of ``OFFSET``, so deep pages
+cost the same as the first one.  Each ordering below is backed by a
+matching composite index on the model, and ends with ``id`` so rows
+sharing a timestamp still page deterministically.
+"""
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
+
+from .filters import SEARCH_RANK
+
+
+class MeetingCursorPagination(CursorPagination):
+    """
+    Pages meetings in (start_time, id) order.
+
+    Full-text search results are paged best match first unless the
+    client asked for an explicit ``?ordering=``.
+    """
+
+    ordering = ("start_time", "id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def get_ordering(self, request, queryset, view):
+        ranked = SEARCH_RANK in queryset.query.annotations
+        if ranked and not request.query_params.get(
+            api_settings.ORDERING_PARAM
+        ):
+            return (f"-{SEARCH_RANK}", "id")
+        return super().get_ordering(request, queryset, view)
+
+
+class ParticipantCursorPagination(CursorPagination):
+    """Pages participants of one meeting in (invited_at, id) order."""
+
+    ordering = ("invited_at", "id")
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class NotificationCursorPagination(CursorPagination):
+    """Pages a meeting's notification log newest-first."""
+
+    ordering = ("-sent_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
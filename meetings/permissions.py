@@ -0,0 +1,39 @@
+"""
+Permission classes for the meetings API.
+"""
+
+from rest_framework.permissions import SAFE_METHODS, BasePermission
+
+
+class CanViewMeetingAnalytics(BasePermission):
+    """
+    Org-wide analytics are for users whose roles grant
+    ``meetings.view_meeting_analytics`` (and superusers).
+    """
+
+    message = "You do not have permission to view meeting analytics."
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(
+            user
+            and user.is_authenticated
+            and user.has_perm("meetings.view_meeting_analytics")
+        )
+
+
+class CanManageResources(BasePermission):
+    """
+    Anyone signed in may list rooms and equipment; adding them needs
+    ``meetings.add_resource`` from one of the user's roles.
+    """
+
+    message = "You do not have permission to manage resources."
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not (user and user.is_authenticated):
+            return False
+        if request.method in SAFE_METHODS:
+            return True
+        return user.has_perm("meetings.add_resource")
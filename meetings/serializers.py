@@ -1,8 +1,12 @@
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
-from .models import Meeting, Participant, MeetingNotification
-from .utils.conflict_detector import check_participants_conflicts
+from .models import Meeting, Participant, MeetingNotification, Resource
+from .utils.conflict_detector import (
+    check_participants_conflicts,
+    check_resource_conflicts,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +47,25 @@ class ParticipantCreateSerializer(serializers.ModelSerializer):
         return value.lower().strip()
 
 
+class ParticipantBulkInviteSerializer(serializers.Serializer):
+    """
+    Request body for the bulk participant invite endpoint.
+    POST /api/meetings/{meeting_id}/participants/bulk/
+    """
+
+    MAX_EMAILS = 1000
+
+    emails = serializers.ListField(
+        child=serializers.EmailField(),
+        min_length=1,
+        max_length=MAX_EMAILS,
+    )
+
+    def validate_emails(self, value):
+        # Lower-case and de-duplicate while keeping the given order.
+        return list(dict.fromkeys(e.lower().strip() for e in value))
+
+
 class ParticipantStatusSerializer(serializers.Serializer):
     """Payload for updating a participant's RSVP status."""
 
@@ -52,6 +75,75 @@ class ParticipantStatusSerializer(serializers.Serializer):
     )
 
 
+class ParticipantStatusItemSerializer(ParticipantStatusSerializer):
+    """One entry of a bulk RSVP update."""
+
+    id = serializers.IntegerField(help_text="Participant id.")
+
+
+class ParticipantBulkStatusSerializer(serializers.Serializer):
+    """
+    Request body for the bulk RSVP endpoint.
+    PATCH /api/meetings/participants/bulk-status/
+    """
+
+    MAX_UPDATES = 1000
+
+    updates = ParticipantStatusItemSerializer(many=True)
+
+    def validate_updates(self, value):
+        if not value:
+            raise serializers.ValidationError(
+                "Provide at least one update."
+            )
+        if len(value) > self.MAX_UPDATES:
+            raise serializers.ValidationError(
+                f"At most {self.MAX_UPDATES} updates per request."
+            )
+        return value
+
+
+# ---------------------------------------------------------------------------
+# Resource serializers
+# ---------------------------------------------------------------------------
+
+class ResourceSerializer(serializers.ModelSerializer):
+    """A bookable room or piece of equipment."""
+
+    class Meta:
+        model = Resource
+        fields = [
+            "id",
+            "name",
+            "kind",
+            "capacity",
+            "description",
+            "is_active",
+        ]
+        read_only_fields = ["id"]
+
+
+class ResourceAvailabilityQuerySerializer(serializers.Serializer):
+    """
+    Query parameters for the free-resources endpoint.
+    GET /api/resources/available/
+    """
+
+    start_time = serializers.DateTimeField()
+    end_time = serializers.DateTimeField()
+    min_capacity = serializers.IntegerField(min_value=1, default=1)
+    kind = serializers.ChoiceField(
+        choices=Resource.KIND_CHOICES, required=False
+    )
+
+    def validate(self, attrs):
+        if attrs["start_time"] >= attrs["end_time"]:
+            raise serializers.ValidationError(
+                "end_time must be after start_time."
+            )
+        return attrs
+
+
 # ---------------------------------------------------------------------------
 # Meeting serializers
 # ---------------------------------------------------------------------------
@@ -75,18 +167,29 @@ class MeetingListSerializer(serializers.ModelSerializer):
             "end_time",
             "status",
             "participant_count",
+            "invited_count",
+            "accepted_count",
+            "declined_count",
+            "tentative_count",
             "created_by_email",
             "duration_minutes",
         ]
 
     def get_participant_count(self, obj):
-        return obj.participants.count()
+        # Prefer the Count() annotation added by the list view.
+        count = getattr(obj, "participant_count", None)
+        if count is None:
+            count = obj.participants.count()
+        return count
 
 
 class MeetingDetailSerializer(serializers.ModelSerializer):
     """Full meeting representation with nested participants."""
 
     participants = ParticipantSerializer(many=True, read_only=True)
+    resources = serializers.PrimaryKeyRelatedField(
+        many=True, read_only=True
+    )
     created_by_email = serializers.EmailField(
         source="created_by.email", read_only=True
     )
@@ -106,6 +209,11 @@ class MeetingDetailSerializer(serializers.ModelSerializer):
             "created_by",
             "created_by_email",
             "participants",
+            "resources",
+            "invited_count",
+            "accepted_count",
+            "declined_count",
+            "tentative_count",
             "duration_minutes",
             "is_upcoming",
             "created_at",
@@ -125,6 +233,12 @@ class MeetingCreateSerializer(serializers.ModelSerializer):
     participants = ParticipantCreateSerializer(
         many=True, required=False
     )
+    resources = serializers.PrimaryKeyRelatedField(
+        many=True,
+        required=False,
+        queryset=Resource.objects.filter(is_active=True),
+        help_text="Ids of the rooms and equipment to book.",
+    )
 
     class Meta:
         model = Meeting
@@ -136,6 +250,7 @@ class MeetingCreateSerializer(serializers.ModelSerializer):
             "end_time",
             "status",
             "participants",
+            "resources",
         ]
 
     def validate(self, attrs):
@@ -154,27 +269,94 @@ class MeetingCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         participants_data = validated_data.pop("participants", [])
-        meeting = Meeting.objects.create(**validated_data)
-
-        for p_data in participants_data:
-            Participant.objects.get_or_create(
-                meeting=meeting,
-                email=p_data["email"],
-                defaults={
-                    "name": p_data.get("name", ""),
-                    "user": p_data.get("user"),
-                },
-            )
+        resources = validated_data.pop("resources", [])
+        with transaction.atomic():
+            meeting = Meeting.objects.create(**validated_data)
+            if resources:
+                self.book_resources(meeting, resources)
+
+            for p_data in participants_data:
+                Participant.objects.get_or_create(
+                    meeting=meeting,
+                    email=p_data["email"],
+                    defaults={
+                        "name": p_data.get("name", ""),
+                        "user": p_data.get("user"),
+                    },
+                )
         return meeting
 
     def update(self, instance, validated_data):
         # Participants are managed through the dedicated endpoint.
         validated_data.pop("participants", None)
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        resources = validated_data.pop("resources", None)
+        rescheduled = bool(
+            {"start_time", "end_time", "status"} & set(validated_data)
+        )
+        with transaction.atomic():
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save()
+            if resources is not None:
+                self.book_resources(instance, resources)
+            elif rescheduled:
+                # The resources already booked must be free at the new
+                # time too.
+                self.book_resources(instance, instance.resources.all())
         return instance
 
+    @staticmethod
+    def book_resources(meeting, resources):
+        """
+        Book ``resources`` for ``meeting``, replacing its previous
+        bookings.  Raises a ValidationError listing the conflicting
+        meetings if any resource is already taken.  Must run inside a
+        transaction.
+        """
+        resource_ids = sorted({resource.pk for resource in resources})
+        # Lock the resources so concurrent bookings of the same one are
+        # checked one after the other.
+        list(
+            Resource.objects.select_for_update()
+            .filter(pk__in=resource_ids)
+            .values_list("pk", flat=True)
+        )
+        if meeting.status == Meeting.STATUS_SCHEDULED:
+            conflicts = check_resource_conflicts(
+                resource_ids,
+                meeting.start_time,
+                meeting.end_time,
+                exclude_meeting_id=meeting.pk,
+            )
+            if conflicts:
+                raise serializers.ValidationError(
+                    {
+                        "resources": "Already booked at this time.",
+                        "conflicts": conflicts,
+                    }
+                )
+        meeting.resources.set(resource_ids)
+
+
+class MeetingBulkCreateSerializer(serializers.Serializer):
+    """
+    Request body for the bulk meeting creation endpoint.
+    POST /api/meetings/bulk/
+
+    Each item is validated separately with MeetingCreateSerializer so
+    one bad item, even one that is not an object, does not reject the
+    whole batch; only the list itself is checked here.
+    """
+
+    MAX_MEETINGS = 500
+
+    meetings = serializers.ListField(
+        child=serializers.JSONField(allow_null=True),
+        min_length=1,
+        max_length=MAX_MEETINGS,
+        help_text="Meeting objects in the POST /api/meetings/ format.",
+    )
+
 
 # ---------------------------------------------------------------------------
 # Conflict check serializer
@@ -204,6 +386,165 @@ class ConflictCheckSerializer(serializers.Serializer):
         return attrs
 
 
+# ---------------------------------------------------------------------------
+# Calendar summary serializers
+# ---------------------------------------------------------------------------
+
+class CalendarSummaryQuerySerializer(serializers.Serializer):
+    """
+    Query parameters for the calendar summary endpoint.
+    GET /api/meetings/calendar/
+    """
+
+    BUCKET_CHOICES = ["day", "week", "month"]
+    MAX_RANGE_DAYS = 366
+
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+    bucket = serializers.ChoiceField(
+        choices=BUCKET_CHOICES, default="day"
+    )
+
+    def validate(self, attrs):
+        span = (attrs["to_date"] - attrs["from_date"]).days
+        if span < 0:
+            raise serializers.ValidationError(
+                "to_date must not be before from_date."
+            )
+        if span >= self.MAX_RANGE_DAYS:
+            raise serializers.ValidationError(
+                f"Range cannot exceed {self.MAX_RANGE_DAYS} days."
+            )
+        return attrs
+
+
+class CalendarBucketSerializer(serializers.Serializer):
+    """One day / week / month bucket of the calendar summary."""
+
+    period = serializers.DateField()
+    count = serializers.IntegerField()
+    busy_minutes = serializers.IntegerField()
+
+
+class CalendarSummarySerializer(serializers.Serializer):
+    """Response body of the calendar summary endpoint."""
+
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+    bucket = serializers.CharField()
+    buckets = CalendarBucketSerializer(many=True)
+    busy_days = serializers.CharField(
+        help_text=(
+            "One character per day from from_date to to_date: "
+            "'1' if a meeting starts that day, otherwise '0'."
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Changes feed serializers
+# ---------------------------------------------------------------------------
+
+class DeletedRecordsSerializer(serializers.Serializer):
+    """Ids removed since the sync cursor."""
+
+    meetings = serializers.ListField(child=serializers.UUIDField())
+    participants = serializers.ListField(child=serializers.IntegerField())
+
+
+class MeetingChangesSerializer(serializers.Serializer):
+    """
+    Response body of the changes feed.
+    GET /api/meetings/changes/
+    """
+
+    cursor = serializers.CharField(
+        help_text="Pass back as ?since= on the next sync."
+    )
+    meetings = MeetingListSerializer(many=True)
+    participants = ParticipantSerializer(many=True)
+    deleted = DeletedRecordsSerializer()
+
+
+# ---------------------------------------------------------------------------
+# Analytics serializers
+# ---------------------------------------------------------------------------
+
+class MeetingLoadQuerySerializer(CalendarSummaryQuerySerializer):
+    """
+    Query parameters for the meeting load analytics endpoint.
+    GET /api/meetings/analytics/load/
+    """
+
+    bucket = serializers.ChoiceField(
+        choices=CalendarSummaryQuerySerializer.BUCKET_CHOICES,
+        default="week",
+    )
+
+
+class BusiestParticipantsQuerySerializer(CalendarSummaryQuerySerializer):
+    """
+    Query parameters for the busiest participants endpoint.
+    GET /api/meetings/analytics/participants/
+    """
+
+    bucket = None
+    limit = serializers.IntegerField(
+        min_value=1, max_value=100, default=10
+    )
+
+
+class MeetingLoadBucketSerializer(serializers.Serializer):
+    """Org-wide meeting load for one day / week / month."""
+
+    period = serializers.DateField()
+    meetings = serializers.IntegerField()
+    cancelled = serializers.IntegerField()
+    busy_minutes = serializers.IntegerField(
+        help_text="Total length of the meetings."
+    )
+    attendee_minutes = serializers.IntegerField(
+        help_text="Time participants spent in meetings they did not "
+        "decline."
+    )
+    invited = serializers.IntegerField()
+    accepted = serializers.IntegerField()
+    declined = serializers.IntegerField()
+    tentative = serializers.IntegerField()
+    acceptance_rate = serializers.FloatField(
+        allow_null=True,
+        help_text="Accepted share of all invitations; null if none.",
+    )
+
+
+class MeetingLoadSerializer(serializers.Serializer):
+    """Response body of the meeting load analytics endpoint."""
+
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+    bucket = serializers.CharField()
+    buckets = MeetingLoadBucketSerializer(many=True)
+
+
+class ParticipantLoadSerializer(serializers.Serializer):
+    """One participant's meeting load over the requested range."""
+
+    email = serializers.EmailField()
+    invitations = serializers.IntegerField()
+    accepted = serializers.IntegerField()
+    declined = serializers.IntegerField()
+    busy_minutes = serializers.IntegerField()
+    acceptance_rate = serializers.FloatField(allow_null=True)
+
+
+class BusiestParticipantsSerializer(serializers.Serializer):
+    """Response body of the busiest participants endpoint."""
+
+    from_date = serializers.DateField()
+    to_date = serializers.DateField()
+    participants = ParticipantLoadSerializer(many=True)
+
+
 # ---------------------------------------------------------------------------
 # Notification serializer
 # ---------------------------------------------------------------------------
@@ -5,12 +5,42 @@ Automatically sends notification emails when:
 - A participant is added to a meeting (invitation)
 - A meeting is cancelled
 - A scheduled meeting's key details change (update)
+
+Also invalidates cached meeting responses and keeps the per-user
+agenda table in step whenever a meeting or one of its participants is
+saved or deleted, leaves tombstones for the changes feed when either
+is deleted, publishes live events for the event stream and schedules
+the analytics rollups of the days a change touches.  Deleting
+participants, one by one or as a queryset, also decrements the
+meeting's RSVP counters.
+
+A newly registered user is linked to the invitations already sent to
+their email.
 """
 
-from django.db.models.signals import post_save, pre_save
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 
-from .models import Meeting, Participant
+from .models import Meeting, Participant, Tombstone, UserAgendaEntry
+from .utils.agenda import (
+    add_agenda_entries,
+    rebuild_agenda,
+    remove_participant_entry,
+    sync_meeting_entries,
+)
+from .utils import events
+from .utils.analytics import meeting_day, schedule_rollup
+from .utils.cache import bump_meeting_versions, bump_user_versions
+from .utils.events import publish_meeting_event
+from .utils.linking import link_participants
 
 
 @receiver(post_save, sender=Participant)
@@ -64,3 +94,284 @@ def notify_on_meeting_status_change(sender, instance, **kwargs):
         )
         if details_changed:
             notify_all_participants(previous, "update")
+
+
+def _invalidate_meeting_cache(meeting_id, owner_id):
+    """
+    Bump the meeting's cache version and that of every user who can
+    see it (the organiser plus linked participants) once the current
+    transaction commits.
+    """
+    user_ids = [owner_id] + list(
+        Participant.objects.filter(
+            meeting_id=meeting_id, user__isnull=False
+        ).values_list("user_id", flat=True)
+    )
+
+    def bump():
+        bump_meeting_versions([meeting_id])
+        bump_user_versions(user_ids)
+
+    transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=Meeting)
+@receiver(post_delete, sender=Meeting)
+def invalidate_cache_on_meeting_change(sender, instance, **kwargs):
+    _invalidate_meeting_cache(instance.pk, instance.created_by_id)
+
+
+@receiver(post_save, sender=Participant)
+@receiver(post_delete, sender=Participant)
+def invalidate_cache_on_participant_change(sender, instance, **kwargs):
+    if instance.user_id:
+        # Covers a participant who was just removed from the meeting.
+        transaction.on_commit(
+            lambda: bump_user_versions([instance.user_id])
+        )
+
+    owner_id = (
+        Meeting.objects.filter(pk=instance.meeting_id)
+        .values_list("created_by_id", flat=True)
+        .first()
+    )
+    if owner_id is not None:
+        # Otherwise the meeting itself is being deleted and its own
+        # handler takes care of the rest.
+        _invalidate_meeting_cache(instance.meeting_id, owner_id)
+
+
+@receiver(post_save, sender=Meeting)
+def sync_agenda_on_meeting_save(sender, instance, created, **kwargs):
+    """Add the organiser's agenda entry, or refresh times and status."""
+    if created:
+        add_agenda_entries(
+            instance,
+            [instance.created_by_id],
+            UserAgendaEntry.ROLE_ORGANIZER,
+        )
+    else:
+        sync_meeting_entries(instance)
+
+
+@receiver(post_save, sender=Participant)
+def sync_agenda_on_participant_save(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    """Give a linked participant an agenda entry for the meeting."""
+    if created:
+        if instance.user_id:
+            add_agenda_entries(
+                instance.meeting,
+                [instance.user_id],
+                UserAgendaEntry.ROLE_PARTICIPANT,
+            )
+    elif update_fields is None or "user" in update_fields:
+        # The linked user may have changed; re-derive the meeting.
+        rebuild_agenda([instance.meeting_id])
+
+
+@receiver(post_delete, sender=Participant)
+def sync_agenda_on_participant_delete(sender, instance, **kwargs):
+    if instance.user_id:
+        remove_participant_entry(instance.meeting_id, instance.user_id)
+
+
+# ---------------------------------------------------------------------------
+# Tombstones for the changes feed and live events
+# ---------------------------------------------------------------------------
+
+def _agenda_user_ids(meeting_id):
+    return set(
+        UserAgendaEntry.objects.filter(meeting_id=meeting_id).values_list(
+            "user_id", flat=True
+        )
+    )
+
+
+def _deleted_directly(origin, model):
+    """True if a delete signal comes from deleting ``model`` itself."""
+    if isinstance(origin, QuerySet):
+        return origin.model is model
+    return isinstance(origin, model)
+
+
+@receiver(pre_delete, sender=Meeting)
+def record_meeting_deletion(sender, instance, **kwargs):
+    """Tell everyone who could see the meeting that it is gone."""
+    # pre_delete: the agenda entries are cascaded with the meeting.
+    audience = _agenda_user_ids(instance.pk) | {instance.created_by_id}
+    Tombstone.record(
+        audience, Tombstone.TYPE_MEETING, instance.pk, instance.pk
+    )
+    publish_meeting_event(audience, events.MEETING_DELETED, instance.pk)
+
+
+@receiver(post_delete, sender=Participant)
+def record_participant_deletion(sender, instance, origin=None, **kwargs):
+    """
+    Tell the meeting's audience the participant is gone, and the
+    removed user -- if this cost them the meeting -- that the meeting
+    is gone for them.  Registered after the agenda handler above, so
+    the agenda already reflects the removal.
+    """
+    if not _deleted_directly(origin, Participant):
+        # Cascaded from a meeting (or user) delete, which records its
+        # own tombstones.
+        return
+
+    audience = _agenda_user_ids(instance.meeting_id)
+    Tombstone.record(
+        audience,
+        Tombstone.TYPE_PARTICIPANT,
+        instance.pk,
+        instance.meeting_id,
+    )
+    publish_meeting_event(
+        audience, events.MEETING_UPDATED, instance.meeting_id
+    )
+    if instance.user_id and instance.user_id not in audience:
+        Tombstone.record(
+            [instance.user_id],
+            Tombstone.TYPE_MEETING,
+            instance.meeting_id,
+            instance.meeting_id,
+        )
+        publish_meeting_event(
+            [instance.user_id], events.MEETING_DELETED, instance.meeting_id
+        )
+
+
+# ---------------------------------------------------------------------------
+# RSVP counters
+# ---------------------------------------------------------------------------
+
+@receiver(pre_delete, sender=Participant)
+def lock_participant_on_delete(sender, instance, origin=None, **kwargs):
+    """
+    Lock the row and read its stored status, as ``Participant.save``
+    does, for the counter update once it is gone.  Runs for queryset
+    deletes too, inside the same transaction as the DELETE.
+    """
+    if _deleted_directly(origin, Meeting):
+        # The counters go with the meeting.
+        return
+    instance._stored_status = (
+        Participant.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values_list("status", flat=True)
+        .first()
+    )
+
+
+@receiver(post_delete, sender=Participant)
+def adjust_rsvp_counts_on_delete(sender, instance, **kwargs):
+    status = instance.__dict__.pop("_stored_status", None)
+    if status:
+        Meeting.adjust_rsvp_counts(instance.meeting_id, {status: -1})
+
+
+@receiver(post_save, sender=Meeting)
+def publish_meeting_saved(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if created:
+        event_type = events.MEETING_CREATED
+    elif (
+        instance.status == Meeting.STATUS_CANCELLED
+        and update_fields is not None
+        and "status" in update_fields
+    ):
+        event_type = events.MEETING_CANCELLED
+    else:
+        event_type = events.MEETING_UPDATED
+    publish_meeting_event(
+        _agenda_user_ids(instance.pk),
+        event_type,
+        instance.pk,
+        status=instance.status,
+    )
+
+
+@receiver(post_save, sender=Participant)
+def publish_participant_saved(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    audience = _agenda_user_ids(instance.meeting_id)
+    if not created and update_fields and "status" in update_fields:
+        publish_meeting_event(
+            audience,
+            events.RSVP_CHANGED,
+            instance.meeting_id,
+            participant_id=instance.pk,
+            status=instance.status,
+        )
+    else:
+        publish_meeting_event(
+            audience, events.MEETING_UPDATED, instance.meeting_id
+        )
+
+
+# ---------------------------------------------------------------------------
+# Analytics rollups
+# ---------------------------------------------------------------------------
+
+@receiver(pre_save, sender=Meeting)
+def remember_rollup_day(sender, instance, update_fields=None, **kwargs):
+    """Note the day the meeting started on before a move."""
+    instance._previous_rollup_day = None
+    if instance._state.adding:
+        return
+    if update_fields is not None and "start_time" not in update_fields:
+        return
+    previous = (
+        Meeting.objects.filter(pk=instance.pk)
+        .values_list("start_time", flat=True)
+        .first()
+    )
+    if previous is not None:
+        instance._previous_rollup_day = meeting_day(previous)
+
+
+@receiver(post_save, sender=Meeting)
+@receiver(post_delete, sender=Meeting)
+def rollup_meeting_day(sender, instance, **kwargs):
+    days = {meeting_day(instance.start_time)}
+    previous = getattr(instance, "_previous_rollup_day", None)
+    if previous is not None:
+        days.add(previous)
+    schedule_rollup(days)
+
+
+@receiver(post_save, sender=Participant)
+@receiver(post_delete, sender=Participant)
+def rollup_participant_day(
+    sender, instance, update_fields=None, origin=None, **kwargs
+):
+    if origin is not None and not _deleted_directly(origin, Participant):
+        # Cascaded from a meeting delete, which rolls up its own day.
+        return
+    if update_fields is not None and not (
+        {"status", "email"} & set(update_fields)
+    ):
+        return
+    if Participant.meeting.is_cached(instance):
+        start_time = instance.meeting.start_time
+    else:
+        start_time = (
+            Meeting.objects.filter(pk=instance.meeting_id)
+            .values_list("start_time", flat=True)
+            .first()
+        )
+    if start_time is not None:
+        schedule_rollup([meeting_day(start_time)])
+
+
+# ---------------------------------------------------------------------------
+# Linking new users to their invitations
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def link_participants_on_user_create(sender, instance, created, **kwargs):
+    if created and instance.email:
+        link_participants({instance.email.lower(): instance.pk})
@@ -1,19 +1,37 @@
+from django.conf import settings
 from django.urls import path
 
+from . import async_views
 from .views import (
+    BusiestParticipantsView,
+    CalendarSummaryView,
     ConflictCheckView,
+    MeetingBulkCreateView,
     MeetingCancelView,
+    MeetingChangesView,
     MeetingDetailView,
     MeetingExportICSView,
     MeetingListCreateView,
+    MeetingLoadAnalyticsView,
     MeetingNotificationListView,
     MeetingNotifyView,
     MyCalendarView,
+    ParticipantBulkInviteView,
+    ParticipantBulkStatusView,
     ParticipantDeleteView,
     ParticipantListCreateView,
     ParticipantStatusView,
+    ResourceAvailabilityView,
+    ResourceListCreateView,
 )
 
+if settings.MEETINGS_ASYNC_VIEWS:
+    # Async variants of the I/O-bound endpoints, for ASGI deployments.
+    ConflictCheckView = async_views.AsyncConflictCheckView
+    MeetingExportICSView = async_views.AsyncMeetingExportICSView
+    MeetingNotifyView = async_views.AsyncMeetingNotifyView
+    MyCalendarView = async_views.AsyncMyCalendarView
+
 urlpatterns = [
 
     # ------------------------------------------------------------------
@@ -27,18 +45,48 @@ urlpatterns = [
         name="meeting-list-create",
     ),
 
-    # These two detail-less actions must come BEFORE <uuid:pk>/ so the
+    # These detail-less actions must come BEFORE <uuid:pk>/ so the
     # URL router does not try to match "my-calendar" as a UUID.
     path(
         "meetings/my-calendar/",
         MyCalendarView.as_view(),
         name="meeting-my-calendar",
     ),
+    path(
+        "meetings/bulk/",
+        MeetingBulkCreateView.as_view(),
+        name="meeting-bulk-create",
+    ),
+    path(
+        "meetings/calendar/",
+        CalendarSummaryView.as_view(),
+        name="meeting-calendar-summary",
+    ),
+    path(
+        "meetings/changes/",
+        MeetingChangesView.as_view(),
+        name="meeting-changes",
+    ),
+    path(
+        "meetings/analytics/load/",
+        MeetingLoadAnalyticsView.as_view(),
+        name="meeting-analytics-load",
+    ),
+    path(
+        "meetings/analytics/participants/",
+        BusiestParticipantsView.as_view(),
+        name="meeting-analytics-participants",
+    ),
     path(
         "meetings/check-conflicts/",
         ConflictCheckView.as_view(),
         name="meeting-check-conflicts",
     ),
+    path(
+        "meetings/participants/bulk-status/",
+        ParticipantBulkStatusView.as_view(),
+        name="participant-bulk-status",
+    ),
 
     # Retrieve / update / delete a single meeting
     path(
@@ -79,6 +127,13 @@ urlpatterns = [
         name="participant-list-create",
     ),
 
+    # Invite many participants at once
+    path(
+        "meetings/<uuid:meeting_id>/participants/bulk/",
+        ParticipantBulkInviteView.as_view(),
+        name="participant-bulk-invite",
+    ),
+
     # Remove a participant
     path(
         "meetings/<uuid:meeting_id>/participants/<int:pk>/",
@@ -93,6 +148,24 @@ urlpatterns = [
         name="participant-status",
     ),
 
+    # ------------------------------------------------------------------
+    # Resource endpoints
+    # ------------------------------------------------------------------
+
+    # List rooms and equipment / add one
+    path(
+        "resources/",
+        ResourceListCreateView.as_view(),
+        name="resource-list-create",
+    ),
+
+    # Resources free for a time slot
+    path(
+        "resources/available/",
+        ResourceAvailabilityView.as_view(),
+        name="resource-available",
+    ),
+
     # ------------------------------------------------------------------
     # Notification endpoints
     # ------------------------------------------------------------------
@@ -105,3 +178,12 @@ urlpatterns = [
     ),
 ]
 
+if settings.MEETINGS_EVENT_STREAM:
+    # Live meeting events; ASGI deployments only.
+    urlpatterns.append(
+        path(
+            "meetings/events/",
+            async_views.MeetingEventStreamView.as_view(),
+            name="meeting-events",
+        )
+    )
@@ -0,0 +1,117 @@
+"""
+Maintenance of the per-user agenda table (``UserAgendaEntry``).
+
+Each meeting has one entry for its organiser and one for every
+participant linked to a user account.  A user who organises a meeting
+and is also invited to it keeps the single organizer entry.
+"""
+
+from django.db import transaction
+
+from meetings.models import Meeting, Participant, UserAgendaEntry
+
+
+def _entry(meeting, user_id, role):
+    return UserAgendaEntry(
+        user_id=user_id,
+        meeting_id=meeting["pk"],
+        start_time=meeting["start_time"],
+        end_time=meeting["end_time"],
+        status=meeting["status"],
+        role=role,
+    )
+
+
+def build_agenda_entries(meeting_ids):
+    """Return unsaved agenda entries for the given meetings."""
+    meetings = {
+        row["pk"]: row
+        for row in Meeting.objects.filter(pk__in=meeting_ids).values(
+            "pk", "created_by_id", "start_time", "end_time", "status"
+        )
+    }
+    entries = [
+        _entry(
+            meeting,
+            meeting["created_by_id"],
+            UserAgendaEntry.ROLE_ORGANIZER,
+        )
+        for meeting in meetings.values()
+    ]
+    seen = {(entry.meeting_id, entry.user_id) for entry in entries}
+
+    participants = (
+        Participant.objects.filter(
+            meeting_id__in=meetings, user__isnull=False
+        )
+        .order_by()
+        .values_list("meeting_id", "user_id")
+    )
+    for meeting_id, user_id in participants:
+        if (meeting_id, user_id) in seen:
+            continue
+        seen.add((meeting_id, user_id))
+        entries.append(
+            _entry(
+                meetings[meeting_id],
+                user_id,
+                UserAgendaEntry.ROLE_PARTICIPANT,
+            )
+        )
+    return entries
+
+
+def rebuild_agenda(meeting_ids):
+    """
+    Replace the agenda entries of the given meetings with freshly
+    derived ones.  Returns the number of entries written.
+    """
+    meeting_ids = list(meeting_ids)
+    with transaction.atomic():
+        UserAgendaEntry.objects.filter(meeting_id__in=meeting_ids).delete()
+        entries = UserAgendaEntry.objects.bulk_create(
+            build_agenda_entries(meeting_ids)
+        )
+    return len(entries)
+
+
+def add_agenda_entries(meeting, user_ids, role):
+    """
+    Insert ``role`` entries for ``user_ids`` on ``meeting``.  Users who
+    already have an entry for the meeting are left untouched.
+    """
+    row = {
+        "pk": meeting.pk,
+        "start_time": meeting.start_time,
+        "end_time": meeting.end_time,
+        "status": meeting.status,
+    }
+    UserAgendaEntry.objects.bulk_create(
+        [_entry(row, user_id, role) for user_id in set(user_ids)],
+        ignore_conflicts=True,
+    )
+
+
+def sync_meeting_entries(meeting):
+    """Copy the meeting's times and status onto its agenda entries."""
+    UserAgendaEntry.objects.filter(meeting_id=meeting.pk).update(
+        start_time=meeting.start_time,
+        end_time=meeting.end_time,
+        status=meeting.status,
+    )
+
+
+def remove_participant_entry(meeting_id, user_id):
+    """
+    Drop ``user_id``'s participant entry on the meeting, unless another
+    participant row still links them to it.
+    """
+    still_invited = Participant.objects.filter(
+        meeting_id=meeting_id, user_id=user_id
+    ).exists()
+    if not still_invited:
+        UserAgendaEntry.objects.filter(
+            meeting_id=meeting_id,
+            user_id=user_id,
+            role=UserAgendaEntry.ROLE_PARTICIPANT,
+        ).delete()
@@ -0,0 +1,232 @@
+"""
+Daily rollups behind the meeting analytics endpoints.
+
+``DailyMeetingStats`` has a row per day and ``DailyParticipantLoad`` a
+row per (day, participant email), both derived from the meetings that
+start that day.  Analytics requests aggregate these small tables over
+the requested range instead of scanning meetings and participants.
+
+A day is always recomputed whole rather than patched with deltas, so
+a missed update cannot leave it wrong for good.  Signals and the bulk
+helpers call ``schedule_rollup`` with the days a write touched and the
+recompute runs once the transaction commits.
+``manage.py rollup_meeting_stats`` rebuilds a range, nightly, to pick
+up anything written behind the ORM's back.
+"""
+
+import logging
+import threading
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import (
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Q,
+    Sum,
+)
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from meetings.models import (
+    DailyMeetingStats,
+    DailyParticipantLoad,
+    Meeting,
+    Participant,
+)
+
+logger = logging.getLogger(__name__)
+
+STATS_FIELDS = [
+    "meetings",
+    "cancelled",
+    "busy_minutes",
+    "attendee_minutes",
+    "invited",
+    "accepted",
+    "declined",
+    "tentative",
+]
+
+_pending = threading.local()
+
+
+def meeting_day(start_time):
+    """The rollup day of a meeting starting at ``start_time``."""
+    return timezone.localtime(start_time).date()
+
+
+def _start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _minutes(duration):
+    return int(duration.total_seconds() // 60) if duration else 0
+
+
+def _duration(prefix=""):
+    return ExpressionWrapper(
+        F(f"{prefix}end_time") - F(f"{prefix}start_time"),
+        output_field=DurationField(),
+    )
+
+
+def _participant_loads(start, end):
+    """Unsaved load rows for meetings starting in [start, end)."""
+    rows = (
+        Participant.objects.filter(
+            meeting__start_time__gte=start, meeting__start_time__lt=end
+        )
+        .exclude(meeting__status=Meeting.STATUS_CANCELLED)
+        .annotate(day=TruncDate("meeting__start_time"))
+        .values("day", "email")
+        .annotate(
+            invitations=Count("pk"),
+            accepted_rsvps=Count(
+                "pk", filter=Q(status=Participant.STATUS_ACCEPTED)
+            ),
+            declined_rsvps=Count(
+                "pk", filter=Q(status=Participant.STATUS_DECLINED)
+            ),
+            busy=Sum(
+                _duration("meeting__"),
+                filter=~Q(status=Participant.STATUS_DECLINED),
+            ),
+        )
+        .order_by()
+    )
+    return [
+        DailyParticipantLoad(
+            day=row["day"],
+            email=row["email"],
+            invitations=row["invitations"],
+            accepted=row["accepted_rsvps"],
+            declined=row["declined_rsvps"],
+            busy_minutes=_minutes(row["busy"]),
+        )
+        for row in rows
+    ]
+
+
+def _meeting_totals(start, end):
+    """day -> totals for meetings starting in [start, end)."""
+    live = ~Q(status=Meeting.STATUS_CANCELLED)
+    rows = (
+        Meeting.objects.filter(start_time__gte=start, start_time__lt=end)
+        .annotate(day=TruncDate("start_time"))
+        .values("day")
+        .annotate(
+            live_count=Count("pk", filter=live),
+            cancelled_count=Count("pk", filter=~live),
+            busy=Sum(_duration(), filter=live),
+            invited_sum=Sum("invited_count", filter=live),
+            accepted_sum=Sum("accepted_count", filter=live),
+            declined_sum=Sum("declined_count", filter=live),
+            tentative_sum=Sum("tentative_count", filter=live),
+        )
+        .order_by()
+    )
+    return {
+        row["day"]: {
+            "meetings": row["live_count"],
+            "cancelled": row["cancelled_count"],
+            "busy_minutes": _minutes(row["busy"]),
+            "invited": row["invited_sum"] or 0,
+            "accepted": row["accepted_sum"] or 0,
+            "declined": row["declined_sum"] or 0,
+            "tentative": row["tentative_sum"] or 0,
+        }
+        for row in rows
+    }
+
+
+def rollup_range(first_day, last_day):
+    """
+    Recompute the rollups of every day from ``first_day`` to
+    ``last_day`` inclusive with one aggregate query per table.
+    Returns the number of days rolled up.
+    """
+    days = [
+        first_day + timedelta(days=n)
+        for n in range((last_day - first_day).days + 1)
+    ]
+    if not days:
+        return 0
+    start = _start_of_day(first_day)
+    end = _start_of_day(last_day + timedelta(days=1))
+
+    with transaction.atomic():
+        # Lock the days' stats rows, creating any that are missing, so
+        # concurrent rollups of the same day run one after the other.
+        DailyMeetingStats.objects.bulk_create(
+            [DailyMeetingStats(day=day) for day in days],
+            ignore_conflicts=True,
+        )
+        stats = list(
+            DailyMeetingStats.objects.select_for_update()
+            .filter(day__range=(first_day, last_day))
+            .order_by("day")
+        )
+
+        loads = _participant_loads(start, end)
+        totals = _meeting_totals(start, end)
+        attendee_minutes = {}
+        for load in loads:
+            attendee_minutes[load.day] = (
+                attendee_minutes.get(load.day, 0) + load.busy_minutes
+            )
+
+        for row in stats:
+            values = totals.get(row.day, {})
+            for field in STATS_FIELDS:
+                setattr(row, field, values.get(field, 0))
+            row.attendee_minutes = attendee_minutes.get(row.day, 0)
+        DailyMeetingStats.objects.bulk_update(
+            stats, STATS_FIELDS, batch_size=500
+        )
+
+        DailyParticipantLoad.objects.filter(
+            day__range=(first_day, last_day)
+        ).delete()
+        DailyParticipantLoad.objects.bulk_create(loads, batch_size=1000)
+    return len(days)
+
+
+def _flush():
+    days = getattr(_pending, "days", None)
+    if not days:
+        return
+    _pending.days = set()
+    try:
+        for day in sorted(days):
+            rollup_range(day, day)
+    except Exception:
+        # The write itself has committed; the nightly rebuild repairs
+        # whatever was missed here.
+        logger.exception("Could not roll up meeting stats")
+
+
+def schedule_rollup(days):
+    """
+    Recompute ``days`` once the current transaction commits.  Days
+    scheduled several times in one transaction are rolled up once.
+    """
+    days = set(days)
+    if not days:
+        return
+    if not hasattr(_pending, "days"):
+        _pending.days = set()
+    _pending.days.update(days)
+    transaction.on_commit(_flush)
+
+
+def schedule_meeting_rollups(meeting_ids):
+    """``schedule_rollup`` for the days the given meetings start on."""
+    schedule_rollup(
+        meeting_day(start_time)
+        for start_time in Meeting.objects.filter(
+            pk__in=meeting_ids
+        ).values_list("start_time", flat=True)
+    )
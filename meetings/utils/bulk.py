@@ -0,0 +1,297 @@
+"""
+Bulk write helpers.
+
+These bypass the per-row model signals (``bulk_create`` sends none),
+so each helper performs the signal side effects itself, in batches:
+agenda entries are written in the same transaction, while invitation
+emails, response cache invalidation, live events and analytics rollups
+happen once the transaction commits.  The emails are sent by
+``send_bulk_notifications`` on the "email" pool of ``executors``, so a
+large batch never holds the request open on the mail server.
+"""
+
+from django.db import transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from meetings.models import Meeting, Participant, Resource, UserAgendaEntry
+
+from .agenda import add_agenda_entries, build_agenda_entries
+from .analytics import meeting_day, schedule_meeting_rollups, schedule_rollup
+from .cache import bump_meeting_versions, bump_user_versions
+from .conflict_detector import check_batch_conflicts
+from .events import (
+    MEETING_CREATED,
+    MEETING_UPDATED,
+    RSVP_CHANGED,
+    publish_meeting_event,
+)
+from .executors import submit
+from .notifications import send_bulk_notifications
+
+
+def _after_commit(participants, meeting_ids, user_ids):
+    """Queue batched invitations and cache invalidation."""
+
+    def run():
+        bump_meeting_versions(meeting_ids)
+        bump_user_versions(user_ids)
+        submit("email", send_bulk_notifications, participants, "invitation")
+
+    transaction.on_commit(run)
+
+
+def _affected_user_ids(meeting_ids):
+    """Organisers and linked participants of the given meetings."""
+    owners = (
+        Meeting.objects.filter(pk__in=meeting_ids)
+        .order_by()
+        .values_list("created_by_id", flat=True)
+    )
+    participants = (
+        Participant.objects.filter(
+            meeting_id__in=meeting_ids, user__isnull=False
+        )
+        .order_by()
+        .values_list("user_id", flat=True)
+    )
+    return list(owners.union(participants))
+
+
+def _build_participants(meeting, participants_data, seen=None):
+    """
+    Return unsaved Participant rows for ``meeting``, skipping emails
+    already in ``seen`` (mirrors the get_or_create de-duplication of
+    the single-meeting endpoint).
+    """
+    seen = set() if seen is None else seen
+    rows = []
+    for p_data in participants_data:
+        email = p_data["email"]
+        if email in seen:
+            continue
+        seen.add(email)
+        rows.append(
+            Participant(
+                meeting=meeting,
+                email=email,
+                name=p_data.get("name", ""),
+                user=p_data.get("user"),
+            )
+        )
+    return rows
+
+
+def bulk_create_meetings(items, created_by):
+    """
+    Create many meetings with their participants in one transaction.
+
+    Args:
+        items: List of ``MeetingCreateSerializer.validated_data`` dicts.
+        created_by: The organising user.
+
+    Returns:
+        list with one entry per item: the created Meeting, or a dict
+        mapping email (or booked resource id) -> conflicting meetings
+        when the item was rejected because of a scheduling conflict.
+    """
+    planned = []
+    for data in items:
+        data = dict(data)
+        participants_data = data.pop("participants", [])
+        resource_ids = sorted(
+            {resource.pk for resource in data.pop("resources", [])}
+        )
+        meeting = Meeting(created_by=created_by, **data)
+        planned.append(
+            (
+                meeting,
+                _build_participants(meeting, participants_data),
+                resource_ids,
+            )
+        )
+
+    results = []
+    meetings = []
+    participants = []
+    bookings = []
+    with transaction.atomic():
+        # Lock the resources being booked so a concurrent booking of
+        # one of them waits for this batch.
+        list(
+            Resource.objects.select_for_update()
+            .filter(pk__in={pk for _, _, ids in planned for pk in ids})
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        conflicts = check_batch_conflicts(
+            [
+                {
+                    "id": meeting.id,
+                    "title": meeting.title,
+                    "status": meeting.status,
+                    "start_time": meeting.start_time,
+                    "end_time": meeting.end_time,
+                    "emails": [p.email for p in rows],
+                    "resources": resource_ids,
+                }
+                for meeting, rows, resource_ids in planned
+            ]
+        )
+
+        for (meeting, rows, resource_ids), conflict in zip(
+            planned, conflicts
+        ):
+            if conflict:
+                results.append(conflict)
+                continue
+            meeting.invited_count = len(rows)
+            results.append(meeting)
+            meetings.append(meeting)
+            participants.extend(rows)
+            bookings.extend(
+                Meeting.resources.through(
+                    meeting_id=meeting.pk, resource_id=resource_id
+                )
+                for resource_id in resource_ids
+            )
+
+        if meetings:
+            Meeting.objects.bulk_create(meetings)
+            participants = Participant.objects.bulk_create(participants)
+            Meeting.resources.through.objects.bulk_create(bookings)
+            UserAgendaEntry.objects.bulk_create(
+                build_agenda_entries([meeting.pk for meeting in meetings])
+            )
+            _after_commit(
+                participants,
+                [],
+                [created_by.pk] + [p.user_id for p in participants],
+            )
+            audiences = {meeting.pk: {created_by.pk} for meeting in meetings}
+            for participant in participants:
+                if participant.user_id:
+                    audiences[participant.meeting_id].add(
+                        participant.user_id
+                    )
+            for meeting_id, user_ids in audiences.items():
+                publish_meeting_event(user_ids, MEETING_CREATED, meeting_id)
+            schedule_rollup(
+                meeting_day(meeting.start_time) for meeting in meetings
+            )
+    return results
+
+
+def bulk_add_participants(meeting, emails):
+    """
+    Invite many email addresses to an existing meeting in one insert.
+
+    Addresses already on the meeting are skipped.  The meeting row is
+    locked before they are read, so concurrent bulk invites of the same
+    address wait for each other instead of failing on the unique
+    (meeting, email) pair.  Invitations go out as one batch after
+    commit.
+
+    Args:
+        meeting: The Meeting to add participants to.
+        emails: Normalised (lower-cased, de-duplicated) addresses.
+
+    Returns:
+        list of the Participant rows created.
+    """
+    with transaction.atomic():
+        list(
+            Meeting.objects.select_for_update()
+            .filter(pk=meeting.pk)
+            .values_list("pk", flat=True)
+        )
+        existing = set(
+            meeting.participants.values_list("email", flat=True)
+        )
+        rows = _build_participants(
+            meeting, [{"email": email} for email in emails], existing
+        )
+        if not rows:
+            return []
+
+        rows = Participant.objects.bulk_create(rows)
+        Meeting.adjust_rsvp_counts(
+            meeting.pk, {Participant.STATUS_INVITED: len(rows)}
+        )
+        add_agenda_entries(
+            meeting,
+            [row.user_id for row in rows if row.user_id],
+            UserAgendaEntry.ROLE_PARTICIPANT,
+        )
+        user_ids = _affected_user_ids([meeting.pk])
+        _after_commit(rows, [meeting.pk], user_ids)
+        publish_meeting_event(user_ids, MEETING_UPDATED, meeting.pk)
+        schedule_rollup([meeting_day(meeting.start_time)])
+    return rows
+
+
+def bulk_update_participant_status(statuses):
+    """
+    Apply many RSVP changes with a single CASE-based UPDATE.
+
+    Args:
+        statuses: dict mapping participant id -> new status.
+
+    Returns:
+        int: number of participant rows updated.
+    """
+    if not statuses:
+        return 0
+
+    now = timezone.now()
+    with transaction.atomic():
+        previous = list(
+            Participant.objects.select_for_update()
+            .filter(pk__in=statuses)
+            .values_list("pk", "meeting_id", "status")
+        )
+        updated = Participant.objects.filter(pk__in=statuses).update(
+            status=Case(
+                *(
+                    When(pk=pk, then=Value(new_status))
+                    for pk, new_status in statuses.items()
+                ),
+            ),
+            responded_at=now,
+            updated_at=now,
+        )
+
+        # meeting id -> {status: delta} for the RSVP counters
+        deltas = {}
+        for pk, meeting_id, old_status in previous:
+            counts = deltas.setdefault(meeting_id, {})
+            counts[old_status] = counts.get(old_status, 0) - 1
+            new_status = statuses[pk]
+            counts[new_status] = counts.get(new_status, 0) + 1
+        for meeting_id, counts in deltas.items():
+            Meeting.adjust_rsvp_counts(meeting_id, counts)
+
+        meeting_ids = list(deltas)
+        user_ids = _affected_user_ids(meeting_ids)
+        schedule_meeting_rollups(meeting_ids)
+
+        audiences = {}
+        for meeting_id, user_id in UserAgendaEntry.objects.filter(
+            meeting_id__in=meeting_ids
+        ).values_list("meeting_id", "user_id"):
+            audiences.setdefault(meeting_id, set()).add(user_id)
+        for pk, meeting_id, _ in previous:
+            publish_meeting_event(
+                audiences.get(meeting_id, ()),
+                RSVP_CHANGED,
+                meeting_id,
+                participant_id=pk,
+                status=statuses[pk],
+            )
+
+        def invalidate():
+            bump_meeting_versions(meeting_ids)
+            bump_user_versions(user_ids)
+
+        transaction.on_commit(invalidate)
+    return updated
@@ -0,0 +1,106 @@
+"""
+Response cache helpers with version-key invalidation.
+
+Cached responses are never deleted.  Every cache key embeds the current
+version of the user (and, for detail views, the meeting) it depends on;
+bumping a version makes every entry built from the old one unreachable
+at once, without scanning keys.  Stale entries simply expire.
+
+Versions are seeded from the clock rather than 1 so that a version key
+evicted by the cache backend never comes back with a value an old
+entry was built under.
+
+Versions are bumped in the cache of the process that handled the
+write, so responses are only cached in a backend every worker shares
+(Redis, Memcached, the database).  With a per-process backend
+(``LocMemCache``, ``DummyCache``) the other workers would keep serving
+old bodies, under ETags computed fresh from the database, so
+``get_or_build`` always builds instead.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from accounts.rbac import cache_is_shared
+
+KEY_PREFIX = "meetings"
+
+
+def _user_version_key(user_id):
+    return f"{KEY_PREFIX}:v:user:{user_id}"
+
+
+def _meeting_version_key(meeting_id):
+    return f"{KEY_PREFIX}:v:meeting:{meeting_id}"
+
+
+def _get_versions(keys):
+    """Return the current version for each key, seeding missing ones."""
+    versions = cache.get_many(keys)
+    missing = {
+        key: time.time_ns() for key in keys if key not in versions
+    }
+    if missing:
+        for key, value in missing.items():
+            # add() keeps a value another worker seeded first.
+            cache.add(key, value, timeout=None)
+        versions.update(cache.get_many(list(missing)))
+    return [versions.get(key, missing.get(key)) for key in keys]
+
+
+def _bump(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Never seeded (or evicted): nothing can be cached under it.
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def bump_user_versions(user_ids):
+    """Invalidate every cached response belonging to these users."""
+    _bump([_user_version_key(uid) for uid in set(user_ids) if uid])
+
+
+def bump_meeting_versions(meeting_ids):
+    """Invalidate every cached detail response for these meetings."""
+    _bump([_meeting_version_key(mid) for mid in set(meeting_ids)])
+
+
+def meeting_list_cache_key(user_id, query_string):
+    """Cache key for one user's meeting list with the given query."""
+    (user_version,) = _get_versions([_user_version_key(user_id)])
+    digest = hashlib.md5(query_string.encode()).hexdigest()
+    return f"{KEY_PREFIX}:list:{user_id}:{user_version}:{digest}"
+
+
+def meeting_detail_cache_key(user_id, meeting_id):
+    """Cache key for one user's view of a single meeting."""
+    user_version, meeting_version = _get_versions(
+        [_user_version_key(user_id), _meeting_version_key(meeting_id)]
+    )
+    return (
+        f"{KEY_PREFIX}:detail:{user_id}:{meeting_id}:"
+        f"{user_version}:{meeting_version}"
+    )
+
+
+def get_or_build(key, build):
+    """
+    Return the cached value for ``key``, calling ``build()`` and
+    caching its result on a miss.  Always builds without a shared cache.
+    """
+    if not cache_is_shared():
+        return build()
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, settings.MEETINGS_CACHE_TIMEOUT)
+    return value
@@ -0,0 +1,82 @@
+"""
+Conditional request (ETag) helpers.
+
+ETags are derived from one aggregate query -- row counts plus the
+latest ``updated_at`` of the meetings and participants behind a
+response -- so a polling client that already has the current
+representation gets a 304 without anything being serialized.
+
+``If-Match`` is used for optimistic concurrency on writes: a client
+that edited a stale copy of a meeting gets 412 Precondition Failed.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = (
+        "The resource has changed since you last fetched it."
+    )
+    default_code = "precondition_failed"
+
+
+def make_etag(state, *extra):
+    """
+    Return a quoted strong ETag for an aggregate ``state`` dict plus
+    any ``extra`` values the representation depends on.
+    """
+    parts = [f"{key}={state[key]}" for key in sorted(state)]
+    raw = "|".join(parts + [str(part) for part in extra])
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+
+def meeting_set_state(meetings):
+    """
+    Return the aggregate state of a queryset of meetings and their
+    participants as a dict, in a single query.
+
+    Adding, removing or editing any meeting or participant in the set
+    changes at least one of the values.
+    """
+    return meetings.order_by().aggregate(
+        meeting_count=Count("id", distinct=True),
+        meeting_modified=Max("updated_at"),
+        participant_count=Count("participants"),
+        participant_modified=Max("participants__updated_at"),
+    )
+
+
+def if_none_match(request, etag):
+    """True if the request's If-None-Match header matches ``etag``."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or etag in etags
+
+
+def check_if_match(request, etag):
+    """
+    Raise PreconditionFailed if the request carries an If-Match
+    header that does not match ``etag``.
+    """
+    header = request.headers.get("If-Match")
+    if not header:
+        return
+    etags = parse_etags(header)
+    if "*" not in etags and etag not in etags:
+        raise PreconditionFailed()
+
+
+def not_modified(etag):
+    """Return an empty 304 response carrying ``etag``."""
+    return Response(
+        status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+    )
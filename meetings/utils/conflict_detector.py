@@ -3,7 +3,8 @@ Conflict detection utility.
 
 A conflict occurs when a participant (identified by email) is already
 scheduled in another meeting whose time range overlaps with the
-proposed meeting.
+proposed meeting.  Resources (rooms, equipment) are double-booked by
+the same rule.
 """
 
 
@@ -82,3 +83,251 @@ def check_participants_conflicts(
             ]
 
     return conflicts
+
+
+async def acheck_participants_conflicts(
+    participants_emails,
+    start_time,
+    end_time,
+    exclude_meeting_id=None,
+):
+    """
+    Async version of ``check_participants_conflicts`` for async views.
+
+    Uses the async ORM and a single query for all emails instead of
+    one query per email.  Returns the same structure.
+    """
+    from meetings.models import Meeting, Participant
+
+    rows = Participant.objects.filter(
+        email__in=participants_emails,
+        meeting__status=Meeting.STATUS_SCHEDULED,
+        meeting__start_time__lt=end_time,
+        meeting__end_time__gt=start_time,
+    )
+    if exclude_meeting_id:
+        rows = rows.exclude(meeting_id=exclude_meeting_id)
+    rows = rows.order_by("meeting__start_time").values_list(
+        "email",
+        "meeting_id",
+        "meeting__title",
+        "meeting__start_time",
+        "meeting__end_time",
+    )
+
+    found = {}
+    seen = set()
+    async for email, meeting_id, title, start, end in rows:
+        if (email, meeting_id) in seen:
+            continue
+        seen.add((email, meeting_id))
+        found.setdefault(email, []).append(
+            {
+                "id": str(meeting_id),
+                "title": title,
+                "start_time": start.isoformat(),
+                "end_time": end.isoformat(),
+            }
+        )
+
+    # Keep the caller's email order, like the sync version.
+    return {
+        email: found[email]
+        for email in participants_emails
+        if email in found
+    }
+
+
+def _describe(meeting_id, title, start_time, end_time):
+    return {
+        "id": str(meeting_id),
+        "title": title,
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+    }
+
+
+def _resource_bookings(resource_ids, start_time, end_time):
+    """
+    Booking rows of scheduled meetings overlapping [start_time,
+    end_time] -- the same rule as ``get_conflicting_meetings`` -- for
+    ``resource_ids`` (all resources if None).
+    """
+    from meetings.models import Meeting
+
+    rows = Meeting.resources.through.objects.filter(
+        meeting__status=Meeting.STATUS_SCHEDULED,
+        meeting__start_time__lt=end_time,
+        meeting__end_time__gt=start_time,
+    )
+    if resource_ids is not None:
+        rows = rows.filter(resource_id__in=resource_ids)
+    return rows
+
+
+def check_batch_conflicts(slots, exclude_meeting_ids=None):
+    """
+    Check many proposed meetings for conflicts with one query (two
+    when resources are booked).
+
+    Slots are checked in order against existing scheduled meetings and
+    against the earlier slots of the same batch that were conflict-free,
+    so a batch never double-books anyone -- or any resource -- within
+    itself either.
+
+    Args:
+        slots: List of dicts with ``emails``, ``start_time`` and
+               ``end_time``, and optionally ``resources`` (resource
+               ids); other keys (``id``, ``title``) are used to
+               describe the slot when it blocks a later one.
+        exclude_meeting_ids: Optional meeting UUIDs to ignore.
+
+    Returns:
+        list with one entry per slot: a dict mapping email (or resource
+        id) -> list of conflicting meeting dicts (empty dict when
+        conflict-free).
+    """
+    from meetings.models import Meeting, Participant
+
+    emails = {email for slot in slots for email in slot["emails"]}
+    resource_ids = {
+        pk for slot in slots for pk in slot.get("resources", ())
+    }
+    if not emails and not resource_ids:
+        return [{} for _ in slots]
+
+    window_start = min(s["start_time"] for s in slots)
+    window_end = max(s["end_time"] for s in slots)
+    fields = [
+        "meeting_id",
+        "meeting__title",
+        "meeting__start_time",
+        "meeting__end_time",
+    ]
+
+    # email / resource id -> list of (start, end, meeting dict) booked
+    booked = {}
+    queries = []
+    if emails:
+        queries.append(
+            Participant.objects.filter(
+                email__in=emails,
+                meeting__status=Meeting.STATUS_SCHEDULED,
+                meeting__start_time__lt=window_end,
+                meeting__end_time__gt=window_start,
+            ).values_list("email", *fields)
+        )
+    if resource_ids:
+        queries.append(
+            _resource_bookings(
+                resource_ids, window_start, window_end
+            ).values_list("resource_id", *fields)
+        )
+    for rows in queries:
+        if exclude_meeting_ids:
+            rows = rows.exclude(meeting_id__in=exclude_meeting_ids)
+        for key, meeting_id, title, start, end in rows:
+            booked.setdefault(key, []).append(
+                (start, end, _describe(meeting_id, title, start, end))
+            )
+
+    results = []
+    for slot in slots:
+        start, end = slot["start_time"], slot["end_time"]
+        keys = [*slot["emails"], *slot.get("resources", ())]
+        conflicts = {}
+        for key in keys:
+            overlapping = [
+                meeting
+                for booked_start, booked_end, meeting in booked.get(
+                    key, []
+                )
+                if booked_start < end and booked_end > start
+            ]
+            if overlapping:
+                conflicts[key] = overlapping
+        results.append(conflicts)
+
+        scheduled = (
+            slot.get("status", Meeting.STATUS_SCHEDULED)
+            == Meeting.STATUS_SCHEDULED
+        )
+        if scheduled and not conflicts:
+            entry = _describe(
+                slot.get("id", ""), slot.get("title", ""), start, end
+            )
+            for key in keys:
+                booked.setdefault(key, []).append((start, end, entry))
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Resources
+# ---------------------------------------------------------------------------
+
+def check_resource_conflicts(
+    resource_ids,
+    start_time,
+    end_time,
+    exclude_meeting_id=None,
+):
+    """
+    Check resources for double bookings with one query.
+
+    Args:
+        resource_ids: Ids of the resources to check.
+        start_time: Proposed meeting start datetime.
+        end_time: Proposed meeting end datetime.
+        exclude_meeting_id: Optional meeting UUID to exclude.
+
+    Returns:
+        dict mapping resource id -> list of conflicting meeting dicts.
+        Empty dict means every resource is free.
+    """
+    rows = _resource_bookings(resource_ids, start_time, end_time)
+    if exclude_meeting_id:
+        rows = rows.exclude(meeting_id=exclude_meeting_id)
+    rows = rows.order_by("meeting__start_time").values_list(
+        "resource_id",
+        "meeting_id",
+        "meeting__title",
+        "meeting__start_time",
+        "meeting__end_time",
+    )
+
+    conflicts = {}
+    for resource_id, meeting_id, title, start, end in rows:
+        conflicts.setdefault(resource_id, []).append(
+            _describe(meeting_id, title, start, end)
+        )
+    return conflicts
+
+
+def get_available_resources(
+    start_time,
+    end_time,
+    min_capacity=1,
+    kind=None,
+):
+    """
+    Active resources with at least ``min_capacity`` that are free for
+    all of [start_time, end_time].
+
+    One query: the resources anti-joined against the bookings of
+    scheduled meetings overlapping the slot.  Those meetings come from
+    a single range scan of the scheduled-meetings index, whatever the
+    number of resources.
+
+    Returns:
+        QuerySet of Resource instances, smallest first.
+    """
+    from meetings.models import Resource
+
+    busy = _resource_bookings(None, start_time, end_time)
+    resources = Resource.objects.filter(
+        is_active=True, capacity__gte=min_capacity
+    ).exclude(pk__in=busy.values("resource_id"))
+    if kind:
+        resources = resources.filter(kind=kind)
+    return resources.order_by("capacity", "name")
@@ -0,0 +1,210 @@
+"""
+Per-user meeting event pub/sub for the server-sent events stream.
+
+Signals and the bulk helpers call ``publish_meeting_event`` inside the
+request's transaction; the event is handed to the broker once the
+transaction commits.  ``GET /api/meetings/events/`` subscribes the
+current user and streams whatever the broker delivers.
+
+Events are deliberately thin -- a type, the meeting id and a few
+identifying fields.  Clients react by calling the changes feed, which
+also covers anything missed while disconnected.
+
+The broker is chosen with the ``MEETINGS_EVENT_BROKER`` setting:
+
+- ``InProcessBroker`` (default) delivers to subscribers in the same
+  process.  Enough for a single ASGI worker.
+- ``RedisBroker`` relays events through a Redis channel so that every
+  worker sees every event.  Needs the ``redis`` package and
+  ``MEETINGS_EVENT_BROKER_URL``.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+MEETING_CREATED = "meeting.created"
+MEETING_UPDATED = "meeting.updated"
+MEETING_CANCELLED = "meeting.cancelled"
+MEETING_DELETED = "meeting.deleted"
+RSVP_CHANGED = "rsvp.changed"
+# Sent in place of events dropped because a subscriber fell behind.
+RESYNC = "resync"
+
+
+class Subscription:
+    """
+    A bounded queue of events for one stream, owned by the event loop
+    that created it.  ``push`` may be called from any thread.
+    """
+
+    def __init__(self, user_id, maxsize):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+
+    def push(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The loop has shut down; the stream is gone.
+            pass
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too slow to keep up: drop the backlog and have the client
+            # catch up from the changes feed instead.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": RESYNC})
+
+    async def get(self, timeout):
+        """Next event, or None if nothing arrives within ``timeout``."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessBroker:
+    """Delivers events to subscribers in the current process."""
+
+    queue_size = 100
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def publish(self, user_ids, event):
+        for user_id in user_ids:
+            self._deliver(user_id, event)
+
+    def _deliver(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for subscription in subscriptions:
+            subscription.push(event)
+
+    def subscribe(self, user_id):
+        """Register a stream for ``user_id``; call from its event loop."""
+        subscription = Subscription(user_id, self.queue_size)
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[subscription.user_id]
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Publishes every event to one Redis channel.  Each process runs a
+    single listener that fans incoming events out to its own
+    subscribers, so the number of Redis connections does not grow with
+    the number of open streams.
+    """
+
+    channel = "meetings:events"
+
+    def __init__(self):
+        super().__init__()
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImproperlyConfigured(
+                "RedisBroker requires the 'redis' package."
+            ) from exc
+        self.url = getattr(settings, "MEETINGS_EVENT_BROKER_URL", "")
+        if not self.url:
+            raise ImproperlyConfigured(
+                "RedisBroker requires MEETINGS_EVENT_BROKER_URL."
+            )
+        self._redis = redis.Redis.from_url(self.url)
+        self._listener = None
+
+    def publish(self, user_ids, event):
+        message = json.dumps({"users": list(user_ids), "event": event})
+        self._redis.publish(self.channel, message)
+
+    def subscribe(self, user_id):
+        subscription = super().subscribe(user_id)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(
+                self._listen()
+            )
+        return subscription
+
+    async def _listen(self):
+        import redis.asyncio as aioredis
+
+        while True:
+            try:
+                client = aioredis.Redis.from_url(self.url)
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        payload = json.loads(message["data"])
+                        for user_id in payload["users"]:
+                            self._deliver(user_id, payload["event"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Meeting event listener failed")
+                await asyncio.sleep(1)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """The process-wide broker configured by MEETINGS_EVENT_BROKER."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                path = getattr(
+                    settings,
+                    "MEETINGS_EVENT_BROKER",
+                    "meetings.utils.events.InProcessBroker",
+                )
+                _broker = import_string(path)()
+    return _broker
+
+
+def publish_meeting_event(user_ids, event_type, meeting_id, **fields):
+    """
+    Publish an event to ``user_ids`` once the current transaction
+    commits.  Nothing is sent if it rolls back.
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    event = {"type": event_type, "meeting_id": str(meeting_id), **fields}
+
+    def send():
+        try:
+            get_broker().publish(user_ids, event)
+        except Exception:
+            # Live updates are best effort; the write has committed.
+            logger.exception("Could not publish %s", event_type)
+
+    transaction.on_commit(send)
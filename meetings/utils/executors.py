@@ -0,0 +1,74 @@
+"""
+Bounded thread pools for blocking work kept off the request path.
+
+``sync_to_async(thread_sensitive=False)`` on its own hands work to the
+event loop's default executor, which every library shares.  Email
+sends and calendar rendering get pools of their own instead, so a slow
+SMTP server can tie up at most ``MEETINGS_EMAIL_THREADS`` threads and
+never starves ICS exports or the database calls of other requests.
+
+Functions awaited through ``run_in_pool`` must not touch the database:
+connections opened in these threads are never closed by Django's
+request cycle.  ``submit`` is for sync code that hands off work
+without waiting; it closes the thread's connections after each call,
+so the work may use the ORM.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def get_pool(name):
+    """
+    The shared executor for ``name`` ("email" or "render"), sized by
+    the ``MEETINGS_<NAME>_THREADS`` setting.
+    """
+    pool = _pools.get(name)
+    if pool is None:
+        with _lock:
+            pool = _pools.get(name)
+            if pool is None:
+                size = getattr(
+                    settings, f"MEETINGS_{name.upper()}_THREADS", 4
+                )
+                pool = ThreadPoolExecutor(
+                    max_workers=size,
+                    thread_name_prefix=f"meetings-{name}",
+                )
+                _pools[name] = pool
+    return pool
+
+
+async def run_in_pool(name, func, *args, **kwargs):
+    """Await ``func(*args, **kwargs)`` run on the ``name`` pool."""
+    return await sync_to_async(
+        func, thread_sensitive=False, executor=get_pool(name)
+    )(*args, **kwargs)
+
+
+def submit(name, func, *args, **kwargs):
+    """
+    Run ``func(*args, **kwargs)`` on the ``name`` pool without waiting
+    for it.  Errors are logged, as nobody awaits the result.
+    """
+
+    def run():
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            logger.exception("%s task %r failed", name, func)
+            raise
+        finally:
+            connections.close_all()
+
+    return get_pool(name).submit(run)
@@ -0,0 +1,181 @@
+"""
+Fast read path for list-heavy endpoints.
+
+Instead of hydrating model instances and running DRF's field-by-field
+serialization, rows are fetched with ``values()`` and turned into
+response dicts by a builder compiled once per serializer class.  The
+output matches the serializer's own representation.
+
+Enabled with the ``MEETINGS_FAST_READ`` setting.
+"""
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.relations import RelatedField
+
+from meetings.models import Meeting, Participant
+from meetings.serializers import (
+    MeetingDetailSerializer,
+    MeetingListSerializer,
+    ParticipantSerializer,
+)
+
+# Fields whose Python value is already what the JSON renderer expects.
+_PASSTHROUGH = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    RelatedField,
+)
+
+
+def fast_read_enabled():
+    return getattr(settings, "MEETINGS_FAST_READ", False)
+
+
+class RowBuilder:
+    """
+    Builds the representation of a serializer straight from
+    ``values()`` rows.
+
+    Args:
+        serializer_class: The serializer whose output is reproduced.
+        computed: Optional mapping of field name -> ``f(row)`` for
+            fields that are not plain columns (method fields, model
+            methods, nested data).
+    """
+
+    def __init__(self, serializer_class, computed=None):
+        self.serializer_class = serializer_class
+        self.computed = computed or {}
+        self._plan = None
+        self._columns = None
+
+    def _compile(self):
+        plan = []
+        columns = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if name in self.computed:
+                plan.append((name, None, self.computed[name]))
+                continue
+            column = field.source.replace(".", "__")
+            columns.append(column)
+            convert = None
+            if not isinstance(field, _PASSTHROUGH):
+                convert = field.to_representation
+            plan.append((name, column, convert))
+        self._plan = plan
+        self._columns = columns
+
+    @property
+    def columns(self):
+        """Column names to pass to ``values()``."""
+        if self._columns is None:
+            self._compile()
+        return self._columns
+
+    def build(self, row):
+        """Return the representation of one ``values()`` row."""
+        if self._plan is None:
+            self._compile()
+        data = {}
+        for name, column, convert in self._plan:
+            if column is None:
+                data[name] = convert(row)
+                continue
+            value = row[column]
+            if convert is not None and value is not None:
+                value = convert(value)
+            data[name] = value
+        return data
+
+    def build_many(self, rows):
+        return [self.build(row) for row in rows]
+
+
+# ---------------------------------------------------------------------------
+# Computed fields
+# ---------------------------------------------------------------------------
+
+def _duration_minutes(row):
+    delta = row["end_time"] - row["start_time"]
+    return int(delta.total_seconds() / 60)
+
+
+def _is_upcoming(row):
+    return (
+        row["start_time"] > timezone.now()
+        and row["status"] == Meeting.STATUS_SCHEDULED
+    )
+
+
+# ---------------------------------------------------------------------------
+# Builders for the hot serializers
+# ---------------------------------------------------------------------------
+
+participant_builder = RowBuilder(ParticipantSerializer)
+
+meeting_list_builder = RowBuilder(
+    MeetingListSerializer,
+    computed={
+        "participant_count": lambda row: row["participant_count"],
+        "duration_minutes": _duration_minutes,
+    },
+)
+
+meeting_detail_builder = RowBuilder(
+    MeetingDetailSerializer,
+    computed={
+        "participants": lambda row: row["participants"],
+        "resources": lambda row: row["resources"],
+        "duration_minutes": _duration_minutes,
+        "is_upcoming": _is_upcoming,
+    },
+)
+
+
+def meeting_list_rows(queryset, extra_columns=()):
+    """
+    ``values()`` queryset for the meeting list.  ``queryset`` must be
+    annotated with ``participant_count``; ``extra_columns`` are added
+    so the paginator can read its cursor position from each row.
+    """
+    columns = set(meeting_list_builder.columns)
+    columns.update(("participant_count", "end_time", "start_time"))
+    columns.update(extra_columns)
+    return queryset.values(*columns)
+
+
+def meeting_detail_data(queryset, pk):
+    """
+    Detail representation of meeting ``pk`` from ``queryset`` in three
+    queries, or None if it is not in the queryset.
+    """
+    row = (
+        queryset.prefetch_related(None)
+        .filter(pk=pk)
+        .values(*meeting_detail_builder.columns)
+        .first()
+    )
+    if row is None:
+        return None
+    row["participants"] = participant_builder.build_many(
+        meeting_participant_rows(pk)
+    )
+    row["resources"] = list(
+        Meeting.resources.through.objects.filter(meeting_id=pk)
+        .order_by("resource__name")
+        .values_list("resource_id", flat=True)
+    )
+    return meeting_detail_builder.build(row)
+
+
+def meeting_participant_rows(meeting_id):
+    """``values()`` queryset of one meeting's participants."""
+    return Participant.objects.filter(meeting_id=meeting_id).values(
+        *participant_builder.columns
+    )
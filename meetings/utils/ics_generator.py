@@ -9,12 +9,15 @@ from django.utils import timezone
 from icalendar import Calendar, Event, vCalAddress, vText
 
 
-def generate_ics_for_meeting(meeting):
+def generate_ics_for_meeting(meeting, participants=None):
     """
     Generate an ICS file for a single Meeting instance.
 
     Args:
         meeting: Meeting model instance.
+        participants: Optional pre-loaded participants; defaults to
+            ``meeting.participants.all()``.  Pass them (and select the
+            organiser) to render without touching the database.
 
     Returns:
         bytes: RFC 5545-compliant ICS content.
@@ -48,7 +51,9 @@ def generate_ics_for_meeting(meeting):
     event["organizer"] = organizer
 
     # Add attendees (participants)
-    for participant in meeting.participants.all():
+    if participants is None:
+        participants = meeting.participants.all()
+    for participant in participants:
         attendee = vCalAddress(f"MAILTO:{participant.email}")
         attendee.params["cn"] = vText(
             participant.name or participant.email
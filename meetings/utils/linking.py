@@ -0,0 +1,92 @@
+"""
+Linking participants to user accounts by email.
+
+Invitations are keyed by email, so a participant invited before the
+invitee registered has no ``user`` and the meeting never reaches their
+agenda.  ``link_participants`` fills the FK in for unlinked rows whose
+email matches, case-insensitively, using the partial index on
+``lower(email)`` of unlinked participants, and performs the side
+effects the per-row signals would have: agenda entries in the same
+transaction, then cache invalidation and live events once it commits.
+
+The participants' ``updated_at`` is bumped too, so the changes feed
+resends the meetings to the newly linked users.
+"""
+
+from django.db import transaction
+from django.db.models import Case, Value, When
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from meetings.models import Participant, UserAgendaEntry
+
+from .agenda import build_agenda_entries
+from .cache import bump_meeting_versions, bump_user_versions
+from .events import MEETING_UPDATED, publish_meeting_event
+
+
+def link_participants(users_by_email):
+    """
+    Link unlinked participants to users.
+
+    Args:
+        users_by_email: dict mapping lower-cased email -> user id.
+
+    Returns:
+        int: number of participant rows linked.
+    """
+    if not users_by_email:
+        return 0
+
+    now = timezone.now()
+    unlinked = Participant.objects.filter(user__isnull=True).alias(
+        email_lower=Lower("email")
+    )
+    with transaction.atomic():
+        if len(users_by_email) == 1:
+            # A single UPDATE ... WHERE lower(email) = %s.
+            ((email, user_id),) = users_by_email.items()
+            linked = unlinked.filter(email_lower=email).update(
+                user_id=user_id, updated_at=now
+            )
+        else:
+            linked = unlinked.filter(
+                email_lower__in=list(users_by_email)
+            ).update(
+                user_id=Case(
+                    *(
+                        When(email_lower=email, then=Value(user_id))
+                        for email, user_id in users_by_email.items()
+                    ),
+                ),
+                updated_at=now,
+            )
+        if not linked:
+            return 0
+
+        # meeting id -> newly linked user ids
+        audiences = {}
+        for meeting_id, user_id in (
+            Participant.objects.filter(
+                user_id__in=users_by_email.values(), updated_at=now
+            )
+            .order_by()
+            .values_list("meeting_id", "user_id")
+        ):
+            audiences.setdefault(meeting_id, set()).add(user_id)
+
+        meeting_ids = list(audiences)
+        UserAgendaEntry.objects.bulk_create(
+            build_agenda_entries(meeting_ids), ignore_conflicts=True
+        )
+        for meeting_id, user_ids in audiences.items():
+            publish_meeting_event(user_ids, MEETING_UPDATED, meeting_id)
+
+        user_ids = set().union(*audiences.values())
+
+        def invalidate():
+            bump_meeting_versions(meeting_ids)
+            bump_user_versions(user_ids)
+
+        transaction.on_commit(invalidate)
+    return linked
@@ -9,7 +9,7 @@ In production, swap EMAIL_BACKEND to an SMTP or transactional provider
 import logging
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +81,20 @@ def _render(template_key, context):
     return subject, body
 
 
+def _context(participant, meeting):
+    """Return the template context for one participant of a meeting."""
+    return {
+        "name": participant.name or participant.email,
+        "title": meeting.title,
+        "description": meeting.description or "-",
+        "location": meeting.location or "-",
+        "start_time": meeting.start_time.strftime(
+            "%Y-%m-%d %H:%M UTC"
+        ),
+        "end_time": meeting.end_time.strftime("%Y-%m-%d %H:%M UTC"),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -103,18 +117,9 @@ def send_meeting_notification(participant, meeting, notification_type):
     """
     from meetings.models import MeetingNotification
 
-    context = {
-        "name": participant.name or participant.email,
-        "title": meeting.title,
-        "description": meeting.description or "-",
-        "location": meeting.location or "-",
-        "start_time": meeting.start_time.strftime(
-            "%Y-%m-%d %H:%M UTC"
-        ),
-        "end_time": meeting.end_time.strftime("%Y-%m-%d %H:%M UTC"),
-    }
-
-    subject, body = _render(notification_type, context)
+    subject, body = _render(
+        notification_type, _context(participant, meeting)
+    )
 
     notif = MeetingNotification.objects.create(
         meeting=meeting,
@@ -166,3 +171,144 @@ def notify_all_participants(meeting, notification_type):
             participant, meeting, notification_type
         )
     return results
+
+
+def _build_batch(participants, notification_type):
+    """
+    Return unsaved MeetingNotification rows and the matching
+    EmailMessages for ``participants``.
+    """
+    from meetings.models import MeetingNotification
+
+    notifications = []
+    messages = []
+    for participant in participants:
+        subject, body = _render(
+            notification_type,
+            _context(participant, participant.meeting),
+        )
+        notifications.append(
+            MeetingNotification(
+                meeting=participant.meeting,
+                participant=participant,
+                email=participant.email,
+                notification_type=notification_type,
+                message=body,
+                is_sent=False,
+            )
+        )
+        messages.append(
+            EmailMessage(
+                subject=subject,
+                body=body,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[participant.email],
+            )
+        )
+    return notifications, messages
+
+
+def _deliver_batch(notifications, messages, notification_type):
+    """
+    Send ``messages`` over one backend connection, recording each
+    outcome on the matching notification.  Touches no database.
+    """
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        for notif in notifications:
+            notif.error_message = str(exc)
+        logger.warning(
+            "Could not open email connection for bulk '%s': %s",
+            notification_type,
+            exc,
+        )
+        return
+
+    try:
+        for notif, message in zip(notifications, messages):
+            try:
+                connection.send_messages([message])
+                notif.is_sent = True
+            except Exception as exc:
+                notif.error_message = str(exc)
+                logger.warning(
+                    "Failed to send notification '%s' to %s: %s",
+                    notification_type,
+                    notif.email,
+                    exc,
+                )
+    finally:
+        connection.close()
+
+
+def _batch_results(notifications, notification_type):
+    results = {notif.email: notif.is_sent for notif in notifications}
+    logger.info(
+        "Bulk notification '%s': %d of %d sent",
+        notification_type,
+        sum(results.values()),
+        len(notifications),
+    )
+    return results
+
+
+def send_bulk_notifications(participants, notification_type):
+    """
+    Send one notification type to many participants in a batch.
+
+    The MeetingNotification log rows are written with one bulk insert
+    and updated with one bulk update, and every email goes out over a
+    single backend connection instead of one connection per message.
+
+    Args:
+        participants: Participant instances with ``meeting`` loaded.
+        notification_type: One of invitation / update /
+                           cancellation / reminder.
+
+    Returns:
+        dict mapping participant email -> bool (success/failure).
+    """
+    from meetings.models import MeetingNotification
+
+    participants = list(participants)
+    if not participants:
+        return {}
+
+    notifications, messages = _build_batch(participants, notification_type)
+    notifications = MeetingNotification.objects.bulk_create(notifications)
+    _deliver_batch(notifications, messages, notification_type)
+    MeetingNotification.objects.bulk_update(
+        notifications, ["is_sent", "error_message"]
+    )
+    return _batch_results(notifications, notification_type)
+
+
+async def asend_bulk_notifications(participants, notification_type):
+    """
+    Async version of ``send_bulk_notifications`` for async views.
+
+    The log rows are written with the async ORM and the emails are
+    sent on the bounded "email" thread pool, so a slow mail server
+    never blocks the event loop.
+    """
+    from meetings.models import MeetingNotification
+
+    from .executors import run_in_pool
+
+    participants = list(participants)
+    if not participants:
+        return {}
+
+    notifications, messages = _build_batch(participants, notification_type)
+    notifications = await MeetingNotification.objects.abulk_create(
+        notifications
+    )
+    await run_in_pool(
+        "email", _deliver_batch, notifications, messages, notification_type
+    )
+    await MeetingNotification.objects.abulk_update(
+        notifications, ["is_sent", "error_message"]
+    )
+    return _batch_results(notifications, notification_type)
@@ -1,30 +1,107 @@
-from django.http import HttpResponse
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import (
+    Count,
+    DateField,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    Sum,
+)
+from django.db.models.functions import Trunc
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import filters, generics, status
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from drf_spectacular.utils import extend_schema
-
-from .models import Meeting, MeetingNotification, Participant
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+
+from .filters import SEARCH_RANK, MeetingSearchFilter
+from .models import (
+    DailyMeetingStats,
+    DailyParticipantLoad,
+    Meeting,
+    MeetingNotification,
+    Participant,
+    Resource,
+    Tombstone,
+    UserAgendaEntry,
+)
+from .pagination import (
+    MeetingCursorPagination,
+    NotificationCursorPagination,
+    ParticipantCursorPagination,
+)
+from .permissions import CanManageResources, CanViewMeetingAnalytics
+from .renderers import ORJSONRenderer
 from .serializers import (
+    BusiestParticipantsQuerySerializer,
+    BusiestParticipantsSerializer,
+    CalendarSummaryQuerySerializer,
+    CalendarSummarySerializer,
     ConflictCheckSerializer,
+    MeetingBulkCreateSerializer,
+    MeetingChangesSerializer,
     MeetingCreateSerializer,
     MeetingDetailSerializer,
     MeetingListSerializer,
+    MeetingLoadQuerySerializer,
+    MeetingLoadSerializer,
     MeetingNotificationSerializer,
+    ParticipantBulkInviteSerializer,
+    ParticipantBulkStatusSerializer,
     ParticipantCreateSerializer,
     ParticipantSerializer,
     ParticipantStatusSerializer,
+    ResourceAvailabilityQuerySerializer,
+    ResourceSerializer,
+)
+from .utils.analytics import STATS_FIELDS
+from .utils.conditional import (
+    PreconditionFailed,
+    check_if_match,
+    if_none_match,
+    make_etag,
+    meeting_set_state,
+    not_modified,
+)
+from .utils.conflict_detector import (
+    check_batch_conflicts,
+    check_participants_conflicts,
+    get_available_resources,
+)
+from .utils.fast_read import (
+    fast_read_enabled,
+    meeting_detail_data,
+    meeting_list_builder,
+    meeting_list_rows,
+    participant_builder,
 )
-from .utils.conflict_detector import check_participants_conflicts
 from .utils.ics_generator import (
     generate_ics_for_meeting,
     generate_ics_for_multiple_meetings,
 )
+from .utils.bulk import (
+    bulk_add_participants,
+    bulk_create_meetings,
+    bulk_update_participant_status,
+)
+from .utils.cache import (
+    get_or_build,
+    meeting_detail_cache_key,
+    meeting_list_cache_key,
+)
 from .utils.notifications import notify_all_participants
+from .utils.sync import next_cursor, parse_cursor
 
 
 # ---------------------------------------------------------------------------
@@ -36,15 +113,70 @@ def is_meeting_owner(user, meeting):
     return meeting.created_by == user
 
 
-def get_user_meetings(user):
+def get_user_meetings(user, **entry_filters):
     """
     Return all meetings the user owns or is a participant in.
-    Results are pre-fetched with participants to avoid N+1 queries.
+
+    Visibility comes from the user's ``UserAgendaEntry`` rows, so this
+    is a single join on the (user, start_time) index rather than a
+    union of ownership and participation.  ``entry_filters`` (for
+    example ``start_time__gte=...``) are applied to the agenda entry
+    in the same join, which keeps date ranges on that index.  Results
+    are pre-fetched with participants to avoid N+1 queries.
+    """
+    lookups = {
+        f"agenda_entries__{lookup}": value
+        for lookup, value in entry_filters.items()
+    }
+    return Meeting.objects.filter(
+        agenda_entries__user=user, **lookups
+    ).prefetch_related("participants")
+
+
+def for_list(meetings):
+    """
+    Prepare ``meetings`` for ``MeetingListSerializer``.  It only needs
+    the participant count and the organiser's email: sum the RSVP
+    counter columns and join the organiser rather than touching
+    participant rows at all.
     """
-    return (
-        Meeting.objects.filter(created_by=user)
-        | Meeting.objects.filter(participants__user=user)
-    ).distinct().prefetch_related("participants")
+    return meetings.select_related("created_by").annotate(
+        participant_count=(
+            F("invited_count")
+            + F("accepted_count")
+            + F("declined_count")
+            + F("tentative_count")
+        )
+    )
+
+
+def start_of_day(day):
+    """Return the aware datetime at which ``day`` begins."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def parse_date_param(request, name):
+    """
+    Return the ``name`` query parameter as a date, or None if absent.
+    Raises a 400 ValidationError for malformed values.
+    """
+    raw = request.query_params.get(name)
+    if not raw:
+        return None
+    try:
+        value = parse_date(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise ValidationError(
+            {name: "Enter a valid date in YYYY-MM-DD format."}
+        )
+    return value
+
+
+def acceptance_rate(accepted, invitations):
+    """Accepted share of ``invitations`` to 4 places, or None if 0."""
+    return round(accepted / invitations, 4) if invitations else None
 
 
 # ===========================================================================
@@ -57,32 +189,48 @@ class MeetingListCreateView(generics.ListCreateAPIView):
     POST /api/meetings/   Create a new meeting.
 
     Uses generics.ListCreateAPIView -- handles pagination, search,
-    and ordering automatically via filter_backends.
+    and ordering automatically via filter_backends.  Pages are keyed
+    on (start_time, id) with cursor pagination; ``?ordering=`` still
+    switches the cursor to any of the supported fields.  ``?search=``
+    is ranked full-text search on PostgreSQL.
     """
 
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = MeetingCursorPagination
+    filter_backends = [MeetingSearchFilter, filters.OrderingFilter]
     search_fields = ["title", "description", "location"]
     ordering_fields = [
         "start_time", "end_time", "created_at", "title"
     ]
-    ordering = ["start_time"]
+    ordering = ["start_time", "id"]
 
     def get_queryset(self):
-        qs = get_user_meetings(self.request.user)
+        return for_list(self.get_filtered_meetings())
+
+    def get_filtered_meetings(self):
+        """The user's meetings narrowed by the query parameters."""
+        # Filters go to the agenda entry so they share its join.
+        entry_filters = {}
 
         status_param = self.request.query_params.get("status")
         if status_param:
-            qs = qs.filter(status=status_param)
+            entry_filters["status"] = status_param
 
-        from_date = self.request.query_params.get("from_date")
-        to_date = self.request.query_params.get("to_date")
+        # Half-open datetime ranges keep the filters sargable; a
+        # ``__date`` lookup would cast the column and skip the index.
+        from_date = parse_date_param(self.request, "from_date")
+        to_date = parse_date_param(self.request, "to_date")
         if from_date:
-            qs = qs.filter(start_time__date__gte=from_date)
+            entry_filters["start_time__gte"] = start_of_day(from_date)
         if to_date:
-            qs = qs.filter(end_time__date__lte=to_date)
+            entry_filters["end_time__lt"] = start_of_day(
+                to_date + timedelta(days=1)
+            )
 
-        return qs
+        return get_user_meetings(
+            self.request.user, **entry_filters
+        ).prefetch_related(None)
 
     def get_serializer_class(self):
         # Use a lightweight serializer for the list view
@@ -90,10 +238,205 @@ class MeetingListCreateView(generics.ListCreateAPIView):
             return MeetingCreateSerializer
         return MeetingListSerializer
 
+    def list(self, request, *args, **kwargs):
+        etag = make_etag(
+            meeting_set_state(
+                self.filter_queryset(self.get_filtered_meetings())
+            ),
+            request.GET.urlencode(),
+            request.accepted_renderer.format,
+        )
+        if if_none_match(request, etag):
+            return not_modified(etag)
+
+        key = meeting_list_cache_key(
+            request.user.pk, request.GET.urlencode()
+        )
+        data = get_or_build(key, self.build_list_data)
+        return Response(data, headers={"ETag": etag})
+
+    def build_list_data(self):
+        """Serialize the current page of meetings."""
+        queryset = self.filter_queryset(self.get_queryset())
+        if fast_read_enabled():
+            # Extra columns let the paginator read any cursor position.
+            extra = ["created_at"]
+            if SEARCH_RANK in queryset.query.annotations:
+                extra.append(SEARCH_RANK)
+            rows = meeting_list_rows(queryset, extra)
+            page = self.paginate_queryset(rows)
+            data = meeting_list_builder.build_many(
+                rows if page is None else page
+            )
+        else:
+            page = self.paginate_queryset(queryset)
+            data = self.get_serializer(
+                queryset if page is None else page, many=True
+            ).data
+        if page is None:
+            return data
+        return self.get_paginated_response(data).data
+
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
 
+# ---------------------------------------------------------------------------
+
+class MeetingBulkCreateView(APIView):
+    """
+    POST /api/meetings/bulk/
+
+    Manual APIView -- validates a batch of meetings item by item, then
+    inserts every valid, conflict-free one (with its participants) in
+    a single transaction and reports a result per item.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=MeetingBulkCreateSerializer,
+        responses={201: None, 207: None},
+        description=(
+            "Create many meetings at once. Returns 201 when every "
+            "item was created, 207 on partial success and 400 when "
+            "nothing was created."
+        ),
+    )
+    def post(self, request):
+        envelope = MeetingBulkCreateSerializer(data=request.data)
+        envelope.is_valid(raise_exception=True)
+
+        results = []
+        valid_items = []
+        valid_indexes = []
+        for index, item in enumerate(
+            envelope.validated_data["meetings"]
+        ):
+            serializer = MeetingCreateSerializer(data=item)
+            if serializer.is_valid():
+                valid_items.append(serializer.validated_data)
+                valid_indexes.append(index)
+                results.append(None)
+            else:
+                results.append(
+                    {
+                        "index": index,
+                        "status": "error",
+                        "errors": serializer.errors,
+                    }
+                )
+
+        outcomes = bulk_create_meetings(valid_items, request.user)
+        for index, outcome in zip(valid_indexes, outcomes):
+            if isinstance(outcome, Meeting):
+                results[index] = {
+                    "index": index,
+                    "status": "created",
+                    "id": str(outcome.id),
+                }
+            else:
+                # Keys are emails, or ids of resources already booked.
+                if any(isinstance(key, int) for key in outcome):
+                    message = (
+                        "Participants or resources have scheduling "
+                        "conflicts."
+                    )
+                else:
+                    message = "Participants have scheduling conflicts."
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "errors": {"conflict": message, "details": outcome},
+                }
+
+        created = sum(1 for r in results if r["status"] == "created")
+        failed = len(results) - created
+        if not failed:
+            code = status.HTTP_201_CREATED
+        elif created:
+            code = status.HTTP_207_MULTI_STATUS
+        else:
+            code = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {"created": created, "failed": failed, "results": results},
+            status=code,
+        )
+
+
+# ---------------------------------------------------------------------------
+
+class MeetingChangesView(APIView):
+    """
+    GET /api/meetings/changes/?since=<cursor>
+
+    Manual APIView -- delta sync.  Returns the meetings and
+    participants created or updated after the cursor, plus the ids of
+    those deleted since (from tombstones), and a cursor for the next
+    call.  Without ``since`` every visible meeting and participant is
+    returned.  A cursor older than the tombstone retention gets 410,
+    and the client should reload the full list.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "since",
+                str,
+                description="Cursor returned by the previous sync.",
+            )
+        ],
+        responses={200: MeetingChangesSerializer},
+        description=(
+            "Meetings and participants changed or deleted since the "
+            "cursor."
+        ),
+    )
+    def get(self, request):
+        started_at = timezone.now()
+        since = parse_cursor(request.query_params.get("since"))
+
+        meetings = get_user_meetings(request.user).prefetch_related(None)
+        participants = Participant.objects.filter(
+            meeting__agenda_entries__user=request.user
+        )
+        deleted = {"meetings": [], "participants": []}
+
+        if since is not None:
+            # A meeting whose participants changed is resent too: its
+            # RSVP counts moved without touching its updated_at.
+            participant_changed = Participant.objects.filter(
+                meeting=OuterRef("pk"), updated_at__gt=since
+            )
+            meetings = meetings.filter(
+                Q(updated_at__gt=since) | Exists(participant_changed)
+            )
+            participants = participants.filter(updated_at__gt=since)
+
+            tombstones = Tombstone.objects.filter(
+                user=request.user, deleted_at__gt=since
+            ).values_list("object_type", "object_id")
+            for object_type, object_id in tombstones:
+                if object_type == Tombstone.TYPE_MEETING:
+                    deleted["meetings"].append(object_id)
+                else:
+                    deleted["participants"].append(object_id)
+
+        return Response(
+            MeetingChangesSerializer(
+                {
+                    "cursor": next_cursor(started_at),
+                    "meetings": for_list(meetings),
+                    "participants": participants,
+                    "deleted": deleted,
+                }
+            ).data
+        )
+
+
 # ---------------------------------------------------------------------------
 
 class MeetingDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -108,6 +451,7 @@ class MeetingDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         return get_user_meetings(self.request.user)
@@ -117,12 +461,59 @@ class MeetingDetailView(generics.RetrieveUpdateDestroyAPIView):
             return MeetingCreateSerializer
         return MeetingDetailSerializer
 
+    def get_etag(self, pk):
+        """Current ETag of the meeting, or None if it is not visible."""
+        state = meeting_set_state(
+            get_user_meetings(self.request.user).filter(pk=pk)
+        )
+        if not state["meeting_count"]:
+            return None
+        return make_etag(state, self.request.accepted_renderer.format)
+
+    def retrieve(self, request, *args, **kwargs):
+        etag = self.get_etag(kwargs["pk"])
+        if etag and if_none_match(request, etag):
+            return not_modified(etag)
+
+        key = meeting_detail_cache_key(request.user.pk, kwargs["pk"])
+        data = get_or_build(key, self.build_detail_data)
+        response = Response(data)
+        if etag:
+            response["ETag"] = etag
+        return response
+
+    def build_detail_data(self):
+        """Serialize the requested meeting, or raise Http404."""
+        if not fast_read_enabled():
+            return self.get_serializer(self.get_object()).data
+        data = meeting_detail_data(self.get_queryset(), self.kwargs["pk"])
+        if data is None:
+            raise Http404
+        return data
+
     def perform_update(self, serializer):
-        if not is_meeting_owner(self.request.user, self.get_object()):
+        meeting = serializer.instance
+        if not is_meeting_owner(self.request.user, meeting):
             raise PermissionDenied(
                 "Only the meeting organiser can edit it."
             )
-        serializer.save()
+        if "If-Match" not in self.request.headers:
+            serializer.save()
+            return
+
+        check_if_match(self.request, self.get_etag(meeting.pk))
+        with transaction.atomic():
+            # Compare-and-swap on updated_at: a concurrent writer that
+            # got here first has already moved it, so this edit was
+            # made against a stale copy.
+            claimed = Meeting.objects.filter(
+                pk=meeting.pk, updated_at=meeting.updated_at
+            ).update(updated_at=timezone.now())
+            if not claimed:
+                raise PreconditionFailed()
+            # The instance predates any RSVP since the ETag was taken;
+            # Meeting.save() leaves the counters out of the UPDATE.
+            serializer.save()
 
     def perform_destroy(self, instance):
         if not is_meeting_owner(self.request.user, instance):
@@ -225,7 +616,8 @@ class MyCalendarView(APIView):
         ),
     )
     def get(self, request):
-        meetings = get_user_meetings(request.user).filter(
+        meetings = get_user_meetings(
+            request.user,
             status=Meeting.STATUS_SCHEDULED,
             start_time__gte=timezone.now(),
         )
@@ -239,6 +631,228 @@ class MyCalendarView(APIView):
         return response
 
 
+# ---------------------------------------------------------------------------
+
+class CalendarSummaryView(APIView):
+    """
+    GET /api/meetings/calendar/?from_date=&to_date=&bucket=day|week|month
+
+    Manual APIView -- returns per-bucket meeting counts and busy
+    minutes aggregated in the database, plus a one-character-per-day
+    "has meetings" bitmap for month grids.  Cancelled meetings are
+    left out.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        parameters=[CalendarSummaryQuerySerializer],
+        responses={200: CalendarSummarySerializer},
+        description=(
+            "Meeting counts and busy minutes per day, week or month."
+        ),
+    )
+    def get(self, request):
+        params = CalendarSummaryQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        from_date = params.validated_data["from_date"]
+        to_date = params.validated_data["to_date"]
+        bucket = params.validated_data["bucket"]
+
+        # Everything needed is on the agenda entries themselves, so the
+        # aggregation never touches the meetings table.
+        meetings = UserAgendaEntry.objects.filter(
+            user=request.user,
+            start_time__gte=start_of_day(from_date),
+            start_time__lt=start_of_day(to_date + timedelta(days=1)),
+        ).exclude(status=Meeting.STATUS_CANCELLED)
+
+        rows = (
+            meetings.annotate(
+                period=Trunc(
+                    "start_time", bucket, output_field=DateField()
+                )
+            )
+            .values("period")
+            .annotate(
+                count=Count("meeting_id"),
+                busy=Sum(
+                    ExpressionWrapper(
+                        F("end_time") - F("start_time"),
+                        output_field=DurationField(),
+                    )
+                ),
+            )
+            .order_by("period")
+        )
+        buckets = [
+            {
+                "period": row["period"],
+                "count": row["count"],
+                "busy_minutes": int(row["busy"].total_seconds() // 60),
+            }
+            for row in rows
+        ]
+
+        busy_days = set(
+            meetings.annotate(
+                day=Trunc("start_time", "day", output_field=DateField())
+            )
+            .values_list("day", flat=True)
+            .order_by()
+            .distinct()
+        )
+        span = (to_date - from_date).days + 1
+        bitmap = "".join(
+            "1" if from_date + timedelta(days=i) in busy_days else "0"
+            for i in range(span)
+        )
+
+        return Response(
+            CalendarSummarySerializer(
+                {
+                    "from_date": from_date,
+                    "to_date": to_date,
+                    "bucket": bucket,
+                    "buckets": buckets,
+                    "busy_days": bitmap,
+                }
+            ).data
+        )
+
+
+# ---------------------------------------------------------------------------
+
+class MeetingLoadAnalyticsView(APIView):
+    """
+    GET /api/meetings/analytics/load/?from_date=&to_date=&bucket=
+
+    Org-wide meetings, hours in meetings and RSVP acceptance per day,
+    week (default) or month.  Sums the ``DailyMeetingStats`` rollups
+    in the database -- at most one row per day of the range -- so a
+    year costs the same whatever the number of meetings.
+    """
+
+    permission_classes = [IsAuthenticated, CanViewMeetingAnalytics]
+
+    @extend_schema(
+        parameters=[MeetingLoadQuerySerializer],
+        responses={200: MeetingLoadSerializer},
+        description="Meeting load and RSVP acceptance per period.",
+    )
+    def get(self, request):
+        params = MeetingLoadQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        from_date = params.validated_data["from_date"]
+        to_date = params.validated_data["to_date"]
+        bucket = params.validated_data["bucket"]
+
+        rows = (
+            DailyMeetingStats.objects.filter(
+                day__range=(from_date, to_date)
+            )
+            .annotate(period=Trunc("day", bucket, output_field=DateField()))
+            .values("period")
+            .annotate(
+                **{f"total_{field}": Sum(field) for field in STATS_FIELDS}
+            )
+            .order_by("period")
+        )
+        buckets = []
+        for row in rows:
+            bucket_row = {
+                field: row[f"total_{field}"] for field in STATS_FIELDS
+            }
+            if not (bucket_row["meetings"] or bucket_row["cancelled"]):
+                # Days the rollup touched that no longer have meetings.
+                continue
+            invitations = sum(
+                bucket_row[status]
+                for status in Participant.COUNTER_FIELDS
+            )
+            bucket_row["period"] = row["period"]
+            bucket_row["acceptance_rate"] = acceptance_rate(
+                bucket_row["accepted"], invitations
+            )
+            buckets.append(bucket_row)
+
+        return Response(
+            MeetingLoadSerializer(
+                {
+                    "from_date": from_date,
+                    "to_date": to_date,
+                    "bucket": bucket,
+                    "buckets": buckets,
+                }
+            ).data
+        )
+
+
+# ---------------------------------------------------------------------------
+
+class BusiestParticipantsView(APIView):
+    """
+    GET /api/meetings/analytics/participants/?from_date=&to_date=&limit=
+
+    The participants with the most time in meetings over the range,
+    ranked in the database from the ``DailyParticipantLoad`` rollups.
+    """
+
+    permission_classes = [IsAuthenticated, CanViewMeetingAnalytics]
+
+    @extend_schema(
+        parameters=[BusiestParticipantsQuerySerializer],
+        responses={200: BusiestParticipantsSerializer},
+        description="Participants ranked by time spent in meetings.",
+    )
+    def get(self, request):
+        params = BusiestParticipantsQuerySerializer(
+            data=request.query_params
+        )
+        params.is_valid(raise_exception=True)
+        from_date = params.validated_data["from_date"]
+        to_date = params.validated_data["to_date"]
+
+        rows = (
+            DailyParticipantLoad.objects.filter(
+                day__range=(from_date, to_date)
+            )
+            .values("email")
+            .annotate(
+                total_invitations=Sum("invitations"),
+                total_accepted=Sum("accepted"),
+                total_declined=Sum("declined"),
+                total_busy=Sum("busy_minutes"),
+            )
+            .order_by("-total_busy", "email")[
+                : params.validated_data["limit"]
+            ]
+        )
+        participants = [
+            {
+                "email": row["email"],
+                "invitations": row["total_invitations"],
+                "accepted": row["total_accepted"],
+                "declined": row["total_declined"],
+                "busy_minutes": row["total_busy"],
+                "acceptance_rate": acceptance_rate(
+                    row["total_accepted"], row["total_invitations"]
+                ),
+            }
+            for row in rows
+        ]
+
+        return Response(
+            BusiestParticipantsSerializer(
+                {
+                    "from_date": from_date,
+                    "to_date": to_date,
+                    "participants": participants,
+                }
+            ).data
+        )
+
+
 # ---------------------------------------------------------------------------
 
 class ConflictCheckView(APIView):
@@ -336,6 +950,8 @@ class ParticipantListCreateView(generics.ListCreateAPIView):
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = ParticipantCursorPagination
 
     def _get_meeting(self):
         return get_object_or_404(
@@ -347,6 +963,33 @@ class ParticipantListCreateView(generics.ListCreateAPIView):
             meeting=self._get_meeting()
         )
 
+    def list(self, request, *args, **kwargs):
+        state = meeting_set_state(
+            Meeting.objects.filter(pk=self.kwargs["meeting_id"])
+        )
+        etag = make_etag(
+            state,
+            request.GET.urlencode(),
+            request.accepted_renderer.format,
+        )
+        if state["meeting_count"] and if_none_match(request, etag):
+            return not_modified(etag)
+
+        if fast_read_enabled():
+            rows = self.get_queryset().values(*participant_builder.columns)
+            page = self.paginate_queryset(rows)
+            data = participant_builder.build_many(
+                rows if page is None else page
+            )
+            if page is None:
+                response = Response(data)
+            else:
+                response = self.get_paginated_response(data)
+        else:
+            response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
     def get_serializer_class(self):
         if self.request.method == "POST":
             return ParticipantCreateSerializer
@@ -380,6 +1023,62 @@ class ParticipantListCreateView(generics.ListCreateAPIView):
         serializer.save(meeting=meeting)
 
 
+# ---------------------------------------------------------------------------
+
+class ParticipantBulkInviteView(APIView):
+    """
+    POST /api/meetings/{meeting_id}/participants/bulk/
+
+    Manual APIView -- invites many addresses at once: one conflict
+    query for the whole list, one bulk insert and one batch of
+    invitation emails.  Addresses with conflicts are reported and
+    skipped rather than failing the whole request.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=ParticipantBulkInviteSerializer,
+        responses={201: None},
+        description="Invite many participants to a meeting at once.",
+    )
+    def post(self, request, meeting_id):
+        meeting = get_object_or_404(Meeting, pk=meeting_id)
+        if not is_meeting_owner(request.user, meeting):
+            raise PermissionDenied(
+                "Only the organiser can add participants."
+            )
+
+        serializer = ParticipantBulkInviteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        emails = serializer.validated_data["emails"]
+
+        (conflicts,) = check_batch_conflicts(
+            [
+                {
+                    "emails": emails,
+                    "start_time": meeting.start_time,
+                    "end_time": meeting.end_time,
+                }
+            ],
+            exclude_meeting_ids=[meeting.id],
+        )
+        invitable = [e for e in emails if e not in conflicts]
+        added = bulk_add_participants(meeting, invitable)
+        added_emails = {p.email for p in added}
+
+        return Response(
+            {
+                "added": [p.email for p in added],
+                "already_invited": [
+                    e for e in invitable if e not in added_emails
+                ],
+                "conflicts": conflicts,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
 # ---------------------------------------------------------------------------
 
 class ParticipantDeleteView(generics.DestroyAPIView):
@@ -458,12 +1157,119 @@ class ParticipantStatusView(APIView):
             participant.status = new_status
             participant.responded_at = timezone.now()
             participant.save(
-                update_fields=["status", "responded_at"]
+                update_fields=["status", "responded_at", "updated_at"]
             )
 
         return Response(ParticipantSerializer(participant).data)
 
 
+# ---------------------------------------------------------------------------
+
+class ParticipantBulkStatusView(APIView):
+    """
+    PATCH /api/meetings/participants/bulk-status/
+
+    Manual APIView -- applies many RSVP changes, possibly across
+    meetings.  Permissions for the whole set are resolved in one query
+    (same rule as ParticipantStatusView: your own participation, or
+    any participant of a meeting you organise) and the permitted rows
+    are updated with a single statement.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=ParticipantBulkStatusSerializer,
+        responses={200: None},
+        description="Update many participation statuses at once.",
+    )
+    def patch(self, request):
+        serializer = ParticipantBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # Later entries for the same participant win.
+        requested = {
+            item["id"]: item["status"]
+            for item in serializer.validated_data["updates"]
+        }
+        permitted = set(
+            Participant.objects.filter(pk__in=requested)
+            .filter(
+                Q(user=request.user)
+                | Q(meeting__created_by=request.user)
+            )
+            .values_list("pk", flat=True)
+        )
+
+        bulk_update_participant_status(
+            {pk: requested[pk] for pk in permitted}
+        )
+        # Unknown ids are reported as forbidden too, so the response
+        # does not reveal which participants exist.
+        return Response(
+            {
+                "updated": sorted(permitted),
+                "forbidden": sorted(set(requested) - permitted),
+            }
+        )
+
+
+# ===========================================================================
+# Resource views
+# ===========================================================================
+
+class ResourceListCreateView(generics.ListCreateAPIView):
+    """
+    GET  /api/resources/   List active rooms and equipment.
+    POST /api/resources/   Add a resource (needs meetings.add_resource).
+    """
+
+    permission_classes = [IsAuthenticated, CanManageResources]
+    serializer_class = ResourceSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        resources = Resource.objects.filter(is_active=True)
+        kind = self.request.query_params.get("kind")
+        if kind:
+            resources = resources.filter(kind=kind)
+        return resources
+
+
+# ---------------------------------------------------------------------------
+
+class ResourceAvailabilityView(APIView):
+    """
+    GET /api/resources/available/?start_time=&end_time=&min_capacity=&kind=
+
+    Resources free for the whole slot with at least ``min_capacity``,
+    smallest first -- answered with a single query, see
+    ``get_available_resources``.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        parameters=[ResourceAvailabilityQuerySerializer],
+        responses={200: ResourceSerializer(many=True)},
+        description="Rooms and equipment free for a time slot.",
+    )
+    def get(self, request):
+        params = ResourceAvailabilityQuerySerializer(
+            data=request.query_params
+        )
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        resources = get_available_resources(
+            data["start_time"],
+            data["end_time"],
+            min_capacity=data["min_capacity"],
+            kind=data.get("kind"),
+        )
+        return Response(ResourceSerializer(resources, many=True).data)
+
+
 # ===========================================================================
 # Notification views
 # ===========================================================================
@@ -477,6 +1283,7 @@ class MeetingNotificationListView(generics.ListAPIView):
     """
 
     permission_classes = [IsAuthenticated]
+    pagination_class = NotificationCursorPagination
     serializer_class = MeetingNotificationSerializer
 
     def get_queryset(self):